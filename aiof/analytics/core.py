@@ -1,17 +1,18 @@
-import statistics as st
+import datetime
+import math
+import numpy as np
 import pandas as pd
-import numpy_financial as npf
 from pandas.core.frame import DataFrame
 
 import aiof.config as config
 import aiof.helpers as helpers
-import aiof.fi.core as fi
-import aiof.car.core as car
+import aiof.analytics.life_events as life_events
 
 from aiof.data.analytics import Analytics, AssetsLiabilities
 from aiof.data.asset import Asset, AssetFv
 from aiof.data.liability import Liability
-from aiof.data.life_event import LifeEventRequest, LifeEventResponse
+from aiof.data.life_event import LifeEvent, LifeEventRequest, LifeEventResponse, LifeEventTimelineRequest
+from aiof.schedule import Schedule
 
 from typing import List
 
@@ -27,7 +28,62 @@ _average_market_interest = _settings.DefaultInterest
 _years = _settings.DefaultShortYears
 _acceptable_liability_types = _settings.AnalyticsDebtToIncomeAcceptableLiabilityTypes
 _asset_type = _settings.AssetType
-_life_event_type = _settings.LifeEventType
+_timeline_max_years = _settings.LifeEventTimelineMaxYears
+_projection_frequencies = [
+    "yearly",
+    "half-year",
+    "quarterly",
+    "monthly"
+]
+
+
+def _assets_arrays(assets: List[Asset]) -> dict:
+    """
+    Values and types of the assets as arrays, collected in a single pass
+    """
+    values = []
+    types = []
+    for asset in assets:
+        values.append(asset.value)
+        types.append(asset.typeName)
+    return {
+        "values": np.array(values, dtype=float),
+        "types": np.array(types, dtype=object),
+    }
+
+
+def _liabilities_arrays(liabilities: List[Liability]) -> dict:
+    """
+    Values, types and debt to income inputs of the liabilities as arrays, collected in a single pass.
+    A missing `monthlyPayment` or `years` is `nan`
+    """
+    values = []
+    types = []
+    monthly_payments = []
+    years = []
+    for liability in liabilities:
+        values.append(liability.value)
+        types.append(liability.typeName)
+        monthly_payments.append(liability.monthlyPayment if liability.monthlyPayment is not None else np.nan)
+        years.append(liability.years if liability.years is not None else np.nan)
+    return {
+        "values": np.array(values, dtype=float),
+        "types": np.array(types, dtype=object),
+        "monthlyPayments": np.array(monthly_payments, dtype=float),
+        "years": np.array(years, dtype=float),
+    }
+
+
+def _type_totals(
+    types: np.ndarray,
+    values: np.ndarray) -> dict:
+    """
+    Sum of the values of each lower case type
+    """
+    if len(types) == 0:
+        return {}
+    lower_types, inverse = np.unique(np.char.lower(types.astype(str)), return_inverse=True)
+    return dict(zip(lower_types.tolist(), np.bincount(inverse, weights=values).tolist()))
 
 
 def analyze(
@@ -40,26 +96,29 @@ def analyze(
     ----------
     `assets` : List[Asset]\n
     `liabilities` : List[Liability]
+
+    Notes
+    ----------
+    Each list is walked once into arrays, that the totals, means, sums by type, debt to income ratio and assets'
+    future values are all computed from, so portfolios with tens of thousands of assets and liabilities are fine
     """
-    assets_values = list(map(lambda x: x.value, assets))
-    liabilities_values = list(map(lambda x: x.value, liabilities))
+    if len(assets) == 0 or len(liabilities) == 0:
+        raise ValueError("Assets and liabilities cannot be empty")
 
-    assets_value_total = sum(assets_values)
-    assets_value_mean = st.mean(assets_values)
+    assets_arrays = _assets_arrays(assets)
+    liabilities_arrays = _liabilities_arrays(liabilities)
 
-    liabilities_value_total = sum(liabilities_values)
-    liabilities_value_mean = st.mean(liabilities_values)
+    assets_value_total = math.fsum(assets_arrays["values"].tolist())
+    assets_value_mean = assets_value_total / len(assets)
+
+    liabilities_value_total = math.fsum(liabilities_arrays["values"].tolist())
+    liabilities_value_mean = liabilities_value_total / len(liabilities)
 
     diff = assets_value_total - liabilities_value_total
 
     analytics = Analytics()
-    acceptable_assets = ["cash"]
-    acceptable_liabilitites = ["credit card"]
-
-    cash_assets = list(map(lambda x: x.value, filter(lambda x: x.typeName.lower() in acceptable_assets, assets)))
-    total_cash_assets = sum(cash_assets)
-    cc_liabilities = list(map(lambda x: x.value, filter(lambda x: x.typeName.lower() in acceptable_liabilitites, liabilities)))
-    total_cc_liabilities = sum(cc_liabilities)
+    total_cash_assets = _type_totals(assets_arrays["types"], assets_arrays["values"]).get("cash", 0)
+    total_cc_liabilities = _type_totals(liabilities_arrays["types"], liabilities_arrays["values"]).get("credit card", 0)
 
     # Calculate cashToCcRatio or ccToCashRatio
     if (total_cash_assets > 0 and total_cc_liabilities == 0):
@@ -73,14 +132,14 @@ def analyze(
     analytics.diff = round(diff, _round_dig)
 
     # If the asset is cash, then assume it's sitting in a bank account with an average interest
-    analytics.assetsFv = assets_fv(assets=assets)
+    analytics.assetsFv = _assets_fv(assets_arrays)
 
     # Debt to income ration calculation
-    analytics.debtToIncomeRatio = debt_to_income_ratio_calc(income=150000, liabilities=liabilities)
+    analytics.debtToIncomeRatio = _debt_to_income_ratio(income=150000, liabilities_arrays=liabilities_arrays)
 
     return AssetsLiabilities(
-        assets=assets_values,
-        liabilities=liabilities_values,
+        assets=assets_arrays["values"].tolist(),
+        liabilities=liabilities_arrays["values"].tolist(),
         assetsTotal=round(assets_value_total, _round_dig),
         assetsMean=round(assets_value_mean, _round_dig),
         liabilitiesTotal=round(liabilities_value_total, _round_dig),
@@ -99,21 +158,33 @@ def assets_fv(
     `assets` : List[Asset]. 
         list of assets to calculate their future value
     """
+    return _assets_fv(_assets_arrays(assets))
+
+
+def _assets_fv(assets_arrays: dict) -> List[AssetFv]:
+    """
+    Future value of every asset in each of the default years, compounded monthly, as one `years x assets` grid
+    """
+    values = assets_arrays["values"]
+    types = assets_arrays["types"]
+    interests = np.where(types == "cash", _average_bank_interest, np.where(types == "stock", _average_market_interest, 0.0))
+    years = np.array(_years)
+
+    fvs = values * (1 + (interests / 100) / 12) ** (years[:, None] * 12)
+
+    # The fields are already typed, so they are not validated again for each of the years x assets
     asset_fvs = []
-    for year in _years:
-        for asset in assets:
-            interest = 0.0
-            if (asset.typeName == "cash"):
-                interest = _average_bank_interest
-            elif (asset.typeName == "stock"):
-                interest = _average_market_interest
-            fv_asset = helpers.fv(interest=interest, years=year, pmt=0, pv=asset.value)
+    types = types.tolist()
+    interests = interests.tolist()
+    values = values.tolist()
+    for year, year_fvs in zip(_years, fvs.tolist()):
+        for type_name, interest, pv, fv_asset in zip(types, interests, values, year_fvs):
             asset_fvs.append(
-                AssetFv(
+                AssetFv.construct(
                     year=year,
-                    typeName=asset.typeName,
+                    typeName=type_name,
                     interest=interest,
-                    pv=asset.value,
+                    pv=pv,
                     fv=round(fv_asset, _round_dig)
                 )
             )
@@ -133,24 +204,32 @@ def debt_to_income_ratio_calc(
     `liabilities` : List[Liability].
         list of liabilities that will be used to calculate debt to income ratio\n
     """
-    filtered_liabilities = [x for x in liabilities if x.typeName.lower() in _acceptable_liability_types and x.monthlyPayment is not None]
+    return _debt_to_income_ratio(income, _liabilities_arrays(liabilities))
+
 
-    if len(filtered_liabilities) == 0:
+def _debt_to_income_ratio(
+    income: float,
+    liabilities_arrays: dict) -> float:
+    """
+    Debt to income ratio of the acceptable liability types that have a monthly payment.
+    A monthly payment of 0 with `years` is taken as paying the value off evenly over them
+    """
+    monthly_payments = liabilities_arrays["monthlyPayments"]
+    years = liabilities_arrays["years"]
+    acceptable = np.isin(np.char.lower(liabilities_arrays["types"].astype(str)), _acceptable_liability_types) & ~np.isnan(monthly_payments)
+
+    if not acceptable.any():
         return 0.0
-    
-    total_liabilities_payments = 0.0
-    for liability in filtered_liabilities:
-        liability_monthly_payment = 0
 
-        # Check if there are cases where .monthlyPayment is 0 and .years is there
-        # then calculate the monthly payment
-        if liability.years is not None and liability.years > 0 and liability.monthlyPayment == 0:
-            liability_monthly_payment = (liability.value / liability.years) / 12
-        else:
-            liability_monthly_payment = liability.monthlyPayment
-        total_liabilities_payments += liability_monthly_payment
+    # Check if there are cases where .monthlyPayment is 0 and .years is there
+    # then calculate the monthly payment
+    paid_over_years = (years > 0) & (monthly_payments == 0)
+    payments = np.where(
+        paid_over_years,
+        np.divide(liabilities_arrays["values"], years, out=np.zeros_like(years), where=paid_over_years) / 12,
+        monthly_payments)
 
-    return debt_to_income_ratio_basic_calc(income, total_liabilities_payments)
+    return debt_to_income_ratio_basic_calc(income, float(payments[acceptable].sum()))
 
 
 def debt_to_income_ratio_basic_calc(
@@ -179,6 +258,142 @@ def life_event_types() -> List[str]:
     """
     return _settings.LifeEventTypes
 
+def _life_event_interest(asset_type: str) -> float:
+    """
+    Yearly interest, in %, an asset type grows at in life event projections
+    """
+    if asset_type in [_asset_type.CASH]:
+        return _settings.DefaultAverageBankInterest
+    elif asset_type in [_asset_type.STOCK, _asset_type.INVESTMENT]:
+        return _settings.DefaultInterest
+    return 0
+
+def life_event_projection(
+    asset_types: List[str],
+    years,
+    start_amounts,
+    monthly_contributions,
+    monthly_costs = None,
+    cash_flows: List[dict] = None,
+    frequency: str = "yearly") -> dict:
+    """
+    Project many asset types over the years at once
+
+    Parameters
+    ----------
+    `asset_types`: List[str].
+        the types of the assets. some examples are `cash`, `investment`, `stock`, etc.\n
+    `years`: int or array.
+        the number of periods of `frequency` to project, or the 1-based periods to project\n
+    `start_amounts`: list or array.
+        the start amount of each asset type\n
+    `monthly_contributions`: list or array.
+        the monthly contribution to each asset type\n
+    `monthly_costs`: list or array or None.
+        the monthly cost taken out of each asset type. defaults to `0`\n
+    `cash_flows`: List[dict] or None.
+        extra cash flows into (positive) or out of (negative) an asset type, each with its `assetType`, a one-off `amount`,
+        a `monthly` amount paid for `months` months (or until the end when `None`) and the `startMonth` both start at.
+        missing keys default to `0`. defaults to `None`\n
+    `frequency`: str.
+        length of a period, `yearly`, `half-year`, `quarterly` or `monthly`. defaults to `yearly`
+
+    Returns
+    ----------
+    `dict` of `numpy.ndarray` of `(asset_types, periods)` with the `value` without contributions, the `contribution`
+    of each period, the `valueWithContributions` and the net `cashFlow` of each period
+
+    Notes
+    ----------
+    Growing monthly at `r` for `12 * k` months, with a monthly payment `pmt`, gives `P * g + pmt * (g - 1) / r`
+    where `g = (1 + r)^(12 * k)`, so every asset type and year is computed directly. A cash flow that has been paid for
+    `n` months and then grown for `t` more adds `pmt * ((1 + r)^n - 1) / r * (1 + r)^t`, so all of them are added in one pass
+    """
+    if frequency not in _projection_frequencies:
+        raise ValueError("Frequency must be one of the following: " + ", ".join(_projection_frequencies))
+
+    months_per_period = 12 // _settings.Frequencies[frequency]
+    years = np.arange(1, years + 1) if np.ndim(years) == 0 else np.asarray(years)
+    start_amounts = np.asarray(start_amounts, dtype=float)[:, np.newaxis]
+    monthly_contributions = np.asarray(monthly_contributions, dtype=float)[:, np.newaxis]
+    monthly_costs = np.asarray(monthly_costs if monthly_costs is not None else np.zeros(len(asset_types)), dtype=float)[:, np.newaxis]
+    rates = np.array([_life_event_interest(t) for t in asset_types], dtype=float)[:, np.newaxis] / 100 / 12
+
+    months = months_per_period * years[np.newaxis, :]
+    growth = (1 + rates) ** months
+    with np.errstate(divide="ignore", invalid="ignore"):
+        annuity = np.where(rates == 0, months, (growth - 1) / np.where(rates == 0, 1, rates))
+
+    flows = np.zeros(growth.shape)
+    cash_flow = np.zeros(growth.shape) - monthly_costs * months_per_period
+    if cash_flows:
+        index = { t: i for i, t in enumerate(asset_types) }
+        if any(f["assetType"] not in index for f in cash_flows):
+            raise ValueError("Cash flows must be into one of the following {0}".format(", ".join(asset_types)))
+        assets = np.array([index[f["assetType"]] for f in cash_flows])
+        amounts = np.array([f.get("amount") or 0 for f in cash_flows], dtype=float)[:, np.newaxis]
+        monthly = np.array([f.get("monthly") or 0 for f in cash_flows], dtype=float)[:, np.newaxis]
+        durations = np.array([f["months"] if f.get("months") is not None else np.inf for f in cash_flows], dtype=float)[:, np.newaxis]
+        starts = np.array([f.get("startMonth") or 0 for f in cash_flows], dtype=float)[:, np.newaxis]
+        flow_rates = rates[assets]
+
+        elapsed = np.maximum(months - starts, 0)
+        paid = np.minimum(elapsed, durations)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            paid_annuity = np.where(flow_rates == 0, paid, ((1 + flow_rates) ** paid - 1) / np.where(flow_rates == 0, 1, flow_rates))
+        values = np.where(months >= starts, amounts * (1 + flow_rates) ** elapsed, 0) \
+            + monthly * paid_annuity * (1 + flow_rates) ** (elapsed - paid)
+        np.add.at(flows, assets, values)
+
+        # What each flow pays in during every period, with one-off amounts paid at the start of their period
+        paid_before = np.minimum(np.maximum(months - months_per_period - starts, 0), durations)
+        started = (starts >= months - months_per_period) & (starts < months)
+        np.add.at(cash_flow, assets, np.where(started, amounts, 0) + monthly * (paid - paid_before))
+
+    return {
+        "value": start_amounts * growth - monthly_costs * annuity + flows,
+        "contribution": np.broadcast_to(monthly_contributions * months_per_period, growth.shape),
+        "valueWithContributions": start_amounts * growth + (monthly_contributions - monthly_costs) * annuity + flows,
+        "cashFlow": cash_flow,
+    }
+
+def life_event_projection_df(
+    asset_types: List[str],
+    years: int,
+    start_amounts,
+    monthly_contributions,
+    monthly_costs = None,
+    cash_flows: List[dict] = None) -> pd.DataFrame:
+    """
+    `life_event_projection` as a `pandas.DataFrame` with a `year` column followed by `{asset_type}`,
+    `{asset_type}Contribution` and `{asset_type}WithContributions` for each asset type, built with one column stack.
+    Asset types whose projection isn't finite are left out
+    """
+    years_list = np.arange(1, years + 1)
+    projection = life_event_projection(asset_types, years_list, start_amounts, monthly_contributions, monthly_costs, cash_flows)
+    blocks = np.stack([projection["value"], projection["contribution"], projection["valueWithContributions"]], axis=1)
+    keep = np.isfinite(blocks).all(axis=(1, 2))
+
+    columns = [name for t, k in zip(asset_types, keep) if k for name in [f"{t}", f"{t}Contribution", f"{t}WithContributions"]]
+    df = pd.DataFrame(blocks[keep].reshape(-1, len(years_list)).T, columns=columns)
+    df.insert(0, "year", years_list)
+    return df
+
+def _life_event_table(
+    asset_type: str,
+    years,
+    start_amount: float,
+    monthly_contribution: float,
+    monthly_cost: float = None) -> pd.DataFrame:
+    projection = life_event_projection(
+        [asset_type], years, [start_amount], [monthly_contribution], [monthly_cost if monthly_cost is not None else 0])
+    return pd.DataFrame({
+        "year": years,
+        f"{asset_type}": projection["value"][0],
+        f"{asset_type}Contribution": projection["contribution"][0],
+        f"{asset_type}WithContributions": projection["valueWithContributions"][0],
+    }, index=years)
+
 def life_event_df_f(
     asset_type: str,
     years: int,
@@ -205,49 +420,88 @@ def life_event_df_f(
     ----------
     `pandas.DataFrame`
     """
-    years_list = list(range(1, years + 1))
-    interest = 0
-    if asset_type in [_asset_type.CASH]:
-        interest = _settings.DefaultAverageBankInterest
-    elif asset_type in [_asset_type.STOCK, _asset_type.INVESTMENT]:
-        interest = _settings.DefaultInterest
-
-    yearly_contribution = monthly_contribution * 12
-    df = pd.DataFrame(index=years_list, columns=["year", f"{asset_type}", f"{asset_type}Contribution", f"{asset_type}WithContributions"], dtype="float")
-    df["year"] = years_list
-    df.iloc[0, 1] = -npf.fv(
-        rate=(interest / 100) / 12,
-        nper=12,
-        pmt=-monthly_cost if monthly_cost is not None else 0,
-        pv=start_amount,
-        when="end")
-    df.iloc[0, 2] = yearly_contribution
-    df.iloc[0, 3] = -npf.fv(
-        rate=(interest / 100) / 12,
-        nper=12,
-        pmt=monthly_contribution - monthly_cost if monthly_cost is not None else monthly_contribution,
-        pv=start_amount,
-        when="end")
-
-    for i in range(1, years):
-        df.iloc[i, 1] = -npf.fv(
-            rate=(interest / 100) / 12,
-            nper=12,
-            pmt=-monthly_cost if monthly_cost is not None else 0,
-            pv=df.iloc[i - 1, 1],
-            when="end")
-        df.iloc[i, 2] = yearly_contribution
-        df.iloc[i, 3] = -npf.fv(
-            rate=(interest / 100) / 12,
-            nper=12,
-            pmt=monthly_contribution - monthly_cost if monthly_cost is not None else monthly_contribution,
-            pv=df.iloc[i - 1, 3],
-            when="end")
-    return df
+    return _life_event_table(asset_type, np.arange(1, years + 1), start_amount, monthly_contribution, monthly_cost)
+
+def life_event_schedule(
+    asset_type: str,
+    years: int,
+    start_amount: float,
+    monthly_contribution: float,
+    monthly_cost: float = None) -> Schedule:
+    """
+    The `life_event_df_f` table as a lazy `aiof.schedule.Schedule`, whose years are only computed when they are consumed.
+    See `life_event_df_f` for the parameters
+    """
+    return Schedule(
+        lambda periods: _life_event_table(asset_type, periods, start_amount, monthly_contribution, monthly_cost),
+        years)
+
+def _life_event_totals(assets: List[Asset]) -> list:
+    """
+    Total value of the `cash`, `investment` and `stock` assets
+    """
+    assets_df = helpers.assets_to_df(assets)
+    return [assets_df.loc[assets_df["typeName"] == t]["value"].sum() for t in [_asset_type.CASH, _asset_type.INVESTMENT, _asset_type.STOCK]]
+
+def _life_event_contributions(req) -> list:
+    """
+    Monthly contributions to `cash`, `investment` and `stock`
+    """
+    return [
+        req.monthlyCashContribution if req.monthlyCashContribution is not None else 1000,
+        req.monthlyInvestmentContribution if req.monthlyInvestmentContribution is not None else 500,
+        req.monthlyStockContribution if req.monthlyStockContribution is not None else 500]
+
+def life_event_cash_flows(
+    events: List[LifeEvent],
+    req,
+    start_date: datetime.datetime = None) -> tuple:
+    """
+    Run every event's handler, see `aiof.analytics.life_events`, and move its cash flows to the month it is planned for.
+    An event cannot be planned more than `Settings.LifeEventTimelineMaxYears` after `start_date`, nor last longer than that
+
+    Parameters
+    ----------
+    `events`: List[LifeEvent].
+        the life events. events without a `plannedDate` start at `start_date`\n
+    `req`: LifeEventRequest or LifeEventTimelineRequest.
+        the request the events are part of\n
+    `start_date`: datetime or None.
+        the date the projection starts at. only its year and month are used. `None` ignores the `plannedDate`s,
+        so every event starts right away
+
+    Returns
+    ----------
+    `tuple` of the number of months needed to project every event, all of their cash flows and each event's
+    `type`, `plannedDate`, `startMonth` and `years`
+    """
+    months = 0
+    cash_flows = []
+    summaries = []
+    for event in events:
+        start_month = 0
+        if event.plannedDate is not None and start_date is not None:
+            start_month = (event.plannedDate.year - start_date.year) * 12 + event.plannedDate.month - start_date.month
+            if start_month < 0:
+                raise ValueError("Planned date cannot be before the start date")
+            elif start_month > _timeline_max_years * 12:
+                raise ValueError(f"Planned date cannot be more than {_timeline_max_years} years after the start date")
+
+        impact = life_events.get_handler(event.type)(event, req)
+        cash_flows += [dict(flow, startMonth=(flow.get("startMonth") or 0) + start_month) for flow in impact["cashFlows"]]
+        months = max(months, start_month + impact["years"] * 12)
+        summaries.append({
+            "type": event.type,
+            "plannedDate": event.plannedDate,
+            "startMonth": start_month,
+            "years": impact["years"],
+        })
+    return months, cash_flows, summaries
 
 def life_event(
     req: LifeEventRequest,
-    as_json: bool = False) -> LifeEventResponse:
+    as_json: bool = False,
+    as_columns: bool = False) -> LifeEventResponse:
     """
     See how a life event impacts you
 
@@ -256,133 +510,97 @@ def life_event(
     `req`: LifeEventRequest. 
         the life event request\n
     `as_json`: bool.
-        whether to return the response as JSON. defaults to `False`
+        whether to return the response as JSON. defaults to `False`\n
+    `as_columns`: bool.
+        whether JSON is returned as columns, `{ column: [values] }`, instead of records. defaults to `False`
 
     Notes
     ----------
     There are a few assumption when it comes to your Assets. If they are of type `cash` then they are sitting in a bank with
-    national average interest. If they are of type `stock` then they are invested in the market and the default market interest is used
+    national average interest. If they are of type `stock` then they are invested in the market and the default market interest is used.
+    Every event starts right away, so the result does not depend on the current date. `plannedDate` is only applied by
+    `life_event_timeline`, which has an explicit `startDate`. The events are projected for at most `Settings.LifeEventTimelineMaxYears`
     """
     data = LifeEventResponse(
         assets = req.assets,
         liabilities = req.liabilities)
 
-    assets_df = helpers.assets_to_df(req.assets)
-    
-    total_cash = assets_df.loc[assets_df["typeName"] == _asset_type.CASH]["value"].sum()
-    total_stock = assets_df.loc[assets_df["typeName"] == _asset_type.STOCK]["value"].sum()
-    total_investment = assets_df.loc[assets_df["typeName"] == _asset_type.INVESTMENT]["value"].sum()
-
-    # Having a child
-    if req.type.lower() == _life_event_type.HAVING_A_CHILD:
-        # For each year you are raising a child, then your assets will change
-        # For `cash` : take out cost of child, grow at bank interest rate
-        # For `stock` : grow at default market rate
-        # For `investment` : grow at default market rate
-        child_year_to_be_raised_to = 18
-        cost = fi.cost_of_raising_children(
-            annual_expenses_start=10000,
-            annual_expenses_increment=2000,
-            children=[1],
-            interests=[2],
-            years=child_year_to_be_raised_to)
-
-        cost_of_child = cost[0]
-        monthly_cost = cost_of_child["cost"][0]["value"] / (cost_of_child["years"] * 12)
-        years = list(range(1, cost_of_child["years"] + 1))
-
-        life_event_df = pd.DataFrame(index=years, columns=["year"])
-        life_event_df["year"] = years
-
-        # Cash
-        cash_df = life_event_df_f(
-            asset_type              = _asset_type.CASH,
-            years                   = child_year_to_be_raised_to,
-            start_amount            = total_cash,
-            monthly_contribution    = req.monthlyCashContribution if req.monthlyCashContribution is not None else 1000,
-            monthly_cost            = monthly_cost)
-
-        # Stock
-        stock_df = life_event_df_f(
-            asset_type              = _asset_type.STOCK,
-            years                   = child_year_to_be_raised_to,
-            start_amount            = total_stock,
-            monthly_contribution    = req.monthlyStockContribution if req.monthlyStockContribution is not None else 500)
-
-        # Investment
-        investment_df = life_event_df_f(
-            asset_type              = _asset_type.INVESTMENT,
-            years                   = child_year_to_be_raised_to,
-            start_amount            = total_investment,
-            monthly_contribution    = req.monthlyInvestmentContribution if req.monthlyInvestmentContribution is not None else 500)
-
-        if not cash_df.empty and not cash_df.isnull().values.any():
-            life_event_df = pd.merge(life_event_df, cash_df, on="year", how="outer")
-        if not investment_df.empty and not investment_df.isnull().values.any():
-            life_event_df = pd.merge(life_event_df, investment_df, on="year", how="outer")
-        if not stock_df.empty and not stock_df.isnull().values.any():
-            life_event_df = pd.merge(life_event_df, stock_df, on="year", how="outer")
-
-        life_event_df = life_event_df.round(_round_dig)
-        data.event = life_event_df if not as_json else life_event_df.to_dict(orient="records")
-
-    # Buying a car
-    elif req.type.lower() == _life_event_type.BUYING_A_CAR:
-        # For the years of the car loan, calculate the car payments
-        # For the years of the car loan, the car will depreciate
-        req.carLoanAmount = req.carLoanAmount if req.carLoanAmount is not None else 35000
-        req.carDownPayment = req.carDownPayment if req.carDownPayment is not None else 0
-        req.carInterest = req.carInterest if req.carInterest is not None else 6
-        req.carYears = req.carYears if req.carYears is not None else 5
-
-        car_loan = car.loan_calc(
-            car_loan = req.carLoanAmount - req.carDownPayment,
-            interest = req.carInterest,
-            years = req.carYears)
-
-        car_depreciation_df = car.value_depreciation_calc(
-            initial_value = req.carLoanAmount - req.carDownPayment,
-            years = req.carYears)
-
-        years_list = list(range(1, req.carYears + 1))
-
-        life_event_df = pd.DataFrame(index=years_list, columns=["year"], dtype="float")
-        life_event_df["year"] = years_list
-
-        # Cash
-        cash_df = life_event_df_f(
-            asset_type              = _asset_type.CASH,
-            years                   = req.carYears,
-            start_amount            = total_cash,
-            monthly_contribution    = req.monthlyCashContribution if req.monthlyCashContribution is not None else 1000,
-            monthly_cost            = car_loan.monthlyPayment)
-        
-        # Stock
-        stock_df = life_event_df_f(
-            asset_type              = _asset_type.STOCK,
-            years                   = req.carYears,
-            start_amount            = total_stock,
-            monthly_contribution    = req.monthlyStockContribution if req.monthlyStockContribution is not None else 500) if total_stock > 0 else pd.DataFrame()
-
-        # Investment
-        investment_df = life_event_df_f(
-            asset_type              = _asset_type.INVESTMENT,
-            years                   = req.carYears,
-            start_amount            = total_investment,
-            monthly_contribution    = req.monthlyInvestmentContribution if req.monthlyInvestmentContribution is not None else 500)
-
-
-        if not cash_df.empty and  not cash_df.isnull().values.any():
-            life_event_df = pd.merge(life_event_df, cash_df, on="year", how="outer")
-        if not investment_df.empty and  not investment_df.isnull().values.any():
-            life_event_df = pd.merge(life_event_df, investment_df, on="year", how="outer")
-        if not stock_df.empty and not stock_df.isnull().values.any():
-            life_event_df = pd.merge(life_event_df, stock_df, on="year", how="outer")
-
-        life_event_df = life_event_df.round(_round_dig)
-        data.event = life_event_df if not as_json else life_event_df.to_dict(orient="records")
-
-    elif req.type.lower() == _life_event_type.SELLING_A_CAR:
-        print(_life_event_type.SELLING_A_CAR)
-
-    return data
\ No newline at end of file
+    # Every event adds its cash flows and all of them are projected together
+    # For `cash` : grow at bank interest rate, with the events' costs taken out
+    # For `stock` : grow at default market rate
+    # For `investment` : grow at default market rate
+    months, cash_flows, _ = life_event_cash_flows([req] + list(req.events or []), req)
+    if months <= 0 or months > _timeline_max_years * 12:
+        raise ValueError(f"Years must be between 1 and {_timeline_max_years}")
+
+    life_event_df = life_event_projection_df(
+        asset_types             = [_asset_type.CASH, _asset_type.INVESTMENT, _asset_type.STOCK],
+        years                   = math.ceil(months / 12),
+        start_amounts           = _life_event_totals(req.assets),
+        monthly_contributions   = _life_event_contributions(req),
+        cash_flows              = cash_flows)
+
+    life_event_df = life_event_df.round(_round_dig)
+    data.event = life_event_df if not as_json else helpers.df_to_json(life_event_df, as_columns)
+
+    return data
+
+def life_event_timeline(
+    req: LifeEventTimelineRequest,
+    as_json: bool = False,
+    as_columns: bool = False) -> dict:
+    """
+    Simulate many dated life events together, month by month
+
+    Parameters
+    ----------
+    `req`: LifeEventTimelineRequest.
+        the assets, liabilities and the dated life events. events without a `plannedDate` start at `startDate`\n
+    `as_json`: bool.
+        whether to return the response as JSON. defaults to `False`\n
+    `as_columns`: bool.
+        whether JSON is returned as columns, `{ column: [values] }`, instead of records. defaults to `False`
+
+    Returns
+    ----------
+    `dict` with the `startDate`, the number of `months`, each of the `events` and the monthly `timeline` of every asset type's
+    value, contribution, value with contributions and the net cash flow of the events
+
+    Notes
+    ----------
+    The events' cash flows are added on one monthly grid that starts at `startDate`'s month, and every asset type is
+    projected in one pass, see `life_event_projection`. The timeline runs for `years`, or until the last event ends
+    """
+    start_date = req.startDate if req.startDate is not None else datetime.datetime.utcnow()
+    if len(req.events) == 0:
+        raise ValueError("Events cannot be empty")
+
+    months, cash_flows, events = life_event_cash_flows(req.events, req, start_date)
+    months = req.years * 12 if req.years is not None else months
+    if months <= 0 or months > _timeline_max_years * 12:
+        raise ValueError(f"Years must be between 1 and {_timeline_max_years}")
+
+    asset_types = [_asset_type.CASH, _asset_type.INVESTMENT, _asset_type.STOCK]
+    months_list = np.arange(1, months + 1)
+    projection = life_event_projection(
+        asset_types             = asset_types,
+        years                   = months_list,
+        start_amounts           = _life_event_totals(req.assets),
+        monthly_contributions   = _life_event_contributions(req),
+        cash_flows              = cash_flows,
+        frequency               = "monthly")
+
+    first_month = np.datetime64(f"{start_date.year:04d}-{start_date.month:02d}", "M")
+    blocks = np.stack([projection["value"], projection["contribution"], projection["valueWithContributions"], projection["cashFlow"]], axis=1)
+    columns = [name for t in asset_types for name in [f"{t}", f"{t}Contribution", f"{t}WithContributions", f"{t}CashFlow"]]
+    timeline_df = pd.DataFrame(blocks.reshape(-1, months).T, columns=columns)
+    timeline_df.insert(0, "month", months_list)
+    timeline_df.insert(1, "date", (first_month + months_list - 1).astype("datetime64[ns]"))
+    timeline_df = timeline_df.round(_round_dig)
+
+    return {
+        "startDate": datetime.datetime(start_date.year, start_date.month, 1),
+        "months": int(months),
+        "events": events,
+        "timeline": timeline_df if not as_json else helpers.df_to_json(timeline_df, as_columns),
+    }
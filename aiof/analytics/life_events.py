@@ -0,0 +1,173 @@
+import aiof.config as config
+import aiof.helpers as helpers
+import aiof.fi.core as fi
+import aiof.car.core as car
+
+from aiof.data.life_event import LifeEvent, LifeEventRequest
+
+from typing import Callable
+
+
+"""
+Registry of life event handlers. A handler turns a life event into the cash flows it adds to each asset type, which are
+all projected together by `aiof.analytics.core.life_event_projection`
+"""
+# Configs
+_settings = config.get_settings()
+_asset_type = _settings.AssetType
+_life_event_type = _settings.LifeEventType
+_max_years = int(_settings.LifeEventTimelineMaxYears)
+_car_liability_types = [t for t in _settings.LiabilityTypes if t.startswith("auto ")]
+
+_handlers = {}
+
+
+def _check_years(years: int, name: str = "Years"):
+    """
+    Handlers check the years an event lasts for before computing anything
+
+    Raises
+    ----------
+    `ValueError` if `years` is not between 1 and `Settings.LifeEventTimelineMaxYears`
+    """
+    if years <= 0 or years > _max_years:
+        raise ValueError(f"{name} must be between 1 and {_max_years}")
+
+
+def register(event_type: str) -> Callable:
+    """
+    Register the decorated function as the handler of `event_type`
+
+    Notes
+    ----------
+    A handler takes the `LifeEvent` and the whole `LifeEventRequest` and returns a `dict` with the `years` the event
+    needs to be projected for and its `cashFlows`, see `aiof.analytics.core.life_event_projection`
+    """
+    def decorator(fn: Callable) -> Callable:
+        _handlers[event_type.lower()] = fn
+        return fn
+    return decorator
+
+
+def get_handler(event_type: str) -> Callable:
+    """
+    Get the handler of `event_type`
+
+    Raises
+    ----------
+    `ValueError` if no handler is registered for `event_type`
+    """
+    handler = _handlers.get(event_type.lower())
+    if handler is None:
+        raise ValueError("Invalid type. Please use one of the following {0}".format(", ".join(_handlers)))
+    return handler
+
+
+@register(_life_event_type.HAVING_A_CHILD)
+def having_a_child(event: LifeEvent, req: LifeEventRequest) -> dict:
+    """
+    The cost of raising a child until 18 is taken out of cash every month
+    """
+    child_year_to_be_raised_to = 18
+    cost = fi.cost_of_raising_children(
+        annual_expenses_start=10000,
+        annual_expenses_increment=2000,
+        children=[1],
+        interests=[2],
+        years=child_year_to_be_raised_to)
+
+    cost_of_child = cost[0]
+    monthly_cost = cost_of_child["cost"][0]["value"] / (cost_of_child["years"] * 12)
+
+    return {
+        "years": child_year_to_be_raised_to,
+        "cashFlows": [
+            { "assetType": _asset_type.CASH, "monthly": -monthly_cost, "months": child_year_to_be_raised_to * 12 }
+        ]
+    }
+
+
+@register(_life_event_type.BUYING_A_CAR)
+def buying_a_car(event: LifeEvent, req: LifeEventRequest) -> dict:
+    """
+    The down payment is taken out of cash and so are the car loan payments, every month until the loan is paid off
+    """
+    car_loan_amount = event.carLoanAmount if event.carLoanAmount is not None else 35000
+    car_down_payment = event.carDownPayment if event.carDownPayment is not None else 0
+    car_interest = event.carInterest if event.carInterest is not None else 6
+    car_years = event.carYears if event.carYears is not None else 5
+
+    _check_years(car_years, "Car years")
+
+    car_loan = car.loan_calc(
+        car_loan = car_loan_amount - car_down_payment,
+        interest = car_interest,
+        years = car_years)
+
+    return {
+        "years": car_years,
+        "cashFlows": [
+            { "assetType": _asset_type.CASH, "amount": -car_down_payment },
+            { "assetType": _asset_type.CASH, "monthly": -car_loan.monthlyPayment, "months": car_years * 12 }
+        ]
+    }
+
+
+@register(_life_event_type.SELLING_A_CAR)
+def selling_a_car(event: LifeEvent, req: LifeEventRequest) -> dict:
+    """
+    The sale price, `amount` or the value of the `car` assets, goes into cash, and so do the auto loan and lease payments
+    that are no longer made
+    """
+    car_liabilities = [l for l in req.liabilities or [] if l.typeName.lower() in _car_liability_types]
+    sale_price = event.amount if event.amount is not None else sum(a.value for a in req.assets if a.typeName == _asset_type.CAR)
+    freed_payments = sum(l.monthlyPayment or 0 for l in car_liabilities)
+    freed_years = max([l.years for l in car_liabilities if l.years is not None], default=None)
+    years = event.carYears if event.carYears is not None else (freed_years if freed_years is not None else 5)
+
+    if freed_years is not None and (freed_years < 0 or freed_years > _max_years):
+        raise ValueError(f"Car liability years must be between 0 and {_max_years}")
+    _check_years(years, "Car years")
+
+    return {
+        "years": years,
+        "cashFlows": [
+            { "assetType": _asset_type.CASH, "amount": sale_price },
+            { "assetType": _asset_type.CASH, "monthly": freed_payments, "months": freed_years * 12 if freed_years is not None else None }
+        ]
+    }
+
+
+@register(_life_event_type.BUYING_A_HOUSE)
+def buying_a_house(event: LifeEvent, req: LifeEventRequest) -> dict:
+    """
+    The down payment, `houseDownPayment` or `amount`, is taken out of cash and so are the mortgage payments,
+    every month until the mortgage is paid off
+    """
+    house_value = event.houseValue if event.houseValue is not None else 300000
+    house_down_payment = event.houseDownPayment if event.houseDownPayment is not None else (event.amount if event.amount is not None else 60000)
+    house_interest = event.houseInterest if event.houseInterest is not None else 3.8
+    house_years = event.houseYears if event.houseYears is not None else 30
+
+    if house_value < 0:
+        raise ValueError("House value cannot be negative")
+    elif house_down_payment < 0:
+        raise ValueError("House down payment cannot be negative")
+    elif house_down_payment > house_value:
+        raise ValueError("House down payment cannot be bigger than the house value")
+    elif house_interest < 0 or house_interest > 100:
+        raise ValueError("House interest cannot be negative or bigger than 100%")
+    _check_years(house_years, "House years")
+
+    monthly_payment = helpers.loan_payments_calc(
+        loan_amount = house_value - house_down_payment,
+        number_of_years = house_years,
+        rate_of_interest = house_interest)
+
+    return {
+        "years": house_years,
+        "cashFlows": [
+            { "assetType": _asset_type.CASH, "amount": -house_down_payment },
+            { "assetType": _asset_type.CASH, "monthly": -float(monthly_payment), "months": house_years * 12 }
+        ]
+    }
@@ -0,0 +1,195 @@
+import collections
+import copy
+import functools
+import inspect
+import threading
+import time
+
+import aiof.config as config
+
+from typing import Any, Callable
+
+
+"""
+Bounded in-process caches
+"""
+# Configs
+_settings = config.get_settings()
+_memoize_max_entries = int(_settings.MemoizeMaxEntries)
+
+_memoized = {}
+
+
+class LRUCache:
+    """
+    Least recently used cache with an optional time to live and a size bound in bytes
+
+    Parameters
+    ----------
+    `max_bytes` : int or None.
+        evict the least recently used entries once the sizes of all values add up to more than this. `None` for no bound\n
+    `ttl` : float or None.
+        seconds an entry stays valid after it is set. `None` for no expiry\n
+    `max_entries` : int or None.
+        evict the least recently used entries once there are more than this. `None` for no bound\n
+    `sizeof` : Callable.
+        size of a value in bytes. defaults to `len`
+
+    Notes
+    ----------
+    Safe to share between threads
+    """
+    def __init__(
+        self,
+        max_bytes: int = None,
+        ttl: float = None,
+        max_entries: int = None,
+        sizeof: Callable[[Any], int] = len):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.sizeof = sizeof
+        self._entries = collections.OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        """
+        Get the value of `key`, or `default` when it is missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] is not None and entry[2] < time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key, value):
+        """
+        Set the value of `key`. Values bigger than `max_bytes` on their own are not stored
+        """
+        size = self.sizeof(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size, expires)
+            self._bytes += size
+            while ((self.max_bytes is not None and self._bytes > self.max_bytes)
+                or (self.max_entries is not None and len(self._entries) > self.max_entries)):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def clear(self):
+        """
+        Remove every entry and reset the stats
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> dict:
+        """
+        Hit/miss metrics and current size of the cache
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hitRate": round(self.hits / lookups, 4) if lookups > 0 else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "maxBytes": self.max_bytes,
+                "maxEntries": self.max_entries,
+                "ttl": self.ttl,
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def _remove(self, key):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+
+def _freeze(value):
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    elif isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    elif isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    elif hasattr(value, "tolist"):
+        return _freeze(value.tolist())
+    return value
+
+
+def memoize(max_entries: int = None):
+    """
+    Memoize a pure function in a bounded `LRUCache`, keyed by its arguments
+
+    Parameters
+    ----------
+    `max_entries` : int or None.
+        most results kept. defaults to `Settings.MemoizeMaxEntries`
+
+    Notes
+    ----------
+    Arguments are bound to the function's signature with their defaults, so `f(1)` and `f(x=1)` share an entry.
+    Lists, dicts and arrays are keyed by their contents, and calls with any other unhashable argument are not cached.
+    Every caller gets its own copy of the result, so a caller changing it does not change the cached one.
+    The wrapped function gets `cache` and `stats()`, and `memoized_stats()` has the stats of every memoized function
+    """
+    max_entries = max_entries if max_entries is not None else _memoize_max_entries
+
+    def decorator(fn: Callable) -> Callable:
+        signature = inspect.signature(fn)
+        cache = LRUCache(max_entries=max_entries, sizeof=lambda value: 0)
+        missing = object()
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = _freeze(bound.arguments)
+            try:
+                hash(key)
+            except TypeError:
+                return fn(*args, **kwargs)
+
+            result = cache.get(key, missing)
+            if result is missing:
+                result = fn(*args, **kwargs)
+                cache.set(key, result)
+            return copy.deepcopy(result)
+
+        wrapper.cache = cache
+        wrapper.stats = cache.stats
+        _memoized[f"{fn.__module__}.{fn.__qualname__}"] = wrapper
+        return wrapper
+    return decorator
+
+
+def memoized_stats() -> dict:
+    """
+    Stats of every memoized function, by its qualified name
+    """
+    return { name: fn.stats() for name, fn in _memoized.items() }
@@ -1,26 +1,36 @@
 import math
 import numpy as np
-from numpy.lib.financial import pmt
 import numpy_financial as npf
 import pandas as pd
 
 import aiof.config as config
+import aiof.helpers as helpers
+import aiof.car.depreciation as depreciation
 
-from aiof.data.car import CarLoanResponse
-
-from random import randrange
+from aiof.data.car import CarLoanRequest, CarLoanResponse, CarLoanPageResponse, CarValueDepreciationRequest
+from aiof.schedule import Schedule
+from typing import List
 
 
 # Configs
 _settings = config.get_settings()
 _round_dig = _settings.DefaultRoundingDigit
+_batch_max_requests = int(_settings.CarBatchMaxRequests)
+
+
+def _check_years(years) -> None:
+    if any(y <= 0 or y > 100 for y in np.atleast_1d(years)):
+        raise ValueError("Years must be between 1 and 100")
 
 
 def loan_calc(
     car_loan: float = None,
     interest: float = None,
     years: int = None,
-    data_as_json: bool = False) -> CarLoanResponse:
+    offset: int = None,
+    limit: int = None,
+    data_as_json: bool = False,
+    as_columns: bool = False) -> CarLoanResponse:
     """
     Calculate car loan payments and details
 
@@ -32,62 +42,159 @@ def loan_calc(
         interest. defaults to `7`\n
     `years` : int or None.
         years for the loan. defaults to `5`\n
+    `offset` : int or None.
+        0-based year the page of the schedule starts at. if `offset` or `limit` is set, only that page and its
+        breakdown are computed and a `CarLoanPageResponse` is returned, see `aiof.schedule.Schedule.page`. defaults to `None`\n
+    `limit` : int or None.
+        most years in the page. defaults to `None`\n
     `data_as_json` : bool or False.
-        return data (DataFrame) result as JSON. defaults to `False`
+        return data (DataFrame) result as JSON. defaults to `False`\n
+    `as_columns` : bool.
+        whether JSON is returned as columns, `{ column: [values] }`, instead of records. defaults to `False`
     """
-    car_loan = car_loan if car_loan is not None else 35000
-    interest = interest if interest is not None else 7
-    years = years if years is not None else 5
+    if offset is not None or limit is not None:
+        return loan_calc_page(car_loan, interest, years, offset, limit, data_as_json, as_columns)
+    return loan_calc_batch(
+        [CarLoanRequest(carLoan=car_loan, interst=interest, years=years)],
+        data_as_json=data_as_json,
+        as_columns=as_columns)[0]
 
-    interest = interest / 100
 
-    car_payments = npf.pmt(
-        rate=interest,
-        nper=years,
-        pv=-car_loan, 
-        fv=0,
-        when="end")
+def loan_calc_batch(
+    reqs: List[CarLoanRequest],
+    data_as_json: bool = False,
+    as_columns: bool = False) -> List[CarLoanResponse]:
+    """
+    Calculate many car loans' payments and details at once
+
+    Parameters
+    ----------
+    `reqs` : List[CarLoanRequest].
+        the car loans to calculate. missing values use the `loan_calc` defaults\n
+    `data_as_json` : bool or False.
+        return data (DataFrame) result as JSON. defaults to `False`\n
+    `as_columns` : bool.
+        whether JSON is returned as columns, `{ column: [values] }`, instead of records. defaults to `False`
+
+    Notes
+    ----------
+    Every yearly schedule is computed together as one `(loans, years)` array, see `aiof.helpers.amortization_calc`.
+    At most `Settings.CarBatchMaxRequests` loans can be calculated at once
+    """
+    if len(reqs) > _batch_max_requests:
+        raise ValueError(f"Number of car loans cannot be bigger than {_batch_max_requests}")
+
+    car_loans = np.array([req.carLoan if req.carLoan is not None else 35000 for req in reqs], dtype=float)
+    interests = np.array([req.interst if req.interst is not None else 7 for req in reqs], dtype=float) / 100
+    years = np.array([req.years if req.years is not None else 5 for req in reqs], dtype=int)
+    _check_years(years)
+
     car_payments_monthly = npf.pmt(
-        rate=interest / 12,
+        rate=interests / 12,
         nper=years * 12,
-        pv=-car_loan, 
+        pv=-car_loans,
         fv=0,
         when="end")
+    schedule = helpers.amortization_calc(car_loans, interests, years)
+
+    resps = []
+    for i, req_years in enumerate(years):
+        loan_df = pd.DataFrame({
+            "year": np.arange(1, req_years + 1, dtype=float),
+            "startingBalance": schedule["startingBalance"][i, :req_years],
+            "payments": schedule["payment"][i, :req_years],
+            "interestPaid": schedule["interest"][i, :req_years],
+            "principalPaid": schedule["principal"][i, :req_years],
+            "endingBalance": schedule["endingBalance"][i, :req_years],
+        })
+        loan_df = loan_df.round(_round_dig)
+
+        resps.append(CarLoanResponse(
+            carLoan = car_loans[i],
+            interest = interests[i],
+            years = req_years,
+            monthlyPayment = round(car_payments_monthly[i], _round_dig),
+            data = loan_df if not data_as_json else helpers.df_to_json(loan_df, as_columns)))
+
+    return resps
+
+
+def loan_schedule(
+    car_loan: float = None,
+    interest: float = None,
+    years: int = None) -> Schedule:
+    """
+    The yearly `loan_calc` schedule as a lazy `aiof.schedule.Schedule`, whose years are only computed when they are consumed.
+    See `loan_calc` for the parameters and their defaults
+    """
+    car_loan = car_loan if car_loan is not None else 35000
+    interest = (interest if interest is not None else 7) / 100
+    years = years if years is not None else 5
+
+    def table(periods):
+        schedule = helpers.amortization_calc(car_loan, interest, years, periods=periods)
+        loan_df = pd.DataFrame({
+            "year": periods.astype(float),
+            "startingBalance": schedule["startingBalance"],
+            "payments": schedule["payment"],
+            "interestPaid": schedule["interest"],
+            "principalPaid": schedule["principal"],
+            "endingBalance": schedule["endingBalance"],
+        })
+        return loan_df.round(_round_dig)
+    return Schedule(table, years)
 
-    loan_df = np.zeros((years, 6))
-    loan_df = pd.DataFrame(loan_df)
-    loan_df.columns = ["year", "startingBalance", "payments", "interestPaid", "principalPaid", "endingBalance"]
-
-    loan_df.iloc[0, 0] = 1
-    loan_df.iloc[0, 1] = car_loan
-    loan_df.iloc[0, 2] = car_payments
-    loan_df.iloc[0, 3] = car_loan * interest
-    loan_df.iloc[0, 4] = car_payments - (car_loan * interest)
-    loan_df.iloc[0, 5] = car_loan - (car_payments - (car_loan * interest))
-    for i in range(1, years):
-        loan_df.iloc[i, 0] = i + 1
-        loan_df.iloc[i, 1] = loan_df.iloc[(i - 1), 5]
-        loan_df.iloc[i, 2] = car_payments
-        loan_df.iloc[i, 3] = loan_df.iloc[i, 1] * interest
-        loan_df.iloc[i, 4] = car_payments - (loan_df.iloc[i, 1] * interest)
-        loan_df.iloc[i, 5] = loan_df.iloc[i, 1] - (car_payments - (loan_df.iloc[i, 1] * interest))
- 
-    loan_df = loan_df.round(_round_dig)
-
-    resp = CarLoanResponse(
+
+def loan_calc_page(
+    car_loan: float = None,
+    interest: float = None,
+    years: int = None,
+    offset: int = None,
+    limit: int = None,
+    data_as_json: bool = False,
+    as_columns: bool = False) -> CarLoanPageResponse:
+    """
+    Calculate one page of the car loan schedule, without computing the years before it. See `loan_calc` for the parameters
+
+    Returns
+    ----------
+    `CarLoanPageResponse` with the page's `data`, its `breakdown` totals and the `page`'s `offset`, `limit` and `total`
+    """
+    car_loan = car_loan if car_loan is not None else 35000
+    interest = interest if interest is not None else 7
+    years = years if years is not None else 5
+    _check_years(years)
+
+    schedule = loan_schedule(car_loan, interest, years)
+    page = schedule.pagination(offset, limit)
+    loan_df = schedule.page(offset, limit)
+    breakdown_df = helpers.schedule_breakdown(
+        loan_df,
+        by      = "year",
+        totals  = {
+            "payments": "totalPayments",
+            "interestPaid": "totalInterestPaid",
+            "principalPaid": "totalPrincipalPaid"
+        })
+    breakdown_df = breakdown_df.round(_round_dig)
+
+    return CarLoanPageResponse(
         carLoan = car_loan,
-        interest = interest,
+        interest = interest / 100,
         years = years,
-        monthlyPayment = round(car_payments_monthly, _round_dig),
-        data = loan_df if not data_as_json else loan_df.to_dict(orient="records"))
-
-    return resp
+        monthlyPayment = round(npf.pmt(rate=interest / 100 / 12, nper=years * 12, pv=-car_loan, fv=0, when="end"), _round_dig),
+        data = loan_df if not data_as_json else helpers.df_to_json(loan_df, as_columns),
+        breakdown = breakdown_df if not data_as_json else helpers.df_to_json(breakdown_df, as_columns),
+        page = page)
 
 
 def value_depreciation_calc(
     initial_value: float  = None,
     years: int            = None,
-    as_json: bool         = False):
+    profile: str          = None,
+    seed: int             = None,
+    as_json: bool         = False,
+    as_columns: bool      = False):
     """
     Calculates how much your car will depreciate over the years. 
     The assumptions are that your car's value decreases around 20% to 30% by the end of the first year. 
@@ -100,52 +207,69 @@ def value_depreciation_calc(
         the initial value of the car. defaults to `35,000`\n
     `years`: int.
         the number of years to calculate the depreciation for. defaults to `5`\n
+    `profile`: str or None.
+        the depreciation profile, see `aiof.car.depreciation.depreciation_profiles`. defaults to `average`\n
+    `seed`: int or None.
+        seed to draw the depreciation % from the assumed ranges with, instead of using `profile`. defaults to `None`\n
+    `as_json`: bool.
+        whether to return the response as JSON. defaults to `False`\n
+    `as_columns`: bool.
+        whether JSON is returned as columns, `{ column: [values] }`, instead of records. defaults to `False`
+
+    Notes
+    ----------
+    The same inputs always return the same result
+    """
+    return value_depreciation_calc_batch(
+        [CarValueDepreciationRequest(value=initial_value, years=years, profile=profile, seed=seed)],
+        as_json=as_json,
+        as_columns=as_columns)[0]
+
+
+def value_depreciation_calc_batch(
+    reqs: List[CarValueDepreciationRequest],
+    as_json: bool = False,
+    as_columns: bool = False) -> list:
+    """
+    Calculates how much many cars will depreciate over the years at once. See `value_depreciation_calc` for the assumptions
+
+    Parameters
+    ----------
+    `reqs`: List[CarValueDepreciationRequest].
+        the cars to calculate. missing values use the `value_depreciation_calc` defaults\n
     `as_json`: bool.
-        whether to return the response as JSON. defaults to `False`
+        whether to return the response as JSON. defaults to `False`\n
+    `as_columns`: bool.
+        whether JSON is returned as columns, `{ column: [values] }`, instead of records. defaults to `False`
+
+    Notes
+    ----------
+    The values are the initial values times the cumulative product of `1 - depreciation` of each year,
+    computed together as one `(cars, years)` array. At most `Settings.CarBatchMaxRequests` cars can be calculated at once
     """
-    initial_value = initial_value if initial_value is not None else 35000
-    years = years if years is not None else 5
+    if len(reqs) > _batch_max_requests:
+        raise ValueError(f"Number of cars cannot be bigger than {_batch_max_requests}")
+
+    initial_values = np.array([req.value if req.value is not None else 35000 for req in reqs], dtype=float)
+    years = np.array([req.years if req.years is not None else 5 for req in reqs], dtype=int)
+    _check_years(years)
+    max_years = int(years.max(initial=0))
+
+    rates = depreciation.depreciation_curves(
+        years       = max_years,
+        profiles    = [req.profile for req in reqs],
+        seeds       = [req.seed for req in reqs])
+    values = initial_values[:, np.newaxis] * np.cumprod(1 - rates, axis=1)
+
+    resps = []
+    for i, req_years in enumerate(years):
+        years_list = list(range(1, req_years + 1))
+        value_df = pd.DataFrame({
+            "year": years_list,
+            "depreciationPercentage": rates[i, :req_years],
+            "value": values[i, :req_years],
+        }, index=years_list)
+        value_df = value_df.round(_round_dig)
+        resps.append(value_df if not as_json else helpers.df_to_json(value_df, as_columns))
 
-    value = initial_value
-    years_list = list(range(1, years + 1))
-
-    first_year_avg_int = randrange(20, 30)
-    two_to_six_years_avg_int = randrange(15, 18)
-    remaining_years_int = 60 - (first_year_avg_int + two_to_six_years_avg_int)
-
-    first_year_avg_int = first_year_avg_int / 100
-    two_to_six_years_avg_int = two_to_six_years_avg_int / 100
-    remaining_years_int = remaining_years_int / 100
-
-    value = initial_value - (-npf.fv(
-        rate=first_year_avg_int,
-        nper=1,
-        pmt=0,
-        pv=initial_value,
-        when="end") - initial_value)
-
-    value_df = pd.DataFrame(index=years_list, columns=["year", "depreciationPercentage", "value"], dtype="float")
-    value_df["year"] = years_list
-
-    value_df.iloc[0, 1] = first_year_avg_int
-    value_df.iloc[0, 2] = value
-
-    for year in range(1, years):
-        interest = two_to_six_years_avg_int
-        if year >= 2 and year <= 6:
-            interest = two_to_six_years_avg_int
-        elif year > 6:
-            interest = remaining_years_int
-
-        year_value = value_df.iloc[year - 1, 2] - (-npf.fv(
-            rate=interest,
-            nper=1,
-            pmt=0,
-            pv=value_df.iloc[year - 1, 2],
-            when="end") - value_df.iloc[year - 1, 2])
-
-        value_df.iloc[year, 1] = interest
-        value_df.iloc[year, 2] = year_value
-
-    value_df = value_df.round(_round_dig)
-    return value_df if not as_json else value_df.to_dict(orient="records")
\ No newline at end of file
+    return resps
@@ -0,0 +1,90 @@
+import numpy as np
+
+import aiof.config as config
+
+from random import Random
+from typing import List
+
+
+# Configs
+_settings = config.get_settings()
+_profiles = _settings.CarDepreciationProfiles
+_default_profile = _settings.DefaultCarDepreciationProfile
+
+
+def depreciation_profiles() -> dict:
+    """
+    Get all named car depreciation profiles
+
+    Returns
+    ----------
+    `dict` of profile name to its `firstYear`, `twoToSixYears` and `remainingYears` depreciation %
+    """
+    return { name: dict(zip(["firstYear", "twoToSixYears", "remainingYears"], depreciation_profile_rates(name)))
+        for name in _profiles }
+
+
+def depreciation_profile_rates(
+    profile: str = None,
+    seed: int = None) -> tuple:
+    """
+    Get the first year, years two to six and remaining years depreciation % of a profile
+
+    Parameters
+    ----------
+    `profile` : str or None.
+        name of the depreciation profile. defaults to `Settings.DefaultCarDepreciationProfile`\n
+    `seed` : int or None.
+        when provided, the first year % is drawn between `20` and `30` and the years two to six % between `15` and `18`
+        from a random generator seeded with it, instead of using `profile`
+
+    Returns
+    ----------
+    `tuple` of `(first_year, two_to_six_years, remaining_years)` in %
+
+    Notes
+    ----------
+    The same `profile` and `seed` always return the same rates
+    """
+    if seed is not None:
+        rnd = Random(seed)
+        first_year = rnd.randrange(20, 30)
+        two_to_six_years = rnd.randrange(15, 18)
+    else:
+        profile = profile if profile is not None else _default_profile
+        if profile not in _profiles:
+            raise ValueError("Invalid profile. Please use one of the following {0}".format(", ".join(_profiles)))
+        first_year = _profiles[profile]["firstYear"]
+        two_to_six_years = _profiles[profile]["twoToSixYears"]
+
+    return first_year, two_to_six_years, 60 - (first_year + two_to_six_years)
+
+
+def depreciation_curves(
+    years: int,
+    profiles: List[str],
+    seeds: List[int]) -> np.ndarray:
+    """
+    Get the yearly depreciation, as decimals, of many cars
+
+    Parameters
+    ----------
+    `years` : int.
+        number of years to get the depreciation for\n
+    `profiles` : List[str].
+        depreciation profile of each car, see `depreciation_profile_rates`\n
+    `seeds` : List[int].
+        seed of each car, or `None`, see `depreciation_profile_rates`
+
+    Returns
+    ----------
+    `numpy.ndarray` of `(cars, years)`
+    """
+    rates = np.array([depreciation_profile_rates(profile, seed) for profile, seed in zip(profiles, seeds)], dtype=float)
+    rates = rates.reshape(-1, 3) / 100
+
+    year_index = np.arange(years)[np.newaxis, :]
+    return np.where(
+        year_index == 0,
+        rates[:, [0]],
+        np.where(year_index <= 6, rates[:, [1]], rates[:, [2]]))
\ No newline at end of file
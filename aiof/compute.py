@@ -0,0 +1,171 @@
+import asyncio
+import functools
+import multiprocessing
+import threading
+
+import aiof.config as config
+
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, List
+
+
+"""
+Shared executors that heavy calculations are handed to, so they can be sharded across cores
+and kept off the event loop
+"""
+# Configs
+_settings = config.get_settings()
+_executor = _settings.ComputeExecutor
+_process_pool_size = int(_settings.ComputeProcessPoolSize)
+_thread_pool_size = int(_settings.ComputeThreadPoolSize)
+_chunk_size = int(_settings.ComputeChunkSize)
+
+_executors = [
+    "process",
+    "thread",
+    "serial"
+]
+_process_pool: ProcessPoolExecutor = None
+_thread_pool: ThreadPoolExecutor = None
+_thread_local = threading.local()
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    Get the shared process pool, creating it on first use
+
+    Notes
+    ----------
+    Workers are started with `spawn`, as forking a process that is already running threads is unsafe
+    """
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(
+            max_workers=_process_pool_size,
+            mp_context=multiprocessing.get_context("spawn"))
+    return _process_pool
+
+
+def _mark_pool_thread():
+    _thread_local.in_pool = True
+
+
+def in_thread_pool() -> bool:
+    """
+    Whether the calling thread is one of the shared thread pool's workers
+    """
+    return getattr(_thread_local, "in_pool", False)
+
+
+def get_thread_pool() -> ThreadPoolExecutor:
+    """
+    Get the shared thread pool, creating it on first use. Best suited for `numpy` work, which releases the GIL
+    """
+    global _thread_pool
+    if _thread_pool is None:
+        _thread_pool = ThreadPoolExecutor(
+            max_workers=_thread_pool_size,
+            thread_name_prefix="aiof-compute",
+            initializer=_mark_pool_thread)
+    return _thread_pool
+
+
+def get_executor(executor: str = None) -> Executor:
+    """
+    Get the shared executor by name. `serial` returns `None`
+
+    Parameters
+    ----------
+    `executor` : str or None.
+        `process`, `thread` or `serial`. defaults to `Settings.ComputeExecutor`
+    """
+    executor = executor if executor is not None else _executor
+    if executor not in _executors:
+        raise ValueError("Invalid executor. Please use one of the following {0}".format(", ".join(_executors)))
+    elif executor == "process" and _process_pool_size > 1:
+        return get_process_pool()
+    elif executor == "thread" and _thread_pool_size > 1:
+        return get_thread_pool()
+    return None
+
+
+def shutdown():
+    """
+    Shut down the shared pools, if they were created
+    """
+    global _process_pool, _thread_pool
+    if _process_pool is not None:
+        _process_pool.shutdown()
+        _process_pool = None
+    if _thread_pool is not None:
+        _thread_pool.shutdown()
+        _thread_pool = None
+
+
+def shards(
+    length: int,
+    chunk_size: int = None) -> List[slice]:
+    """
+    Split `range(length)` into slices of at most `chunk_size`
+
+    Parameters
+    ----------
+    `length` : int.
+        number of items to split\n
+    `chunk_size` : int or None.
+        maximum number of items per slice. defaults to `Settings.ComputeChunkSize`
+
+    Returns
+    ----------
+    `List[slice]`. always at least one slice, so empty inputs still produce a (empty) result
+    """
+    chunk_size = chunk_size if chunk_size is not None else _chunk_size
+    if length == 0:
+        return [slice(0, 0)]
+    return [slice(start, min(start + chunk_size, length)) for start in range(0, length, chunk_size)]
+
+
+def map_chunks(
+    fn: Callable,
+    args: List[tuple],
+    executor: str = None) -> list:
+    """
+    Run `fn(*a)` for every `a` in `args` on the shared executor and return the results in order
+
+    Parameters
+    ----------
+    `fn` : Callable.
+        the function to run. must be a module level function for the `process` executor\n
+    `args` : List[tuple].
+        the arguments of every call\n
+    `executor` : str or None.
+        `process`, `thread` or `serial`. defaults to `Settings.ComputeExecutor`
+
+    Notes
+    ----------
+    A single call, or a pool of size 1, runs inline. So do calls made from a worker of the shared thread pool, as
+    waiting there on shards queued behind it would deadlock the pool once all of its workers do the same
+    """
+    pool = get_executor(executor) if len(args) > 1 else None
+    if pool is _thread_pool and in_thread_pool():
+        pool = None
+    if pool is None:
+        return [fn(*a) for a in args]
+    return list(pool.map(fn, *zip(*args)))
+
+
+async def run_in_thread(fn: Callable, *args, **kwargs):
+    """
+    Run `fn(*args, **kwargs)` on the shared thread pool without blocking the event loop
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_thread_pool(), functools.partial(fn, *args, **kwargs))
+
+
+async def run_in_process(fn: Callable, *args, **kwargs):
+    """
+    Run `fn(*args, **kwargs)` on the shared process pool without blocking the event loop.
+    `fn`, its arguments and its result must be picklable
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_process_pool(), functools.partial(fn, *args, **kwargs))
\ No newline at end of file
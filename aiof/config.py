@@ -88,8 +88,98 @@ class Settings(BaseSettings):
         9,
         10
     ]
+    TenMillionDreamMaxCells: int = 1000000
     # End FI specific
 
+    # Car specific
+    # Depreciation % of the first year and of years two to six. The remaining years depreciate
+    # by 60% minus both, as cars lose around 60% of their value in five years
+    CarDepreciationProfiles: dict = {
+        "low": { "firstYear": 20, "twoToSixYears": 15 },
+        "average": { "firstYear": 25, "twoToSixYears": 16 },
+        "high": { "firstYear": 29, "twoToSixYears": 17 }
+    }
+    DefaultCarDepreciationProfile: str = os.getenv("DefaultCarDepreciationProfile", "average")
+    CarBatchMaxRequests: int = os.getenv("CarBatchMaxRequests", 10000)
+    # End Car specific
+
+    # Property specific
+    MortgageBatchMaxScenarios: int = os.getenv("MortgageBatchMaxScenarios", 10000)
+    # End Property specific
+
+    # Retirement specific
+    WithdrawalBatchMaxStrategies: int = os.getenv("WithdrawalBatchMaxStrategies", 10000)
+    DefaultVolatility: float = os.getenv("DefaultVolatility", 15)
+    DefaultSuccessTarget: float = os.getenv("DefaultSuccessTarget", 95)
+    MonteCarloDefaultPaths: int = os.getenv("MonteCarloDefaultPaths", 10000)
+    MonteCarloMaxPaths: int = os.getenv("MonteCarloMaxPaths", 1000000)
+    MonteCarloChunkSize: int = os.getenv("MonteCarloChunkSize", 10000)
+    MonteCarloSeedBlockSize: int = os.getenv("MonteCarloSeedBlockSize", 1000)
+    MonteCarloPercentiles: List[int] = [ 5, 25, 50, 75, 95 ]
+    MonteCarloDistributions: list = [
+        "normal",
+        "lognormal",
+        "historical"
+    ]
+    # S&P 500 annual total returns, 1990 to 2020
+    DefaultHistoricalReturns: list = [
+        -3.06, 30.23, 7.49, 9.97, 1.33, 37.20, 22.68, 33.10, 28.34, 20.89,
+        -9.03, -11.85, -21.97, 28.36, 10.74, 4.83, 15.61, 5.48, -36.55, 25.94,
+        14.82, 2.10, 15.89, 32.15, 13.52, 1.38, 11.77, 21.61, -4.23, 31.21,
+        18.02
+    ]
+    # End Retirement specific
+
+    # Compute
+    # Executor ("process", "thread" or "serial") that chunks of heavy calculations, such as Monte Carlo paths, run on
+    ComputeExecutor: str = os.getenv("ComputeExecutor", "process")
+    ComputeProcessPoolSize: int = os.getenv("ComputeProcessPoolSize", os.cpu_count() or 1)
+    ComputeThreadPoolSize: int = os.getenv("ComputeThreadPoolSize", os.cpu_count() or 1)
+    # Number of scenarios per shard when scenario grids are split across cores
+    ComputeChunkSize: int = os.getenv("ComputeChunkSize", 1000)
+    # Cheap and heavy calculations that can be running or queued at once, across routers, before requests are
+    # rejected with a 429. Heavy calculations run on their own pool, see `api.dispatch.dispatch`
+    DispatchMaxPending: int = os.getenv("DispatchMaxPending", 64)
+    DispatchHeavyMaxPending: int = os.getenv("DispatchHeavyMaxPending", 16)
+    DispatchHeavyPoolSize: int = os.getenv("DispatchHeavyPoolSize", os.cpu_count() or 1)
+    DispatchRetryAfterSeconds: int = os.getenv("DispatchRetryAfterSeconds", 1)
+    # End Compute
+
+    # Cache
+    ResponseCacheMaxBytes: int = os.getenv("ResponseCacheMaxBytes", 64 * 1024 * 1024)
+    ResponseCacheTtlSeconds: int = os.getenv("ResponseCacheTtlSeconds", 3600)
+    # Monthly investments whose ten million dream responses are precomputed at startup
+    PrecomputedTenMillionDreamMonthlyInvestments: list = [
+        100,
+        250,
+        500,
+        750,
+        1000,
+        1500,
+        2000,
+        2500,
+        3000,
+        4000,
+        5000,
+        10000
+    ]
+    # Results of each memoized function kept in process, see `aiof.cache.memoize`
+    MemoizeMaxEntries: int = os.getenv("MemoizeMaxEntries", 1024)
+    # End Cache
+
+    # Export
+    # Rows per chunk (record batch, row group or block of CSV rows) that table exports are streamed in
+    ExportChunkRows: int = os.getenv("ExportChunkRows", 10000)
+    # End Export
+
+    # Schedule
+    # Periods a lazy schedule computes at once while it is iterated, see `aiof.schedule.Schedule`
+    ScheduleChunkRows: int = os.getenv("ScheduleChunkRows", 120)
+    # Periods of a schedule page when only its offset is requested, and the most a page can have
+    SchedulePageDefaultLimit: int = os.getenv("SchedulePageDefaultLimit", 12)
+    SchedulePageMaxLimit: int = os.getenv("SchedulePageMaxLimit", 1000)
+    # End Schedule
+
     cors_origins: list = [
         "http://localhost:4100",
         "http://localhost:1337"
@@ -162,6 +252,8 @@ class Settings(BaseSettings):
         LifeEventType.BUYING_A_CAR,
         LifeEventType.SELLING_A_CAR
     ]
+    # Most years a life event timeline can be simulated for
+    LifeEventTimelineMaxYears: int = os.getenv("LifeEventTimelineMaxYears", 100)
 
 
 @lru_cache()
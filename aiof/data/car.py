@@ -1,7 +1,13 @@
-from pydantic import BaseModel
+import aiof.config as config
+
+from pydantic import BaseModel, validator
 from typing import Optional
 
 
+_settings = config.get_settings()
+_depreciation_profiles = _settings.CarDepreciationProfiles
+
+
 # Car
 # Anything and everything car related models
 
@@ -21,7 +27,19 @@ class CarLoanResponse(BaseModel):
     class Config:
         arbitrary_types_allowed = True
 
+class CarLoanPageResponse(CarLoanResponse):
+    breakdown: object
+    page: dict
+
 
 class CarValueDepreciationRequest(BaseModel):
     value: Optional[float]
     years: Optional[int]
+    profile: Optional[str]
+    seed: Optional[int]
+
+    @validator("profile")
+    def profile_must_be_valid(cls, p):
+        if p is not None and p not in _depreciation_profiles:
+            raise ValueError("Invalid profile. Please use one of the following {0}".format(", ".join(_depreciation_profiles)))
+        return p
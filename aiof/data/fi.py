@@ -18,6 +18,11 @@ class FiAddedTime(BaseModel):
     monthlyInvestment: Optional[float] = None
     totalAdditionalExpense: Optional[float] = None
 
+class FiTenMillionDream(BaseModel):
+    monthlyInvestment: Optional[float] = None
+    milestones: Optional[List[float]] = None
+    interests: Optional[List[float]] = None
+
 class FiCompoundInterest(BaseModel):
     startingAmount: Optional[float] = None
     monthlyInvestment: Optional[float] = None
@@ -12,27 +12,26 @@ from typing import List, Optional
 _settings = config.get_settings()
 _event_types = _settings.LifeEventTypes
 
-class LifeEventRequest(BaseModel):
+class LifeEvent(BaseModel):
     """
-    Life event request class. This is used to request specific event
+    Life event class. This is a single event, with the details its type needs
     """
-    assets: List[Asset]
-    liabilities: Optional[List[Liability]]
     type: str
     amount: Optional[float]
     plannedDate: Optional[datetime.datetime]
 
-    # Contributions
-    monthlyCashContribution: Optional[float]
-    monthlyInvestmentContribution: Optional[float]
-    monthlyStockContribution: Optional[float]
-
     # Car
     carLoanAmount: Optional[float]
     carDownPayment: Optional[float]
     carInterest: Optional[float]
     carYears: Optional[int]
 
+    # House
+    houseValue: Optional[float]
+    houseDownPayment: Optional[float]
+    houseInterest: Optional[float]
+    houseYears: Optional[int]
+
 
     @validator("type")
     def type_must_be_valid(cls, t):
@@ -41,6 +40,36 @@ class LifeEventRequest(BaseModel):
         return t.title()
 
 
+class LifeEventRequest(LifeEvent):
+    """
+    Life event request class. This is used to request specific event, and any other `events` to simulate with it
+    """
+    assets: List[Asset]
+    liabilities: Optional[List[Liability]]
+    events: Optional[List[LifeEvent]]
+
+    # Contributions
+    monthlyCashContribution: Optional[float]
+    monthlyInvestmentContribution: Optional[float]
+    monthlyStockContribution: Optional[float]
+
+
+class LifeEventTimelineRequest(BaseModel):
+    """
+    Life event timeline request class. This is used to simulate many dated events together
+    """
+    assets: List[Asset]
+    liabilities: Optional[List[Liability]]
+    events: List[LifeEvent]
+    startDate: Optional[datetime.datetime]
+    years: Optional[int]
+
+    # Contributions
+    monthlyCashContribution: Optional[float]
+    monthlyInvestmentContribution: Optional[float]
+    monthlyStockContribution: Optional[float]
+
+
 class LifeEventResponse(BaseModel):
     """
     Life event response class. This is used to return specific response
@@ -1,7 +1,7 @@
 import datetime
 
 from pydantic import BaseModel
-from typing import Optional
+from typing import Optional, List
 
 
 class MortgageCalculatorRequest(BaseModel):
@@ -12,4 +12,16 @@ class MortgageCalculatorRequest(BaseModel):
     startDate: Optional[datetime.datetime]
     pmi: Optional[float]
     propertyInsurance: Optional[float]
-    monthlyHoa: Optional[float]
\ No newline at end of file
+    monthlyHoa: Optional[float]
+
+class MortgageCalculatorGrid(BaseModel):
+    propertyValues: Optional[List[float]]
+    downPayments: Optional[List[float]]
+    interestRates: Optional[List[float]]
+    loanTermYears: Optional[List[int]]
+
+class MortgageCalculatorBatchRequest(BaseModel):
+    scenarios: Optional[List[MortgageCalculatorRequest]]
+    grid: Optional[MortgageCalculatorGrid]
+    startDate: Optional[datetime.datetime]
+    includeSchedules: Optional[bool] = False
@@ -1,10 +1,41 @@
 import datetime
 
-from pydantic import BaseModel
-from typing import Optional
+import aiof.config as config
+
+from pydantic import BaseModel, validator
+from typing import Optional, List
+
+
+_settings = config.get_settings()
+_distributions = _settings.MonteCarloDistributions
 
 
 class WithdrawalRequest(BaseModel):
     retirementNumber: float
     takeOutPercentage: float
-    numberOfYears: float
\ No newline at end of file
+    numberOfYears: float
+
+class WithdrawalBatchRequest(BaseModel):
+    retirementNumbers: Optional[List[float]]
+    takeOutPercentages: Optional[List[float]]
+    numberOfYears: Optional[float]
+    includeSchedules: Optional[bool] = False
+
+class WithdrawalMonteCarloRequest(BaseModel):
+    retirementNumber: Optional[float]
+    takeOutPercentage: Optional[float]
+    numberOfYears: Optional[float]
+    paths: Optional[int]
+    distribution: Optional[str]
+    mean: Optional[float]
+    volatility: Optional[float]
+    historicalReturns: Optional[List[float]]
+    seed: Optional[int]
+    chunkSize: Optional[int]
+    successTarget: Optional[float]
+
+    @validator("distribution")
+    def distribution_must_be_valid(cls, d):
+        if d is not None and d not in _distributions:
+            raise ValueError("Invalid distribution. Please use one of the following {0}".format(", ".join(_distributions)))
+        return d
\ No newline at end of file
@@ -1,8 +1,12 @@
 import math
+import numpy as np
 import numpy_financial as npf
 import pandas as pd
 
 import aiof.config as config
+import aiof.helpers as helpers
+
+from aiof.cache import memoize
 
 from typing import List
 
@@ -16,6 +20,7 @@ _fees = _settings.DefaultFees
 _children = _settings.DefaultChildren
 _ten_million = _settings.DefaultTenMillion
 _ten_million_interests = _settings.DefaultTenMillionInterests
+_ten_million_max_cells = _settings.TenMillionDreamMaxCells
 
 
 # Financial Indepdence (FI) core
@@ -25,7 +30,8 @@ def time_to_fi(
     starting_amount: float,
     monthly_investment: float,
     desired_years_expenses_for_fi: int,
-    desired_annual_spending: float):
+    desired_annual_spending: float,
+    as_columns: bool = False):
     """
     Find out how many years you have left in your path to FI (financial independence) at various real returns on your investments
 
@@ -38,7 +44,9 @@ def time_to_fi(
     `desired_years_expenses_for_fi` : int or None.
         desired years of expenses after one retires. defaults to `25`\n
     `desired_annual_spending` : float or None.
-        desired annual spending amount after one retires. defaults to `100,000`
+        desired annual spending amount after one retires. defaults to `100,000`\n
+    `as_columns` : bool.
+        whether to return `years` as columns, `{ column: [values] }`, instead of records. defaults to `False`
 
     Notes
     ----------
@@ -52,19 +60,14 @@ def time_to_fi(
     desired_retirement_savings_for_fi = desired_years_expenses_for_fi * desired_annual_spending
     current_deficit = desired_retirement_savings_for_fi - starting_amount
 
-    years_to_goal_obj = []
-    for interest in _interests:
-        years_to_goal = npf.nper(
+    years_to_goal_obj = {
+        "interest": list(_interests),
+        "years": [round(npf.nper(
             (interest / 100)/12, 
             monthly_investment * -1,
             starting_amount * -1,
-            desired_retirement_savings_for_fi) / 12
-
-        years_to_goal_obj.append(
-            {
-                "interest": interest,
-                "years": round(years_to_goal, 1),
-            })
+            desired_retirement_savings_for_fi) / 12, 1) for interest in _interests]
+    }
 
     return {
         "startingAmount": starting_amount,
@@ -73,7 +76,7 @@ def time_to_fi(
         "desiredAnnualSpending": desired_annual_spending,
         "desiredRetirementSavingsForFi": desired_retirement_savings_for_fi,
         "currentDeficit": current_deficit,
-        "years": years_to_goal_obj
+        "years": years_to_goal_obj if as_columns else helpers.records_from_columns(years_to_goal_obj)
     }
 
 
@@ -161,6 +164,43 @@ def added_time_to_fi(
     }
 
 
+def ten_million_dream_years(
+    monthly_investment: float,
+    milestones,
+    interests) -> np.ndarray:
+    """
+    Number of years to save up to every milestone at every interest, as one `(milestones, interests)` array
+
+    Parameters
+    ----------
+    `monthly_investment` : float.
+        monthly investment, made at the beginning of every month
+
+    `milestones` : array.
+        savings goals
+
+    `interests` : array.
+        yearly interest rates, e.g. `8` for 8%
+
+    Notes
+    ----------
+    Saving `m` at the beginning of every month at monthly rate `r` reaches `fv` after
+    `log(1 + fv * r / (m * (1 + r))) / log(1 + r)` months, or `fv / m` months when `r` is `0`.
+    Same as `npf.nper(r, -m, 0, fv, when='begin')`, which doesn't broadcast a `0` rate correctly
+    """
+    milestones = np.asarray(milestones, dtype=float)[:, np.newaxis]
+    rates = np.asarray(interests, dtype=float)[np.newaxis, :] / 100 / 12
+
+    zero_rate = rates == 0
+    safe_rates = np.where(zero_rate, 1, rates)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        months = np.where(
+            zero_rate,
+            milestones / monthly_investment,
+            np.log1p(milestones * safe_rates / (monthly_investment * (1 + safe_rates))) / np.log1p(safe_rates))
+    return months / 12
+
+
 def ten_million_dream(monthly_investment: float):
     """
     Determine the number of years to reach a savings goal based on a variety of market returns
@@ -176,25 +216,57 @@ def ten_million_dream(monthly_investment: float):
     """
     monthly_investment = monthly_investment if monthly_investment is not None else 10000
 
-    ten_million_obj = []
-    for million in _ten_million:
-        million_interests_obj = []
-        for interest in _ten_million_interests:
-            years = npf.nper(
-                (interest / 100)/12, 
-                -monthly_investment,
-                0,
-                million,
-                when='begin') / 12
-            million_interests_obj.append({
-                    "interest": interest,
-                    "years": round(years, 1)
-                })
-        ten_million_obj.append({
-            "million": million,
-            "years": million_interests_obj
-        })
-    return ten_million_obj
+    years = np.round(ten_million_dream_years(monthly_investment, _ten_million, _ten_million_interests), 1).tolist()
+    return [{
+        "million": million,
+        "years": [{ "interest": interest, "years": y } for interest, y in zip(_ten_million_interests, million_years)]
+    } for million, million_years in zip(_ten_million, years)]
+
+
+def ten_million_dream_grid(
+    monthly_investment: float = None,
+    milestones: List[float] = None,
+    interests: List[float] = None,
+    as_json: bool = False):
+    """
+    Determine the number of years to reach every savings goal at every market return
+
+    Parameters
+    ----------
+    `monthly_investment` : float or None.
+        monthly investment over the years. defaults to `10,000`\n
+    `milestones` : List[float] or None.
+        savings goals. defaults to `Settings.DefaultTenMillion`\n
+    `interests` : List[float] or None.
+        yearly market returns. defaults to `Settings.DefaultTenMillionInterests`\n
+    `as_json` : bool.
+        whether to return the pandas.DataFrame as columns of JSON, `{ column: [values] }`. defaults to `False`
+
+    Notes
+    ----------
+    Returns one row per milestone and interest, computed together as one broadcasted array, see `ten_million_dream_years`
+    """
+    monthly_investment = monthly_investment if monthly_investment is not None else 10000
+    milestones = milestones if milestones is not None else _ten_million
+    interests = interests if interests is not None else _ten_million_interests
+
+    if monthly_investment <= 0:
+        raise ValueError("Monthly investment must be bigger than 0")
+    elif len(milestones) * len(interests) > _ten_million_max_cells:
+        raise ValueError(f"Number of milestones times interests cannot be bigger than {_ten_million_max_cells}")
+    elif any(m < 0 for m in milestones):
+        raise ValueError("Milestones cannot be negative")
+    elif any(i < 0 or i > 100 for i in interests):
+        raise ValueError("Interests cannot be negative or bigger than 100%")
+
+    years = ten_million_dream_years(monthly_investment, milestones, interests)
+    df = pd.DataFrame({
+        "million": np.repeat(np.asarray(milestones, dtype=float), len(interests)),
+        "interest": np.tile(np.asarray(interests, dtype=float), len(milestones)),
+        "years": np.round(years.ravel(), 1),
+    })
+
+    return df if not as_json else df.to_dict(orient="list")
 
 
 def compound_interest(
@@ -203,7 +275,8 @@ def compound_interest(
     interest_rate: float,
     number_of_years: int,
     investment_fees: float,
-    tax_drag: float):
+    tax_drag: float,
+    as_columns: bool = False):
     """
     Compound interest calculator. Results are displayed representing daily, monthly, and annual compounding, 
     with additions made at the beginning or end of the day, month or year
@@ -221,7 +294,9 @@ def compound_interest(
     `investment_fees` : float or None.
         investment fees (if any) to subtract from the interest rate. defaults to `0.50`\n
     `tax_drag` : float or None.
-        tax drag (if any) to subtract from the interest rate. defaults to `0.50`
+        tax drag (if any) to subtract from the interest rate. defaults to `0.50`\n
+    `as_columns` : bool.
+        whether to return the table as columns, `{ column: [values] }`, instead of records. defaults to `False`
 
     Notes
     ----------
@@ -234,25 +309,28 @@ def compound_interest(
     investment_fees = investment_fees if investment_fees is not None else 0.50
     tax_drag = tax_drag if tax_drag is not None else 0.50
 
-    compound_interest_obj = []
+    compounded_beginning = []
+    compounded_end = []
     for frequency in _frequencies:
         rate = ((interest_rate - investment_fees - tax_drag) / 100) / frequency
         nper = number_of_years * frequency
         pmt = (monthly_investment * 12) / frequency
-        fv_begin = -npf.fv(rate, nper, pmt, starting_amount, when='begin')
-        fv_end = -npf.fv(rate, nper, pmt, starting_amount, when='end')
-        compound_interest_obj.append({
-            "startingAmount": starting_amount,
-            "monthlyInvestment": monthly_investment,
-            "interest": interest_rate,
-            "numberOfYears": number_of_years,
-            "investmentFees": investment_fees,
-            "taxDrag": tax_drag,
-            "frequency": frequency,
-            "compoundedBeginning": math.ceil(fv_begin),
-            "compoundedEnd": math.ceil(fv_end)
-        })
-    return compound_interest_obj
+        compounded_beginning.append(math.ceil(-npf.fv(rate, nper, pmt, starting_amount, when='begin')))
+        compounded_end.append(math.ceil(-npf.fv(rate, nper, pmt, starting_amount, when='end')))
+
+    rows = len(_frequencies)
+    compound_interest_obj = {
+        "startingAmount": [starting_amount] * rows,
+        "monthlyInvestment": [monthly_investment] * rows,
+        "interest": [interest_rate] * rows,
+        "numberOfYears": [number_of_years] * rows,
+        "investmentFees": [investment_fees] * rows,
+        "taxDrag": [tax_drag] * rows,
+        "frequency": list(_frequencies),
+        "compoundedBeginning": compounded_beginning,
+        "compoundedEnd": compounded_end
+    }
+    return compound_interest_obj if as_columns else helpers.records_from_columns(compound_interest_obj)
 
 
 def investment_fees_effect(
@@ -262,7 +340,8 @@ def investment_fees_effect(
     tax_drag: float,
     annual_savings_1_decade: float,
     annual_savings_2_decade: float,
-    annual_withdrawal_3_decade: float):
+    annual_withdrawal_3_decade: float,
+    as_columns: bool = False):
     """
     Effects of investment fees
 
@@ -283,6 +362,8 @@ def investment_fees_effect(
     `annual_withdrawal_3_decade` : float or None.
         the amount of withdrawal in the 3rd decade of retirement. the other decades are calculated accordingly - 
         additional percentages. defaults to `70,000`\n
+    `as_columns` : bool.
+        whether to return every fee's `values` as columns, `{ column: [values] }`, instead of records. defaults to `False`
 
     Notes
     ----------
@@ -305,7 +386,6 @@ def investment_fees_effect(
     for fee in _fees:
         work_interest_return = (interest_return_while_working - tax_drag - fee) / 100
         retired_interest_return =  (interest_return_while_retired - tax_drag - fee) / 100
-        value_obj = []
 
         fv_after_10_years = -npf.fv(
             work_interest_return / 12,
@@ -359,44 +439,21 @@ def investment_fees_effect(
 
         return_work_interest_return = round(work_interest_return * 100, 1)
         return_retired_interest_return = round(retired_interest_return * 100, 1)
-        value_obj.append({
-            "age": age_at_career_start + 10, 
-            "value": math.ceil(fv_after_10_years),
-            "interest": return_work_interest_return
-        })
-        value_obj.append({
-            "age": age_at_career_start + 20, 
-            "value": math.ceil(fv_after_20_years),
-            "interest": return_work_interest_return
-        })
-        value_obj.append({
-            "age": age_at_career_start + 30, 
-            "value": math.ceil(retired_fv_30_years),
-            "interest": return_retired_interest_return
-        })
-        value_obj.append({
-            "age": age_at_career_start + 40, 
-            "value": math.ceil(retired_fv_40_years),
-            "interest": return_retired_interest_return
-        })
-        value_obj.append({
-            "age": age_at_career_start + 50, 
-            "value": math.ceil(retired_fv_50_years),
-            "interest": return_retired_interest_return
-        })
-        value_obj.append({
-            "age": age_at_career_start + 60, 
-            "value": math.ceil(retired_fv_60_years),
-            "interest": return_retired_interest_return
-        })
-        value_obj.append({
-            "age": age_at_career_start + 70, 
-            "value": math.ceil(retired_fv_70_years),
-            "interest": return_retired_interest_return
-        })
+        value_obj = {
+            "age": [age_at_career_start + decade for decade in range(10, 80, 10)],
+            "value": [math.ceil(fv) for fv in [
+                fv_after_10_years,
+                fv_after_20_years,
+                retired_fv_30_years,
+                retired_fv_40_years,
+                retired_fv_50_years,
+                retired_fv_60_years,
+                retired_fv_70_years]],
+            "interest": [return_work_interest_return] * 2 + [return_retired_interest_return] * 5
+        }
         fees_obj.append({
             "fee": fee,
-            "values": value_obj
+            "values": value_obj if as_columns else helpers.records_from_columns(value_obj)
         })
 
     return {
@@ -415,6 +472,7 @@ def investment_fees_effect(
     }
 
 
+@memoize()
 def cost_of_raising_children(
     annual_expenses_start: float = None,
     annual_expenses_increment: float = None,
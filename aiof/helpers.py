@@ -6,6 +6,7 @@ import numpy_financial as npf
 
 from aiof.config import Settings
 from aiof.data.asset import Asset, ComparableAsset
+from aiof.schedule import Schedule
 
 from datetime import datetime
 from logzero import logger
@@ -19,6 +20,7 @@ _settings = Settings()
 _round_dig = _settings.DefaultRoundingDigit
 _frequency = _settings.Frequencies
 _frequency_text = _settings.FrequenciesMap
+_export_chunk_rows = _settings.ExportChunkRows
 
 
 def convert_frequency(frequency, as_decimal=False, as_int=False):
@@ -81,63 +83,296 @@ def loan_payments_calc(
     return npf.pmt(rate = (to_percentage(rate_of_interest) / frequency_int), nper = number_of_years * frequency_int, pv = -loan_amount)
 
 
+def amortization_calc(
+    loan_amount,
+    rate,
+    nper,
+    periods=None) -> dict:
+    """
+    Closed-form amortization schedule as `numpy` arrays
+
+    Parameters
+    ----------
+    `loan_amount` : float or array.
+        the amount borrowed\n
+    `rate` : float or array.
+        the interest rate per period, as a decimal. e.g. `0.04 / 12` for a 4% monthly loan\n
+    `nper` : int or array.
+        the total number of payment periods\n
+    `periods` : array or None.
+        1-based periods to compute. defaults to `1` through `max(nper)`
+
+    Returns
+    ----------
+    `dict` of `numpy.ndarray` with `payment`, `principal`, `interest`, `startingBalance` and `endingBalance`.
+    Scalar inputs give 1-D arrays of `len(periods)`. Array inputs give 2-D arrays of `(len(loan_amount), len(periods))`,
+    where periods past a scenario's `nper` are `0`
+
+    Notes
+    ----------
+    The balance after `k` periods is `P * (1 + r)^k - pmt * ((1 + r)^k - 1) / r`, so any period
+    can be computed directly without walking the previous ones
+    """
+    is_scalar = np.ndim(loan_amount) == 0 and np.ndim(rate) == 0 and np.ndim(nper) == 0
+    loan_amount, rate, nper = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(loan_amount, dtype=float)),
+        np.atleast_1d(np.asarray(rate, dtype=float)),
+        np.atleast_1d(np.asarray(nper, dtype=float)))
+    loan_amount = loan_amount[:, np.newaxis]
+    rate = rate[:, np.newaxis]
+    nper = nper[:, np.newaxis]
+    if periods is None:
+        periods = np.arange(1, int(nper.max(initial=0)) + 1)
+    periods = np.asarray(periods, dtype=float)[np.newaxis, :]
+
+    zero_rate = rate == 0
+    safe_rate = np.where(zero_rate, 1, rate)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        growth = (1 + rate) ** nper
+        payment = np.where(
+            zero_rate,
+            loan_amount / nper,
+            loan_amount * rate * growth / (growth - 1))
+
+        def balance(k):
+            g = (1 + rate) ** k
+            return np.where(
+                zero_rate,
+                loan_amount - payment * k,
+                loan_amount * g - payment * (g - 1) / safe_rate)
+
+        starting_balance = balance(periods - 1)
+    interest = starting_balance * rate
+    principal = payment - interest
+    ending_balance = np.maximum(starting_balance - principal, 0)
+
+    active = periods <= nper
+    schedule = {
+        "payment": np.where(active, payment, 0),
+        "principal": np.where(active, principal, 0),
+        "interest": np.where(active, interest, 0),
+        "startingBalance": np.where(active, starting_balance, 0),
+        "endingBalance": np.where(active, ending_balance, 0),
+    }
+    return { k: v[0] for k, v in schedule.items() } if is_scalar else schedule
+
+
+def _loan_payments_table(loan_amount, rate, nper, frequency_text, periods) -> pd.DataFrame:
+    schedule = amortization_calc(loan_amount, rate, nper, periods=periods)
+    loan_df = pd.DataFrame({
+        frequency_text: periods,
+        "initialBalance": schedule["startingBalance"],
+        "payment": schedule["payment"],
+        "interest": schedule["interest"],
+        "principal": schedule["principal"],
+        "endingBalance": schedule["endingBalance"],
+    })
+    return loan_df.round(2)
+
+
 def loan_payments_calc_as_table(loan_amount, number_of_years, rate_of_interest, frequency="monthly"):
-    payments = loan_payments_calc(loan_amount, number_of_years, rate_of_interest, frequency)
     interest = to_percentage(rate_of_interest)
     frequency_int = convert_frequency(frequency, as_int=True)
     frequency_num = frequency_int * number_of_years
     frequency_text = _frequency_text[frequency]
 
-    loan_df = np.zeros((frequency_num, 6))
-    loan_df = pd.DataFrame(loan_df)
-    loan_df.columns = [frequency_text, "initialBalance", "payment", "interest",
-                                "principal", "endingBalance"]
-    loan_df.iloc[0, 0] = 1
-    loan_df.iloc[0, 1] = loan_amount
-    loan_df.iloc[0, 2] = payments
-    loan_df.iloc[0, 3] = loan_amount * (interest / frequency_int)
-    loan_df.iloc[0, 4] = payments - (loan_amount * (interest / frequency_int))
-    loan_df.iloc[0, 5] = loan_amount - (payments - (loan_amount * (interest / frequency_int)))
-    for i in range(1, frequency_num):
-        loan_df.iloc[i, 0] = i + 1
-        loan_df.iloc[i, 1] = loan_df.iloc[(i - 1), 5]
-        loan_df.iloc[i, 2] = payments
-        loan_df.iloc[i, 3] = loan_df.iloc[i, 1] * (interest / frequency_int)
-        loan_df.iloc[i, 4] = payments - (loan_df.iloc[i, 1] * (interest / frequency_int))
-        loan_df.iloc[i, 5] = loan_df.iloc[i, 1] - (payments - (loan_df.iloc[i, 1] * (interest / frequency_int)))
-    
-    loan_df = loan_df.round(2)
-    loan_df[frequency_text] = loan_df[frequency_text].astype(int)
+    loan_df = _loan_payments_table(
+        loan_amount, interest / frequency_int, frequency_num, frequency_text, np.arange(1, frequency_num + 1))
 
     with pd.option_context("display.max_rows", None, "display.max_columns", None):
         return loan_df
 
 
+def loan_payments_schedule(loan_amount, number_of_years, rate_of_interest, frequency="monthly") -> Schedule:
+    """
+    The `loan_payments_calc_as_table` schedule as a lazy `aiof.schedule.Schedule`, whose periods are only computed
+    when they are consumed
+
+    Parameters
+    ----------
+    `loan_amount` : float.
+        the amount borrowed\n
+    `number_of_years` : int.
+        number of years of the loan\n
+    `rate_of_interest` : float.
+        annual interest rate. e.g. `4.5` for 4.5%\n
+    `frequency` : str.
+        payment frequency. defaults to `monthly`
+
+    Notes
+    ----------
+    Any period is computed directly with `amortization_calc(periods=...)`, without computing the ones before it
+    """
+    if frequency not in _frequency:
+        raise ValueError("Frequency must be one of the following: " + ", ".join(_frequency))
+    elif rate_of_interest < 0 or rate_of_interest > 100:
+        raise ValueError("Rate of interest cannot be negative or bigger than 100%")
+    elif number_of_years <= 0 or number_of_years > 100:
+        raise ValueError("Number of years must be between 1 and 100")
+
+    interest = to_percentage(rate_of_interest)
+    frequency_int = convert_frequency(frequency, as_int=True)
+    frequency_num = frequency_int * number_of_years
+    frequency_text = _frequency_text[frequency]
+
+    return Schedule(
+        lambda periods: _loan_payments_table(loan_amount, interest / frequency_int, frequency_num, frequency_text, periods),
+        frequency_num)
+
+
+def loan_payments_calc_as_chunks(
+    loan_amount,
+    number_of_years,
+    rate_of_interest,
+    frequency="monthly",
+    chunk_rows: int = None):
+    """
+    Build the `loan_payments_calc_as_table` schedule lazily, one block of rows at a time
+
+    Parameters
+    ----------
+    `loan_amount` : float.
+        the amount borrowed\n
+    `number_of_years` : int.
+        number of years of the loan\n
+    `rate_of_interest` : float.
+        annual interest rate. e.g. `4.5` for 4.5%\n
+    `frequency` : str.
+        payment frequency. defaults to `monthly`\n
+    `chunk_rows` : int or None.
+        rows per block. defaults to `Settings.ExportChunkRows`
+
+    Returns
+    ----------
+    generator of `pandas.DataFrame`, whose concatenation is the `loan_payments_calc_as_table` schedule
+    """
+    chunk_rows = chunk_rows if chunk_rows is not None else _export_chunk_rows
+
+    if chunk_rows <= 0:
+        raise ValueError("Chunk rows must be bigger than 0")
+
+    return loan_payments_schedule(loan_amount, number_of_years, rate_of_interest, frequency).chunks(chunk_rows=chunk_rows)
+
+
+def schedule_breakdown(
+    df: pd.DataFrame,
+    by,
+    name: str = "year",
+    starting_balance: str = "startingBalance",
+    ending_balance: str = "endingBalance",
+    totals: dict = None) -> pd.DataFrame:
+    """
+    Aggregate an amortization schedule into per-group (usually per-year) totals in a single pass
+
+    Parameters
+    ----------
+    `df` : pandas.DataFrame.
+        the schedule, one row per period, in period order\n
+    `by` : str or array.
+        the column name, or an array of keys with one entry per row, to group the periods by\n
+    `name` : str.
+        the name of the group column in the result. defaults to `year`\n
+    `starting_balance` : str.
+        the column holding each period's starting balance. defaults to `startingBalance`\n
+    `ending_balance` : str.
+        the column holding each period's ending balance. defaults to `endingBalance`\n
+    `totals` : dict or None.
+        source column to result column mapping of the columns to sum. defaults to `{}`
+
+    Returns
+    ----------
+    `pandas.DataFrame` with `name`, `starting_balance`, `ending_balance` and the `totals` columns, one row per group
+
+    Examples
+    ----------
+    A monthly `loan_payments_calc_as_table` schedule can be broken down by year with
+    `schedule_breakdown(df, by=(df["month"] - 1) // 12 + 1, starting_balance="initialBalance")`
+    """
+    totals = totals if totals is not None else {}
+    keys = df[by] if isinstance(by, str) else pd.Series(np.asarray(by), index=df.index)
+
+    aggregations = {
+        starting_balance: pd.NamedAgg(column=starting_balance, aggfunc="first"),
+        ending_balance: pd.NamedAgg(column=ending_balance, aggfunc="last"),
+    }
+    for column, total_column in totals.items():
+        aggregations[total_column] = pd.NamedAgg(column=column, aggfunc="sum")
+
+    breakdown_df = df.groupby(keys.rename(name), sort=False).agg(**aggregations)
+    breakdown_df.reset_index(inplace=True)
+    return breakdown_df
+
+
+def loan_payments_calc_summary(
+    loan_amounts,
+    numbers_of_years,
+    rates_of_interest,
+    frequencies) -> dict:
+    """
+    Calculate the payment, total payments and total interest of many loans at once, without building their tables
+
+    Parameters
+    ----------
+    `loan_amounts` : list or array.
+        loan amounts\n
+    `numbers_of_years` : list or array.
+        number of years of each loan\n
+    `rates_of_interest` : list or array.
+        annual interest rate of each loan. e.g. `4.5` for 4.5%\n
+    `frequencies` : list or str.
+        payment frequency of each loan, or one frequency for all of them. e.g. `monthly`
+
+    Returns
+    ----------
+    `dict` of `numpy.ndarray` with `payment`, `totalPayments` and `totalInterest`
+
+    Notes
+    ----------
+    Total payments are `payment * nper` and total interest is `payment * nper - loan_amount`
+    """
+    loan_amounts = np.asarray(loan_amounts, dtype=float)
+    numbers_of_years = np.asarray(numbers_of_years, dtype=float)
+    rates_of_interest = np.asarray(rates_of_interest, dtype=float)
+    if np.any((rates_of_interest < 0) | (rates_of_interest > 100)):
+        raise Exception("number can't be less than 0 or bigger than 100")
+    frequencies = [frequencies] if isinstance(frequencies, str) else frequencies
+    frequencies_int = np.array([convert_frequency(f, as_int=True) for f in frequencies], dtype=float)
+
+    nper = numbers_of_years * frequencies_int
+    payment = npf.pmt(rate=(rates_of_interest / 100) / frequencies_int, nper=nper, pv=-loan_amounts)
+    total_payments = payment * nper
+
+    return {
+        "payment": np.round(payment, _round_dig),
+        "totalPayments": np.round(total_payments, _round_dig),
+        "totalInterest": np.round(total_payments - loan_amounts, _round_dig),
+    }
+
+
 # calculates new loan payments based on the new_ input
 def loan_payments_calc_custom_stats(loan_amount, number_of_years, rate_of_interest, frequency="monthly",
     new_loan_amount=None,
     new_number_of_years=None,
     new_rate_of_interest=None,
     new_frequency=None):
-    payments_df = loan_payments_calc_as_table(loan_amount, number_of_years, rate_of_interest, frequency)
-
     updated_loan_amount = new_loan_amount if new_loan_amount != None else loan_amount
     updated_number_of_years= new_number_of_years if new_number_of_years != None else number_of_years
     updated_rate_of_interest = new_rate_of_interest if new_rate_of_interest != None else rate_of_interest
     updated_frequency = new_frequency if new_frequency != None else frequency
 
-    updated_payments_df = loan_payments_calc_as_table(updated_loan_amount, 
-        updated_number_of_years, 
-        updated_rate_of_interest, 
-        updated_frequency)
+    summary = loan_payments_calc_summary(
+        [loan_amount, updated_loan_amount],
+        [number_of_years, updated_number_of_years],
+        [rate_of_interest, updated_rate_of_interest],
+        [frequency, updated_frequency])
 
     data = {
         "loan": [loan_amount, updated_loan_amount],
         "interest": [rate_of_interest, updated_rate_of_interest],
         "years": [number_of_years, updated_number_of_years],
         "frequency": [frequency, updated_frequency],
-        "totalInterest": [payments_df["interest"].sum(), updated_payments_df["interest"].sum()],
-        "totalPayments": [payments_df["payment"].sum(), updated_payments_df["payment"].sum()],
+        "totalInterest": summary["totalInterest"],
+        "totalPayments": summary["totalPayments"],
         "description": ["original loan payments", "updated loan payments"]
     }
 
@@ -151,7 +386,7 @@ def loan_payments_calc_custom_multiple_stats(loan_amount, number_of_years, rate_
     new_number_of_years=None,
     new_rate_of_interests=None,
     new_frequencies=None):
-    if type(new_loan_amounts) is not list or type(new_number_of_years) is not list or type(new_rate_of_interests) is not list or type(new_frequencies) is not list:
+    if not all(isinstance(l, (list, np.ndarray)) for l in [new_loan_amounts, new_number_of_years, new_rate_of_interests, new_frequencies]):
         raise ValueError("new_* params must all be lists")
     
     it = iter([new_loan_amounts, new_number_of_years, new_rate_of_interests, new_frequencies])
@@ -159,32 +394,22 @@ def loan_payments_calc_custom_multiple_stats(loan_amount, number_of_years, rate_
     if not all(len(l) == the_len for l in it):
         raise ValueError("not all new_* lists have same length")
 
-    payments_df = loan_payments_calc_as_table(loan_amount, number_of_years, rate_of_interest, frequency)
+    loans = [loan_amount] + list(new_loan_amounts)
+    interests = [rate_of_interest] + list(new_rate_of_interests)
+    years = [number_of_years] + list(new_number_of_years)
+    frequencies = [frequency] + list(new_frequencies)
+    summary = loan_payments_calc_summary(loans, years, interests, frequencies)
 
     data = {
-        "loan": [loan_amount],
-        "interest": [rate_of_interest],
-        "years": [number_of_years],
-        "frequency": [frequency],
-        "totalInterest": [payments_df["interest"].sum()],
-        "totalPayments": [payments_df["payment"].sum()],
-        "description": ["original loan payments"]
+        "loan": loans,
+        "interest": interests,
+        "years": years,
+        "frequency": frequencies,
+        "totalInterest": summary["totalInterest"],
+        "totalPayments": summary["totalPayments"],
+        "description": ["original loan payments"] + ["updated loan payments"] * the_len
     }
 
-    for i in range(0, len(new_loan_amounts)):
-        updated_payments_df = loan_payments_calc_as_table(new_loan_amounts[i], 
-            new_number_of_years[i], 
-            new_rate_of_interests[i], 
-            new_frequencies[i])
-
-        data["loan"].append(new_loan_amounts[i])
-        data["interest"].append(new_rate_of_interests[i])
-        data["years"].append(new_number_of_years[i])
-        data["frequency"].append(new_frequencies[i])
-        data["totalInterest"].append(updated_payments_df["interest"].sum())
-        data["totalPayments"].append(updated_payments_df["payment"].sum())
-        data["description"].append("updated loan payments")
-
     data_df = pd.DataFrame(data, columns=["loan", "interest", "years", "frequency", "totalInterest", "totalPayments", "description"])
     return data_df
 
@@ -206,8 +431,9 @@ def doubling_time_with_continuous_compounding(rate_of_interest, frequency="yearl
 # Asset breakdown
 # - Takes in a ComparableAsset and generates future values (fv) for different scenarios
 # - For more information on each one, look at aiof.data.asset.Comparable class
+# - as_json: whether the breakdowns are JSON records or pandas.DataFrame
 # Returns: aiof.data.asset.ComparableAsset with all fields populated
-def asset_breakdown(asset: ComparableAsset):
+def asset_breakdown(asset: ComparableAsset, as_json: bool = True):
     asset.init_values()
     rate = ((asset.interest - asset.investmentFees - asset.taxDrag) / 100) / asset.frequency
     hys_rate = (asset.hysInterest / 100) / asset.frequency
@@ -229,7 +455,7 @@ def asset_breakdown(asset: ComparableAsset):
         contribution=0,
         years=asset.years,
         rate=rate,
-        frequency=asset.frequency).to_dict('records')
+        frequency=asset.frequency)
 
     asset.marketWithContributionValue = round(fv_with_contribution_end, _round_dig)
     asset.marketBeginWithContributionValue = round(fv_with_contribution_begin, _round_dig)
@@ -238,7 +464,7 @@ def asset_breakdown(asset: ComparableAsset):
         contribution=asset.contribution,
         years=asset.years,
         rate=rate,
-        frequency=asset.frequency).to_dict('records')
+        frequency=asset.frequency)
 
     asset.hysValue = round(hys_fv_end, _round_dig)
     asset.hysBeginValue = round(hys_fv_begin, _round_dig)
@@ -247,7 +473,7 @@ def asset_breakdown(asset: ComparableAsset):
         contribution=0,
         years=asset.years,
         rate=hys_rate,
-        frequency=asset.frequency).to_dict('records')
+        frequency=asset.frequency)
 
     asset.hysWithContributionValue = round(hys_fv_with_contribution_end, _round_dig)
     asset.hysBeginWithContributionValue = round(hys_fv_with_contribution_begin, _round_dig)
@@ -256,11 +482,29 @@ def asset_breakdown(asset: ComparableAsset):
         contribution=asset.contribution,
         years=asset.years,
         rate=hys_rate,
-        frequency=asset.frequency).to_dict('records')
+        frequency=asset.frequency)
+
+    if as_json:
+        asset.marketValueBreakdown = asset.marketValueBreakdown.to_dict('records')
+        asset.marketWithContributionValueBreakdown = asset.marketWithContributionValueBreakdown.to_dict('records')
+        asset.hysValueBreakdown = asset.hysValueBreakdown.to_dict('records')
+        asset.hysWithContributionValueBreakdown = asset.hysWithContributionValueBreakdown.to_dict('records')
 
     return asset
 
 
+# Asset breakdown as one table
+# - Stacks the breakdowns of an aiof.data.asset.ComparableAsset returned by asset_breakdown(as_json=False),
+#   with a `breakdown` column naming each one
+def asset_breakdown_as_table(asset: ComparableAsset) -> pd.DataFrame:
+    return pd.concat([getattr(asset, name).assign(breakdown=name) for name in [
+        "marketValueBreakdown",
+        "marketWithContributionValueBreakdown",
+        "hysValueBreakdown",
+        "hysWithContributionValueBreakdown"
+    ]], ignore_index=True)
+
+
 # Future value (fv) as a pandas.DataFrame table
 # - Takes in the inputs and breaks down the future value (fv) for each year
 def asset_fv_breakdown_as_table(
@@ -270,32 +514,197 @@ def asset_fv_breakdown_as_table(
     rate,
     frequency,
     when="end"):
-    df = pd.DataFrame(np.zeros((years, 4)))
-    df.columns = ["year", "contribution", "rate", "value"]
-    asset_breakdown = -npf.fv(
-        rate=rate, 
-        nper=np.arange(frequency, ((years + 1) * frequency), frequency),
-        pmt=contribution,
-        pv=asset_value,
-        when=when)
-    for i in range(0, years):
-        df.iloc[i, 0] = i + 1
-        df.iloc[i, 1] = contribution
-        df.iloc[i, 2] = rate
-        df.iloc[i, 3] = asset_breakdown[i]
-    df = df.round({"contribution": _round_dig, "rate": 4, "value": _round_dig})
-    df["year"] = df["year"].astype(int)
-    return df
+    return asset_fv_schedule(asset_value, contribution, years, rate, frequency, when).to_df()
+
+
+# Future value (fv) breakdown as a lazy aiof.schedule.Schedule
+# - Each year's value is computed directly, so any years can be computed without the ones before them
+def asset_fv_schedule(
+    asset_value,
+    contribution,
+    years,
+    rate,
+    frequency,
+    when="end") -> Schedule:
+    def table(periods):
+        df = pd.DataFrame({
+            "year": periods,
+            "contribution": float(contribution),
+            "rate": float(rate),
+            "value": -npf.fv(
+                rate=rate,
+                nper=periods * frequency,
+                pmt=contribution,
+                pv=asset_value,
+                when=when),
+        })
+        return df.round({"contribution": _round_dig, "rate": 4, "value": _round_dig})
+    return Schedule(table, years)
+
+
+# pandas.DataFrame as JSON records or columns
+def df_to_columns(df: pd.DataFrame) -> dict:
+    """
+    Convert a pandas.DataFrame to columns of JSON, `{ column: [values] }`
+
+    Notes
+    ----------
+    Every column is converted straight from its array, with no per-row dict. Datetime columns become `datetime` objects,
+    so they are encoded the same as in `to_dict(orient="records")`
+    """
+    columns = {}
+    for name in df.columns:
+        column = df[name]
+        if pd.api.types.is_datetime64_any_dtype(column.dtype):
+            columns[name] = pd.DatetimeIndex(column).to_pydatetime().tolist()
+        else:
+            columns[name] = column.to_numpy().tolist()
+    return columns
+
+
+def df_to_json(df: pd.DataFrame, as_columns: bool = False):
+    """
+    Convert a pandas.DataFrame to JSON, either as records, `[{ column: value }]`, or as columns, `{ column: [values] }`
+    """
+    return df.to_dict(orient="records") if not as_columns else df_to_columns(df)
+
+
+def records_from_columns(columns: dict) -> list:
+    """
+    Convert columns of JSON, `{ column: [values] }`, to records, `[{ column: value }]`
+    """
+    return [dict(zip(columns, row)) for row in zip(*columns.values())]
 
 
 # Export to .csv
-# input: pandas DataFrame
-# output: csv bytes
-# can/will be used in FastAPI StreamResponse
-def export_to_csv(df):
-    stream = io.StringIO()
-    df.to_csv(stream, index=False)
-    return iter([stream.getvalue()])
+def export_to_csv(table, chunk_rows: int = None):
+    """
+    Export a table as CSV, one block of rows at a time
+
+    Parameters
+    ----------
+    `table` : pandas.DataFrame or iterable of pandas.DataFrame.
+        the table to export, or its blocks of rows in order, e.g. `loan_payments_calc_as_chunks`\n
+    `chunk_rows` : int or None.
+        rows per block a pandas.DataFrame `table` is split into. defaults to `Settings.ExportChunkRows`
+
+    Returns
+    ----------
+    generator of `str`, the header with the first block and then one block at a time.
+    can be used in FastAPI `StreamingResponse`
+
+    Notes
+    ----------
+    Blocks are only built when the previous one has been sent, so a generator `table` is exported in constant memory
+    """
+    chunk_rows = chunk_rows if chunk_rows is not None else _export_chunk_rows
+
+    if chunk_rows <= 0:
+        raise ValueError("Chunk rows must be bigger than 0")
+    if isinstance(table, pd.DataFrame):
+        df = table
+        table = (df.iloc[start:start + chunk_rows] for start in range(0, max(len(df), 1), chunk_rows))
+
+    def stream():
+        header = True
+        for chunk_df in table:
+            buffer = io.StringIO()
+            chunk_df.to_csv(buffer, index=False, header=header)
+            header = False
+            yield buffer.getvalue()
+    return stream()
+
+
+class _ChunkSink(io.RawIOBase):
+    """
+    Write-only file that keeps what is written until it is taken with `take`, so writers can be streamed
+    """
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self._chunks.append(bytes(b))
+        self._position += len(b)
+        return len(b)
+
+    def tell(self):
+        return self._position
+
+    def take(self) -> bytes:
+        chunk = b"".join(self._chunks)
+        self._chunks = []
+        return chunk
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ValueError("Arrow and Parquet exports require pyarrow to be installed")
+    return pyarrow
+
+
+def export_to_arrow(df: pd.DataFrame, chunk_rows: int = None):
+    """
+    Export a pandas.DataFrame as an Arrow IPC stream
+
+    Parameters
+    ----------
+    `df` : pandas.DataFrame.
+        the table to export\n
+    `chunk_rows` : int or None.
+        rows per record batch. defaults to `Settings.ExportChunkRows`
+
+    Returns
+    ----------
+    generator of `bytes`, one record batch at a time. can be used in FastAPI `StreamingResponse`
+    """
+    pa = _import_pyarrow()
+    chunk_rows = chunk_rows if chunk_rows is not None else _export_chunk_rows
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    def stream():
+        sink = _ChunkSink()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            for batch in table.to_batches(max_chunksize=chunk_rows):
+                writer.write_batch(batch)
+                yield sink.take()
+        yield sink.take()
+    return stream()
+
+
+def export_to_parquet(df: pd.DataFrame, chunk_rows: int = None):
+    """
+    Export a pandas.DataFrame as Parquet
+
+    Parameters
+    ----------
+    `df` : pandas.DataFrame.
+        the table to export\n
+    `chunk_rows` : int or None.
+        rows per row group. defaults to `Settings.ExportChunkRows`
+
+    Returns
+    ----------
+    generator of `bytes`, one row group at a time, followed by the footer. can be used in FastAPI `StreamingResponse`
+    """
+    pa = _import_pyarrow()
+    chunk_rows = chunk_rows if chunk_rows is not None else _export_chunk_rows
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    def stream():
+        sink = _ChunkSink()
+        with pa.parquet.ParquetWriter(sink, table.schema) as writer:
+            for start in range(0, max(table.num_rows, 1), chunk_rows):
+                writer.write_table(table.slice(start, chunk_rows))
+                yield sink.take()
+        yield sink.take()
+    return stream()
 
 
 def get_current_month_first() -> datetime:
@@ -1,13 +1,114 @@
 import datetime
+import itertools
+import numpy as np
 import pandas as pd
-import numpy_financial as npf
 
 import aiof.config as config
+import aiof.compute as compute
+import aiof.helpers as helpers
+
+from aiof.data.property import MortgageCalculatorRequest, MortgageCalculatorGrid
+from aiof.schedule import Schedule
+
+from typing import List
 
 
 # Configs
 _settings = config.get_settings()
 _round_dig = _settings.DefaultRoundingDigit
+_batch_max_scenarios = _settings.MortgageBatchMaxScenarios
+
+
+def _mortgage_params(
+    property_value: float,
+    down_payment: float,
+    interest_rate: float,
+    loan_term_years: int,
+    start_date: datetime,
+    pmi: float,
+    property_insurance: float,
+    monthly_hoa: float) -> tuple:
+    """
+    Fill in the mortgage defaults and validate the parameters
+
+    Returns
+    ----------
+    `tuple` of the same parameters, with `interest_rate` and `pmi` converted to decimals
+    """
+    # Check for None
+    property_value      = property_value if property_value is not None else 300000
+    down_payment        = down_payment if down_payment is not None else 60000
+    interest_rate       = interest_rate if interest_rate is not None else 3.8
+    loan_term_years     = loan_term_years if loan_term_years is not None else 30
+    start_date          = start_date if start_date is not None else datetime.datetime.utcnow()
+    pmi                 = pmi if pmi is not None else 0.5
+    property_insurance  = property_insurance if property_insurance is not None else 1000
+    monthly_hoa         = monthly_hoa if monthly_hoa is not None else 0
+
+    # Check and fix parameters
+    interest_rate = interest_rate / 100
+    pmi = pmi / 100
+    loan_amount = property_value - down_payment
+    
+    # Validation
+    if loan_amount < 0:
+        raise ValueError("Loan Amount (property value minus down payment) cannot be negative")
+    elif down_payment < 0:
+        raise ValueError("Down payment cannot be negative")
+    elif loan_term_years <= 0 or loan_term_years > 100:
+        raise ValueError("Loan term years must be between 1 and 100")
+    elif interest_rate > 1 or interest_rate < 0:
+        raise ValueError("Interest rate cannot be negative or bigger than 100%")
+    elif pmi > 1 or pmi < 0:
+        raise ValueError("PMI rate cannot be negative or bigger than 100%")
+    elif property_insurance < 0:
+        raise ValueError("Property insurance cannot be negative")
+    elif monthly_hoa < 0:
+        raise ValueError("Monthly HOA cannot be negative")
+
+    return property_value, down_payment, interest_rate, loan_term_years, start_date, pmi, property_insurance, monthly_hoa
+
+
+def _payment_dates(start_date: datetime, periods) -> pd.DatetimeIndex:
+    """
+    Dates of the given 1-based monthly payment periods. Payments are due on the first of the month,
+    the same as `pd.date_range(start_date, periods=nper, freq="MS")[periods - 1]`
+    """
+    first = pd.date_range(start_date, periods=1, freq="MS")[0]
+    first_naive = first.tz_localize(None)
+    time_of_day = (first_naive - first_naive.normalize()).to_timedelta64()
+    months = first_naive.to_datetime64().astype("datetime64[M]") + (np.asarray(periods) - 1)
+    dates = pd.DatetimeIndex(months.astype("datetime64[ns]") + time_of_day)
+    return dates.tz_localize(first.tz) if first.tz is not None else dates
+
+
+def _mortgage_table(
+    loan_amount: float,
+    rate: float,
+    nper: int,
+    start_date: datetime,
+    periods) -> pd.DataFrame:
+    """
+    Rows of the given 1-based periods of a mortgage schedule, computed directly with `aiof.helpers.amortization_calc`
+    """
+    schedule = helpers.amortization_calc(loan_amount, rate, nper, periods=periods)
+    df = pd.DataFrame({
+        "paymentDate": _payment_dates(start_date, periods),
+        "payment": schedule["payment"],
+        "principalPaid": schedule["principal"],
+        "interestPaid": schedule["interest"],
+        "startingBalance": schedule["startingBalance"],
+        "endingBalance": schedule["endingBalance"],
+    }, index=pd.Index(periods, name="period"))
+    return df.round(_round_dig)
+
+
+def _mortgage_schedule(
+    loan_amount: float,
+    rate: float,
+    nper: int,
+    start_date: datetime) -> Schedule:
+    return Schedule(lambda periods: _mortgage_table(loan_amount, rate, nper, start_date, periods), nper)
 
 
 def mortgage_calc(
@@ -19,7 +120,11 @@ def mortgage_calc(
     pmi: float = None,
     property_insurance: float = None,
     monthly_hoa: float = None,
-    as_json: bool = False):
+    include_breakdown: bool = False,
+    offset: int = None,
+    limit: int = None,
+    as_json: bool = False,
+    as_columns: bool = False):
     """
     Calculate mortgage
 
@@ -41,89 +146,201 @@ def mortgage_calc(
         annual property insurance. defaults to `1000`\n
     `monthly_hoa` : float.
         monthly hoa dues. defaults to `0`\n
+    `include_breakdown` : bool.
+        whether to return `{ "data", "breakdown" }` with the yearly breakdown instead of only the schedule.
+        always `True` when `as_json` or paginated. defaults to `False`\n
+    `offset` : int or None.
+        0-based payment the page of the schedule starts at. if `offset` or `limit` is set, only that page and its
+        yearly breakdown are computed and a `page` with the `offset`, `limit` and `total` is included, see
+        `aiof.schedule.Schedule.page`. defaults to `None`\n
+    `limit` : int or None.
+        most payments in the page. defaults to `None`\n
     `as_json` : bool.
         whether to return the pandas.DataFrame as JSON. defaults to `False`\n
+    `as_columns` : bool.
+        whether JSON is returned as columns, `{ column: [values] }`, instead of records. defaults to `False`
 
     Notes
     ----------
     Based on https://www.mortgagecalculator.org/
     """
-    # Check for None
-    property_value      = property_value if property_value is not None else 300000
-    down_payment        = down_payment if down_payment is not None else 60000
-    interest_rate       = interest_rate if interest_rate is not None else 3.8
-    loan_term_years     = loan_term_years if loan_term_years is not None else 30
-    start_date          = start_date if start_date is not None else datetime.datetime.utcnow()
-    pmi                 = pmi if pmi is not None else 0.5
-    property_insurance  = property_insurance if property_insurance is not None else 1000
-    monthly_hoa         = monthly_hoa if monthly_hoa is not None else 0
-
-    # Check and fix parameters
-    interest_rate = interest_rate / 100
-    pmi = pmi / 100
+    property_value, down_payment, interest_rate, loan_term_years, start_date, pmi, property_insurance, monthly_hoa = _mortgage_params(
+        property_value, down_payment, interest_rate, loan_term_years, start_date, pmi, property_insurance, monthly_hoa)
     payments_per_year = 12
     loan_amount = property_value - down_payment
-    
-    # Validation
-    if loan_amount < 0:
-        raise ValueError("Loan Amount (property value minus down payment) cannot be negative")
-    elif down_payment < 0:
-        raise ValueError("Down payment cannot be negative")
-    elif loan_term_years < 0 or loan_term_years > 100:
-        raise ValueError("Loan term years must be between 1 and 100")
-    elif interest_rate > 1 or interest_rate < 0:
-        raise ValueError("Interest rate cannot be negative or bigger than 100%")
-    elif pmi > 1 or pmi < 0:
-        raise ValueError("PMI rate cannot be negative or bigger than 100%")
-    elif property_insurance < 0:
-        raise ValueError("Property insurance cannot be negative")
-    elif monthly_hoa < 0:
-        raise ValueError("Monthly HOA cannot be negative")
 
-
-    # Create and initially populate the data frame
-    rng = pd.date_range(start_date, periods=loan_term_years * payments_per_year, freq="MS")
-    rng.name = "paymentDate"
-    df = pd.DataFrame(index=rng, columns=["payment", "principalPaid", "interestPaid", "startingBalance", "endingBalance"], dtype="float")
-    df.reset_index(inplace=True)
-    df.index += 1
-    df.index.name = "period"
-
-    df["payment"] = -npf.pmt(interest_rate / 12, loan_term_years * payments_per_year, loan_amount)
-    df["principalPaid"] = -npf.ppmt(interest_rate / payments_per_year, df.index, loan_term_years * payments_per_year, loan_amount)
-    df["interestPaid"] = -npf.ipmt(interest_rate / payments_per_year, df.index, loan_term_years * payments_per_year, loan_amount)
-    
-    # Populate the first ending balance, then the rest
-    df["endingBalance"] = 0
-    df.loc[1, "startingBalance"] = loan_amount
-    df.loc[1, "endingBalance"] = loan_amount - df.loc[1, "principalPaid"]
-    for period in range(2, len(df) + 1):
-        prev_balance = df.loc[period - 1, "endingBalance"]
-        principal_paid = df.loc[period, "principalPaid"]
-
-        df.loc[period, "startingBalance"] = prev_balance
-        if prev_balance == 0:
-            df.loc[period, ["payment", "principalPaid", "interestPaid", "startingBalance", "endingBalance"]] == 0
-            continue
-        elif principal_paid <= prev_balance:
-            df.loc[period, "endingBalance"] = prev_balance - principal_paid   
-    df = df.round(_round_dig)
+    # Compute the whole schedule in one pass, or only the requested page, as a data frame
+    schedule = _mortgage_schedule(loan_amount, interest_rate / payments_per_year, loan_term_years * payments_per_year, start_date)
+    paginated = offset is not None or limit is not None
+    if paginated:
+        page = schedule.pagination(offset, limit)
+        df = schedule.page(offset, limit)
+    else:
+        df = schedule.to_df()
 
     # Calculate yearly breakdown
-    breakdown_df = df.copy()
-    breakdown_df["year"] = breakdown_df["paymentDate"].dt.year
-    unique_years = breakdown_df["year"].unique()
-    year_dfs = [breakdown_df[breakdown_df["year"] == y] for y in unique_years]
-    
-    total_df = pd.DataFrame(index=unique_years.tolist(), columns=["year", "startingBalance", "endingBalance", "totalPayment", "totalPrincipalPaid", "totalInterestPaid"], dtype="float")
-    for year_df in year_dfs:
-        total_df.loc[year_df.iloc[0]["year"]]["year"] = year_df.iloc[0]["year"]
-        total_df.loc[year_df.iloc[0]["year"]]["startingBalance"] = year_df.iloc[0]["startingBalance"]
-        total_df.loc[year_df.iloc[0]["year"]]["endingBalance"] = year_df.iloc[len(year_df) - 1]["endingBalance"]
-        total_df.loc[year_df.iloc[0]["year"]]["totalPayment"] = year_df["payment"].sum()
-        total_df.loc[year_df.iloc[0]["year"]]["totalPrincipalPaid"] = year_df["principalPaid"].sum()
-        total_df.loc[year_df.iloc[0]["year"]]["totalInterestPaid"] = year_df["interestPaid"].sum()
+    total_df = helpers.schedule_breakdown(
+        df,
+        by      = df["paymentDate"].dt.year,
+        totals  = {
+            "payment": "totalPayment",
+            "principalPaid": "totalPrincipalPaid",
+            "interestPaid": "totalInterestPaid"
+        })
     total_df["year"] = total_df["year"].astype(int)
     total_df = total_df.round(_round_dig)
 
-    return df if not as_json else { "data": df.to_dict(orient="records"), "breakdown": total_df.to_dict(orient="records") }
+    if not as_json and not include_breakdown and not paginated:
+        return df
+    resp = {
+        "data": df if not as_json else helpers.df_to_json(df, as_columns),
+        "breakdown": total_df if not as_json else helpers.df_to_json(total_df, as_columns)
+    }
+    if paginated:
+        resp["page"] = page
+    return resp
+
+
+def mortgage_schedule(
+    property_value: float = None,
+    down_payment: float = None,
+    interest_rate: float = None,
+    loan_term_years: int = None,
+    start_date: datetime = None,
+    pmi: float = None,
+    property_insurance: float = None,
+    monthly_hoa: float = None) -> Schedule:
+    """
+    The `mortgage_calc` schedule as a lazy `aiof.schedule.Schedule`, whose periods are only computed when they are consumed.
+    See `mortgage_calc` for the parameters and their defaults
+
+    Examples
+    ----------
+    `mortgage_schedule()[119:180]` computes the payments of the 11th through the 15th year only
+    """
+    property_value, down_payment, interest_rate, loan_term_years, start_date, pmi, property_insurance, monthly_hoa = _mortgage_params(
+        property_value, down_payment, interest_rate, loan_term_years, start_date, pmi, property_insurance, monthly_hoa)
+    payments_per_year = 12
+    loan_amount = property_value - down_payment
+
+    return _mortgage_schedule(loan_amount, interest_rate / payments_per_year, loan_term_years * payments_per_year, start_date)
+
+
+def mortgage_calc_batch(
+    scenarios: List[MortgageCalculatorRequest] = None,
+    grid: MortgageCalculatorGrid = None,
+    start_date: datetime = None,
+    include_schedules: bool = False,
+    as_json: bool = False,
+    as_columns: bool = False) -> dict:
+    """
+    Calculate many mortgages at once
+
+    Parameters
+    ----------
+    `scenarios` : List[MortgageCalculatorRequest] or None.
+        explicit list of mortgages to calculate\n
+    `grid` : MortgageCalculatorGrid or None.
+        lists of values whose cartesian product is added to `scenarios`\n
+    `start_date` : datetime or None.
+        start date for scenarios that don't specify one. defaults to `datetime.datetime.utcnow()`\n
+    `include_schedules` : bool.
+        whether to return every scenario's full schedule in addition to its summary. defaults to `False`\n
+    `as_json` : bool.
+        whether to return the pandas.DataFrame results as JSON. defaults to `False`\n
+    `as_columns` : bool.
+        whether JSON is returned as columns, `{ column: [values] }`, instead of records. defaults to `False`
+
+    Notes
+    ----------
+    The summary totals are computed analytically, `monthlyPayment * periods`, without any schedule. With `include_schedules`
+    every schedule is computed together as one `(scenarios, periods)` array, see `aiof.helpers.amortization_calc`,
+    and grids bigger than `Settings.ComputeChunkSize` are split into shards that run on the shared thread pool.
+    If neither `scenarios` nor `grid` is provided, the default mortgage is calculated
+    """
+    reqs = list(scenarios) if scenarios is not None else []
+    if grid is not None or len(reqs) == 0:
+        grid = grid if grid is not None else MortgageCalculatorGrid()
+        for property_value, down_payment, interest_rate, loan_term_years in itertools.product(
+            grid.propertyValues or [None],
+            grid.downPayments or [None],
+            grid.interestRates or [None],
+            grid.loanTermYears or [None]):
+            reqs.append(MortgageCalculatorRequest(
+                propertyValue   = property_value,
+                downPayment     = down_payment,
+                interestRate    = interest_rate,
+                loanTermYears   = loan_term_years))
+    if len(reqs) > _batch_max_scenarios:
+        raise ValueError(f"Number of scenarios cannot be bigger than {_batch_max_scenarios}")
+
+    start_date = start_date if start_date is not None else datetime.datetime.utcnow()
+    params = [_mortgage_params(
+        property_value      = req.propertyValue,
+        down_payment        = req.downPayment,
+        interest_rate       = req.interestRate,
+        loan_term_years     = req.loanTermYears,
+        start_date          = req.startDate if req.startDate is not None else start_date,
+        pmi                 = req.pmi,
+        property_insurance  = req.propertyInsurance,
+        monthly_hoa         = req.monthlyHoa) for req in reqs]
+
+    property_values = np.array([p[0] for p in params], dtype=float)
+    down_payments = np.array([p[1] for p in params], dtype=float)
+    interest_rates = np.array([p[2] for p in params], dtype=float)
+    loan_term_years = np.array([p[3] for p in params], dtype=int)
+    start_dates = pd.DatetimeIndex([pd.Timestamp(p[4]).replace(tzinfo=None) for p in params])
+    payments_per_year = 12
+    loan_amounts = property_values - down_payments
+    npers = loan_term_years * payments_per_year
+
+    # Payments are due on the first of the month, see `pd.date_range(..., freq="MS")`
+    months = start_dates.values.astype("datetime64[M]")
+    time_of_day = start_dates.values - start_dates.normalize().values
+    first_months = months + np.where(start_dates.day == 1, 0, 1)
+    first_payment_dates = first_months.astype("datetime64[ns]") + time_of_day
+    last_payment_dates = (first_months + np.maximum(npers - 1, 0)).astype("datetime64[ns]") + time_of_day
+
+    # The totals are computed analytically from the monthly payment, as every payment is the same rounded amount
+    payments = helpers.amortization_calc(loan_amounts, interest_rates / payments_per_year, npers, periods=np.array([1]))["payment"][:, 0]
+    payments = np.round(payments, _round_dig)
+    total_payments = payments * npers
+
+    summary_df = pd.DataFrame({
+        "propertyValue": property_values,
+        "downPayment": down_payments,
+        "loanAmount": loan_amounts,
+        "interestRate": interest_rates * 100,
+        "loanTermYears": loan_term_years,
+        "startDate": first_payment_dates,
+        "payoffDate": last_payment_dates,
+        "monthlyPayment": payments,
+        "totalPayment": total_payments,
+        "totalPrincipalPaid": loan_amounts,
+        "totalInterestPaid": total_payments - loan_amounts,
+    })
+    summary_df = summary_df.round(_round_dig)
+
+    resp = { "summary": summary_df if not as_json else helpers.df_to_json(summary_df, as_columns) }
+    if include_schedules:
+        # Compute all schedules as one (scenarios, periods) array, sharded across cores for large grids
+        periods = np.arange(1, npers.max(initial=0) + 1)
+        parts = compute.map_chunks(helpers.amortization_calc, [
+            (loan_amounts[s], interest_rates[s] / payments_per_year, npers[s], periods) for s in compute.shards(len(npers))],
+            executor="thread")
+        schedule = { k: np.round(np.concatenate([p[k] for p in parts]), _round_dig) for k in parts[0] }
+
+        schedules = []
+        for i, nper in enumerate(npers):
+            df = pd.DataFrame({
+                "paymentDate": pd.date_range(first_payment_dates[i], periods=nper, freq="MS"),
+                "payment": schedule["payment"][i, :nper],
+                "principalPaid": schedule["principal"][i, :nper],
+                "interestPaid": schedule["interest"][i, :nper],
+                "startingBalance": schedule["startingBalance"][i, :nper],
+                "endingBalance": schedule["endingBalance"][i, :nper],
+            }, index=pd.RangeIndex(1, nper + 1, name="period"))
+            schedules.append(df if not as_json else helpers.df_to_json(df, as_columns))
+        resp["schedules"] = schedules
+
+    return resp
@@ -1,35 +1,32 @@
 import datetime
-from numpy.lib.financial import pmt
+import itertools
+import numpy as np
 import pandas as pd
-import numpy_financial as npf
 
 import aiof.config as config
+import aiof.compute as compute
+import aiof.helpers as helpers
 
-from aiof.helpers import fv
+from typing import List
 
 
 # Configs
 _settings = config.get_settings()
 _default_interest = _settings.DefaultInterest
 _round_dig = _settings.DefaultRoundingDigit
+_batch_max_strategies = _settings.WithdrawalBatchMaxStrategies
 
 
-def withdrawal_calc(
-    retirement_number: float = None,
-    take_out_percentage: float = None,
-    number_of_years: int = None,
-    as_json: bool = False) -> pd.DataFrame:
+def _withdrawal_params(
+    retirement_number: float,
+    take_out_percentage: float,
+    number_of_years: int) -> tuple:
     """
-    Calculate retirement
+    Fill in the withdrawal defaults and validate the parameters
 
-    Parameters
+    Returns
     ----------
-    `retirement_number` : float.
-        retirement number. defaults to `1,000,000`\n
-    `take_out_percentage` : float.
-        take out percentage of total retirement number. defaults to `3%`\n
-    `number_of_years` : int.
-        number of years to take money out. defaults to `35`
+    `tuple` of the same parameters, with `take_out_percentage` converted to a decimal
     """
     # Check for None
     retirement_number   = retirement_number if retirement_number is not None else 1000000
@@ -46,37 +43,176 @@ def withdrawal_calc(
     elif number_of_years <= 0 or number_of_years > 100:
         raise ValueError("Number of years must be between 1 and 100")
 
-    # Initial data frame
-    df = pd.DataFrame(columns=["year", "takeOutPercentage", "startingRetirementNumber", "withdrawal", "endingRetirementNumber"], dtype="float")
+    return retirement_number, take_out_percentage, int(number_of_years)
+
 
-    withdrawal = retirement_number * take_out_percentage
+def withdrawal_arrays(
+    retirement_numbers,
+    take_out_percentages,
+    number_of_years: int,
+    interest: float = None) -> dict:
+    """
+    Calculate the drawdown path of many retirement numbers and take out percentages at once
+
+    Parameters
+    ----------
+    `retirement_numbers` : array.
+        starting retirement numbers\n
+    `take_out_percentages` : array.
+        take out percentages, as decimals. e.g. `0.03` for 3%\n
+    `number_of_years` : int.
+        number of years to take money out\n
+    `interest` : float or None.
+        yearly return on what is left after each withdrawal. defaults to `Settings.DefaultInterest`
+
+    Returns
+    ----------
+    `dict` of `numpy.ndarray` of `(strategies, years)` with `startingRetirementNumber`, `withdrawal` and `endingRetirementNumber`
+
+    Notes
+    ----------
+    Each year the withdrawal is taken out first and the rest grows by `interest`, so the ending retirement number
+    after `k` years is `R * g^k - w * g * (g^k - 1) / (g - 1)` where `g = 1 + interest`
+    """
+    interest = interest if interest is not None else _default_interest
+    growth = 1 + interest / 100
+
+    retirement_numbers = np.asarray(retirement_numbers, dtype=float)[:, np.newaxis]
+    withdrawals = retirement_numbers * np.asarray(take_out_percentages, dtype=float)[:, np.newaxis]
+    years = np.arange(1, number_of_years + 1)[np.newaxis, :]
+
+    compounded = growth ** years
+    if growth == 1:
+        ending = retirement_numbers - withdrawals * years
+    else:
+        ending = retirement_numbers * compounded - withdrawals * growth * (compounded - 1) / (growth - 1)
+    starting = np.concatenate([retirement_numbers, ending[:, :-1]], axis=1)
+
+    return {
+        "startingRetirementNumber": starting,
+        "withdrawal": np.broadcast_to(withdrawals, ending.shape),
+        "endingRetirementNumber": ending,
+    }
+
+
+def withdrawal_calc(
+    retirement_number: float = None,
+    take_out_percentage: float = None,
+    number_of_years: int = None,
+    as_json: bool = False,
+    as_columns: bool = False) -> pd.DataFrame:
+    """
+    Calculate retirement
 
-    df.loc[0, "year"] = 1
-    df.loc[0, "takeOutPercentage"] = take_out_percentage
-    df.loc[0, "startingRetirementNumber"] = retirement_number
-    df.loc[0, "withdrawal"] = withdrawal
-    df.loc[0, "endingRetirementNumber"] =-npf.fv(
-            rate=_default_interest / 100,
-            nper=1,
-            pmt=0,
-            pv=retirement_number - withdrawal,
-            when='end')
+    Parameters
+    ----------
+    `retirement_number` : float.
+        retirement number. defaults to `1,000,000`\n
+    `take_out_percentage` : float.
+        take out percentage of total retirement number. defaults to `3%`\n
+    `number_of_years` : int.
+        number of years to take money out. defaults to `35`\n
+    `as_json` : bool.
+        whether to return the pandas.DataFrame as JSON. defaults to `False`\n
+    `as_columns` : bool.
+        whether JSON is returned as columns, `{ column: [values] }`, instead of records. defaults to `False`
+    """
+    retirement_number, take_out_percentage, number_of_years = _withdrawal_params(
+        retirement_number, take_out_percentage, number_of_years)
 
     if take_out_percentage == 0.1:
-        return df if not as_json else df.to_dict(orient="records")
-
-    for year in range(1, int(number_of_years)):
-        df.loc[year, "year"] = year + 1
-        df.loc[year, "takeOutPercentage"] = take_out_percentage
-        df.loc[year, "startingRetirementNumber"] = df.loc[year - 1, "endingRetirementNumber"]
-        df.loc[year, "withdrawal"] = withdrawal
-        df.loc[year, "endingRetirementNumber"] = -npf.fv(
-            rate=_default_interest / 100,
-            nper=1,
-            pmt=0,
-            pv=df.loc[year, "startingRetirementNumber"] - df.loc[year, "withdrawal"],
-            when='end')
-    df["year"] = df["year"].astype(int)
+        number_of_years = 1
+
+    drawdown = withdrawal_arrays([retirement_number], [take_out_percentage], number_of_years)
+    df = pd.DataFrame({
+        "year": np.arange(1, number_of_years + 1),
+        "takeOutPercentage": take_out_percentage,
+        "startingRetirementNumber": drawdown["startingRetirementNumber"][0],
+        "withdrawal": drawdown["withdrawal"][0],
+        "endingRetirementNumber": drawdown["endingRetirementNumber"][0],
+    })
     df = df.round(_round_dig)
 
-    return df if not as_json else df.to_dict(orient="records")
\ No newline at end of file
+    return df if not as_json else helpers.df_to_json(df, as_columns)
+
+
+def withdrawal_calc_batch(
+    retirement_numbers: List[float] = None,
+    take_out_percentages: List[float] = None,
+    number_of_years: int = None,
+    include_schedules: bool = False,
+    as_json: bool = False,
+    as_columns: bool = False) -> dict:
+    """
+    Compare many withdrawal strategies at once
+
+    Parameters
+    ----------
+    `retirement_numbers` : List[float] or None.
+        retirement numbers. defaults to `[1,000,000]`\n
+    `take_out_percentages` : List[float] or None.
+        take out percentages of total retirement number. defaults to `[3%]`\n
+    `number_of_years` : int.
+        number of years to take money out. defaults to `35`\n
+    `include_schedules` : bool.
+        whether to return every strategy's yearly drawdown in addition to its summary. defaults to `False`\n
+    `as_json` : bool.
+        whether to return the pandas.DataFrame results as JSON. defaults to `False`\n
+    `as_columns` : bool.
+        whether JSON is returned as columns, `{ column: [values] }`, instead of records. defaults to `False`
+
+    Notes
+    ----------
+    A strategy is calculated for every combination of `retirement_numbers` and `take_out_percentages`,
+    all of them together as one `(strategies, years)` array, see `withdrawal_arrays`
+    """
+    params = [_withdrawal_params(r, t, number_of_years) for r, t in itertools.product(
+        retirement_numbers or [None],
+        take_out_percentages or [None])]
+    if len(params) > _batch_max_strategies:
+        raise ValueError(f"Number of strategies cannot be bigger than {_batch_max_strategies}")
+
+    retirement_numbers = np.array([p[0] for p in params], dtype=float)
+    take_out_percentages = np.array([p[1] for p in params], dtype=float)
+    number_of_years = params[0][2]
+
+    # Large grids are split into shards that run on the shared thread pool
+    parts = compute.map_chunks(withdrawal_arrays, [
+        (retirement_numbers[s], take_out_percentages[s], number_of_years) for s in compute.shards(len(params))],
+        executor="thread")
+    drawdown = { k: np.concatenate([p[k] for p in parts]) for k in parts[0] }
+    ending = drawdown["endingRetirementNumber"]
+    depleted = ending < 0
+    depleted_year = np.where(depleted.any(axis=1), depleted.argmax(axis=1) + 1, 0)
+
+    summary_df = pd.DataFrame({
+        "retirementNumber": retirement_numbers,
+        "takeOutPercentage": take_out_percentages,
+        "withdrawal": drawdown["withdrawal"][:, 0],
+        "totalWithdrawal": drawdown["withdrawal"].sum(axis=1),
+        "endingRetirementNumber": ending[:, -1],
+        "depletedYear": pd.Series([int(y) if y > 0 else None for y in depleted_year], dtype=object),
+    })
+    summary_df = summary_df.round({
+        "retirementNumber": _round_dig,
+        "withdrawal": _round_dig,
+        "totalWithdrawal": _round_dig,
+        "endingRetirementNumber": _round_dig
+    })
+
+    resp = { "summary": summary_df if not as_json else helpers.df_to_json(summary_df, as_columns) }
+    if include_schedules:
+        schedules = []
+        for i in range(len(params)):
+            df = pd.DataFrame({
+                "year": np.arange(1, number_of_years + 1),
+                "takeOutPercentage": take_out_percentages[i],
+                "startingRetirementNumber": drawdown["startingRetirementNumber"][i],
+                "withdrawal": drawdown["withdrawal"][i],
+                "endingRetirementNumber": ending[i],
+            })
+            df = df.round(_round_dig)
+            schedules.append(df if not as_json else helpers.df_to_json(df, as_columns))
+        resp["schedules"] = schedules
+
+    return resp
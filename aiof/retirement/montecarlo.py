@@ -0,0 +1,331 @@
+import math
+import numpy as np
+import pandas as pd
+
+import aiof.config as config
+import aiof.compute as compute
+import aiof.helpers as helpers
+
+from aiof.retirement.core import _withdrawal_params
+
+from typing import List
+
+
+# Configs
+_settings = config.get_settings()
+_round_dig = _settings.DefaultRoundingDigit
+_default_interest = _settings.DefaultInterest
+_default_volatility = _settings.DefaultVolatility
+_default_success_target = _settings.DefaultSuccessTarget
+_default_paths = _settings.MonteCarloDefaultPaths
+_max_paths = _settings.MonteCarloMaxPaths
+_chunk_size = _settings.MonteCarloChunkSize
+_seed_block_size = _settings.MonteCarloSeedBlockSize
+_percentiles = _settings.MonteCarloPercentiles
+_distributions = _settings.MonteCarloDistributions
+_historical_returns = _settings.DefaultHistoricalReturns
+
+
+def draw_returns(
+    rng: np.random.Generator,
+    shape: tuple,
+    distribution: str,
+    mean: float,
+    volatility: float,
+    historical_returns: List[float]) -> np.ndarray:
+    """
+    Draw yearly returns, as decimals
+
+    Parameters
+    ----------
+    `rng` : numpy.random.Generator.
+        random generator to draw from\n
+    `shape` : tuple.
+        `(paths, years)`\n
+    `distribution` : str.
+        `normal`, `lognormal` or `historical`\n
+    `mean` : float.
+        mean yearly return in %. used by `normal` and `lognormal`\n
+    `volatility` : float.
+        standard deviation of the yearly return in %. used by `normal` and `lognormal`\n
+    `historical_returns` : List[float].
+        yearly returns in % to bootstrap from. used by `historical`
+
+    Returns
+    ----------
+    `numpy.ndarray` of `shape`
+
+    Notes
+    ----------
+    `lognormal` draws `log(1 + r)` from a normal distribution whose parameters are chosen so that `r` has the given
+    `mean` and `volatility`
+    """
+    mean = mean / 100
+    volatility = volatility / 100
+    if distribution == "normal":
+        return rng.normal(mean, volatility, size=shape)
+    elif distribution == "lognormal":
+        sigma2 = math.log(1 + (volatility / (1 + mean)) ** 2)
+        mu = math.log(1 + mean) - sigma2 / 2
+        return np.exp(rng.normal(mu, math.sqrt(sigma2), size=shape)) - 1
+    elif distribution == "historical":
+        return rng.choice(np.asarray(historical_returns, dtype=float) / 100, size=shape, replace=True)
+    raise ValueError("Invalid distribution. Please use one of the following {0}".format(", ".join(_distributions)))
+
+
+def chunk_returns(
+    seeds: List[np.random.SeedSequence],
+    start: int,
+    paths: int,
+    number_of_years: int,
+    distribution: str,
+    mean: float,
+    volatility: float,
+    historical_returns: List[float]) -> np.ndarray:
+    """
+    Draw the yearly returns of paths `start` to `start + paths`, see `draw_returns`
+
+    Notes
+    ----------
+    Every block of `Settings.MonteCarloSeedBlockSize` paths is drawn from its own generator in `seeds`, starting with the
+    block `start` falls in. A chunk that starts inside a block draws the block up to the chunk's last path and keeps its
+    tail, so every path gets the same returns whatever the chunk size
+    """
+    first_block = start // _seed_block_size
+    end = start + paths
+    returns = []
+    for block, seed in enumerate(seeds, start=first_block):
+        block_start = block * _seed_block_size
+        if block_start >= end:
+            break
+        rng = np.random.default_rng(seed)
+        block_returns = draw_returns(
+            rng, (min(end - block_start, _seed_block_size), number_of_years),
+            distribution, mean, volatility, historical_returns)
+        returns.append(block_returns[max(start - block_start, 0):])
+    return np.concatenate(returns)
+
+
+def simulate_chunk(
+    seeds: List[np.random.SeedSequence],
+    start: int,
+    paths: int,
+    retirement_number: float,
+    take_out_percentage: float,
+    number_of_years: int,
+    distribution: str,
+    mean: float,
+    volatility: float,
+    historical_returns: List[float]) -> dict:
+    """
+    Simulate one chunk of withdrawal paths
+
+    Returns
+    ----------
+    `dict` with the chunk's number of `paths`, number of `successes`, each path's `maxWithdrawalRates`
+    and each path's ending retirement number per year as `balances`
+
+    Notes
+    ----------
+    Like `aiof.retirement.core.withdrawal_calc`, each year the withdrawal is taken out first and the rest grows by that
+    year's return. A path succeeds if the retirement number never goes negative.
+    With cumulative growth `G`, the largest withdrawal rate a path can sustain is `1 / sum(1 / G[j] for j < years)`
+    """
+    returns = chunk_returns(seeds, start, paths, number_of_years, distribution, mean, volatility, historical_returns)
+    growth = np.maximum(1 + returns, 0)
+    withdrawal = retirement_number * take_out_percentage
+
+    balances = np.empty((paths, number_of_years))
+    balance = np.full(paths, float(retirement_number))
+    for year in range(number_of_years):
+        balance = (balance - withdrawal) * growth[:, year]
+        balances[:, year] = balance
+
+    cumulative_growth = np.cumprod(growth[:, :-1], axis=1)
+    with np.errstate(divide="ignore"):
+        discount = 1 + (1 / cumulative_growth).sum(axis=1)
+        max_withdrawal_rates = 1 / discount
+
+    return {
+        "paths": paths,
+        "successes": int((balances >= 0).all(axis=1).sum()),
+        "maxWithdrawalRates": max_withdrawal_rates,
+        "balances": balances,
+    }
+
+
+def merge_chunks(
+    chunks: List[dict],
+    percentiles: List[int]) -> dict:
+    """
+    Merge `simulate_chunk` results
+
+    Returns
+    ----------
+    `dict` with the total number of `paths` and `successes`, every path's `maxWithdrawalRates`
+    and the `bands` of the ending retirement number per percentile and year
+
+    Notes
+    ----------
+    Everything is merged exactly. The bands are the percentiles of every path's balances, taken one year at a time
+    so that only one year of all the paths is copied at once
+    """
+    number_of_years = chunks[0]["balances"].shape[1]
+    bands = np.empty((len(percentiles), number_of_years))
+    for year in range(number_of_years):
+        bands[:, year] = np.percentile(np.concatenate([c["balances"][:, year] for c in chunks]), percentiles)
+
+    return {
+        "paths": sum(c["paths"] for c in chunks),
+        "successes": sum(c["successes"] for c in chunks),
+        "maxWithdrawalRates": np.concatenate([c["maxWithdrawalRates"] for c in chunks]),
+        "bands": bands,
+    }
+
+
+def chunk_args(
+    paths: int,
+    chunk_size: int,
+    seed: int,
+    *args) -> list:
+    """
+    Split `paths` into `simulate_chunk` arguments of at most `chunk_size` paths each
+
+    Notes
+    ----------
+    Every block of `Settings.MonteCarloSeedBlockSize` paths gets its own child of `numpy.random.SeedSequence(seed)`,
+    and every chunk gets the children of the blocks it overlaps. So the results only depend on `seed`,
+    not on `chunk_size` or the order in which chunks run
+    """
+    seeds = np.random.SeedSequence(seed).spawn(math.ceil(paths / _seed_block_size))
+    args_list = []
+    for start in range(0, paths, chunk_size):
+        size = min(chunk_size, paths - start)
+        blocks = seeds[start // _seed_block_size:(start + size - 1) // _seed_block_size + 1]
+        args_list.append((blocks, start, size) + args)
+    return args_list
+
+
+def withdrawal_monte_carlo(
+    retirement_number: float = None,
+    take_out_percentage: float = None,
+    number_of_years: int = None,
+    paths: int = None,
+    distribution: str = None,
+    mean: float = None,
+    volatility: float = None,
+    historical_returns: List[float] = None,
+    seed: int = None,
+    chunk_size: int = None,
+    success_target: float = None,
+    executor: str = None,
+    as_json: bool = False,
+    as_columns: bool = False) -> dict:
+    """
+    Simulate retirement withdrawals over many random market return paths
+
+    Parameters
+    ----------
+    `retirement_number` : float.
+        retirement number. defaults to `1,000,000`\n
+    `take_out_percentage` : float.
+        take out percentage of total retirement number. defaults to `3%`\n
+    `number_of_years` : int.
+        number of years to take money out. defaults to `35`\n
+    `paths` : int.
+        number of simulated return paths. defaults to `10,000`\n
+    `distribution` : str.
+        `normal`, `lognormal` or `historical`. defaults to `lognormal`\n
+    `mean` : float.
+        mean yearly return in %. defaults to `Settings.DefaultInterest`\n
+    `volatility` : float.
+        standard deviation of the yearly return in %. defaults to `Settings.DefaultVolatility`\n
+    `historical_returns` : List[float].
+        yearly returns in % to bootstrap from. defaults to `Settings.DefaultHistoricalReturns`\n
+    `seed` : int or None.
+        random seed. the same inputs and seed always return the same result. defaults to `None`\n
+    `chunk_size` : int.
+        maximum number of paths simulated at once, bounding the drawn returns to `chunk_size * number_of_years`.
+        the results do not depend on it. defaults to, and cannot be bigger than, `Settings.MonteCarloChunkSize`\n
+    `success_target` : float.
+        success rate in % the safe withdrawal rate must reach. defaults to `Settings.DefaultSuccessTarget`\n
+    `executor` : str or None.
+        executor the chunks are spread across, see `aiof.compute.map_chunks`. defaults to `Settings.ComputeExecutor`\n
+    `as_json` : bool.
+        whether to return the pandas.DataFrame results as JSON. defaults to `False`\n
+    `as_columns` : bool.
+        whether JSON is returned as columns, `{ column: [values] }`, instead of records. defaults to `False`
+
+    Returns
+    ----------
+    `dict` with the `successRate` and `safeWithdrawalRate` in % and the yearly percentile `bands`
+    of the ending retirement number
+    """
+    retirement_number, take_out_percentage, number_of_years = _withdrawal_params(
+        retirement_number, take_out_percentage, number_of_years)
+    paths               = paths if paths is not None else _default_paths
+    distribution        = distribution if distribution is not None else "lognormal"
+    mean                = mean if mean is not None else _default_interest
+    volatility          = volatility if volatility is not None else _default_volatility
+    historical_returns  = historical_returns if historical_returns is not None else _historical_returns
+    chunk_size          = chunk_size if chunk_size is not None else _chunk_size
+    success_target      = success_target if success_target is not None else _default_success_target
+
+    if paths <= 0 or paths > _max_paths:
+        raise ValueError(f"Paths must be between 1 and {_max_paths}")
+    elif distribution not in _distributions:
+        raise ValueError("Invalid distribution. Please use one of the following {0}".format(", ".join(_distributions)))
+    elif volatility < 0:
+        raise ValueError("Volatility cannot be negative")
+    elif distribution == "historical" and len(historical_returns) == 0:
+        raise ValueError("Historical returns cannot be empty")
+    elif chunk_size <= 0 or chunk_size > _chunk_size:
+        raise ValueError(f"Chunk size must be between 1 and {_chunk_size}")
+    elif success_target < 1 or success_target > 100:
+        raise ValueError("Success target must be between 1 and 100")
+
+    chunks = compute.map_chunks(simulate_chunk, chunk_args(
+        paths, chunk_size, seed,
+        retirement_number, take_out_percentage, number_of_years,
+        distribution, mean, volatility, historical_returns),
+        executor=executor)
+
+    return monte_carlo_response(
+        merge_chunks(chunks, _percentiles),
+        retirement_number, take_out_percentage, number_of_years,
+        distribution, mean, volatility, success_target, as_json, as_columns)
+
+
+def monte_carlo_response(
+    result: dict,
+    retirement_number: float,
+    take_out_percentage: float,
+    number_of_years: int,
+    distribution: str,
+    mean: float,
+    volatility: float,
+    success_target: float,
+    as_json: bool = False,
+    as_columns: bool = False) -> dict:
+    """
+    Build the `withdrawal_monte_carlo` response from merged `simulate_chunk` results
+    """
+    bands_df = pd.DataFrame(result["bands"].T, columns=[f"p{p}" for p in _percentiles])
+    bands_df.insert(0, "year", np.arange(1, number_of_years + 1))
+    bands_df = bands_df.round(_round_dig)
+
+    safe_withdrawal_rate = np.percentile(result["maxWithdrawalRates"], 100 - success_target)
+
+    return {
+        "retirementNumber": retirement_number,
+        "takeOutPercentage": take_out_percentage,
+        "numberOfYears": number_of_years,
+        "paths": result["paths"],
+        "distribution": distribution,
+        "mean": mean,
+        "volatility": volatility,
+        "successTarget": success_target,
+        "successRate": round(result["successes"] / result["paths"] * 100, _round_dig),
+        "safeWithdrawalRate": round(float(safe_withdrawal_rate) * 100, _round_dig),
+        "bands": bands_df if not as_json else helpers.df_to_json(bands_df, as_columns)
+    }
\ No newline at end of file
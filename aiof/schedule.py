@@ -0,0 +1,173 @@
+import numpy as np
+import pandas as pd
+
+import aiof.config as config
+
+from typing import Callable
+
+
+"""
+Lazy schedules, whose periods are only computed when they are consumed
+"""
+# Configs
+_settings = config.get_settings()
+_chunk_rows = int(_settings.ScheduleChunkRows)
+_page_default_limit = int(_settings.SchedulePageDefaultLimit)
+_page_max_limit = int(_settings.SchedulePageMaxLimit)
+
+
+class Schedule:
+    """
+    A schedule of `length` periods, e.g. the payments of a loan, that computes its rows on demand
+
+    Parameters
+    ----------
+    `table` : Callable.
+        computes the rows of any 1-based periods, `table(periods: numpy.ndarray) -> pandas.DataFrame`,
+        with one row per period in the same order\n
+    `length` : int.
+        number of periods in the schedule\n
+    `chunk_rows` : int or None.
+        rows computed at once while iterating. defaults to `Settings.ScheduleChunkRows`
+
+    Examples
+    ----------
+    `schedule[119:180]` computes periods 120 through 180 only, and
+    `schedule.find(lambda df: df["endingBalance"] < 100000)` stops at the first block that has a match
+    """
+    def __init__(
+        self,
+        table: Callable,
+        length: int,
+        chunk_rows: int = None):
+        chunk_rows = chunk_rows if chunk_rows is not None else _chunk_rows
+
+        if length < 0:
+            raise ValueError("Schedule length cannot be negative")
+        elif chunk_rows <= 0:
+            raise ValueError("Chunk rows must be bigger than 0")
+
+        self._table = table
+        self._length = int(length)
+        self._chunk_rows = int(chunk_rows)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, key):
+        """
+        Compute a single period as a `pandas.Series`, or a slice of periods as a `pandas.DataFrame`.
+        Keys are 0-based, like a list, so `schedule[0]` is period `1`
+        """
+        if isinstance(key, slice):
+            return self.periods(np.arange(*key.indices(self._length)) + 1)
+        index = int(key)
+        if index < 0:
+            index += self._length
+        if index < 0 or index >= self._length:
+            raise IndexError("Schedule index out of range")
+        return self.periods(np.array([index + 1])).iloc[0]
+
+    def __iter__(self):
+        """
+        Iterate over the periods as `dict` rows, computing `chunk_rows` of them at a time
+        """
+        for chunk_df in self.chunks():
+            yield from chunk_df.to_dict(orient="records")
+
+    def periods(self, periods) -> pd.DataFrame:
+        """
+        Compute the given 1-based periods
+        """
+        periods = np.asarray(periods, dtype=int)
+        if np.any((periods < 1) | (periods > self._length)):
+            raise IndexError("Schedule period out of range")
+        return self._table(periods)
+
+    def chunks(
+        self,
+        start: int = 0,
+        stop: int = None,
+        chunk_rows: int = None):
+        """
+        Compute the periods from the 0-based `start` up to `stop` one block of `chunk_rows` at a time
+
+        Returns
+        ----------
+        generator of `pandas.DataFrame`
+        """
+        start, stop, _ = slice(start, stop).indices(self._length)
+        chunk_rows = chunk_rows if chunk_rows is not None else self._chunk_rows
+
+        if chunk_rows <= 0:
+            raise ValueError("Chunk rows must be bigger than 0")
+
+        for chunk_start in range(start, stop, chunk_rows):
+            yield self.periods(np.arange(chunk_start, min(chunk_start + chunk_rows, stop)) + 1)
+
+    def find(self, predicate: Callable):
+        """
+        Find the first period matching `predicate`, without computing the periods after it
+
+        Parameters
+        ----------
+        `predicate` : Callable.
+            takes a block of periods as a `pandas.DataFrame` and returns a boolean mask of its rows
+
+        Returns
+        ----------
+        `pandas.Series` of the first matching period or `None`
+        """
+        for chunk_df in self.chunks():
+            mask = np.asarray(predicate(chunk_df), dtype=bool)
+            if mask.any():
+                return chunk_df.iloc[int(mask.argmax())]
+        return None
+
+    def pagination(
+        self,
+        offset: int = None,
+        limit: int = None) -> dict:
+        """
+        Fill in the page defaults and validate them
+
+        Parameters
+        ----------
+        `offset` : int or None.
+            0-based period the page starts at. defaults to `0`\n
+        `limit` : int or None.
+            most periods in the page. defaults to `Settings.SchedulePageDefaultLimit`
+
+        Returns
+        ----------
+        `dict` with the page's `offset` and `limit` and the `total` number of periods
+        """
+        offset = offset if offset is not None else 0
+        limit = limit if limit is not None else _page_default_limit
+
+        if offset < 0:
+            raise ValueError("Offset cannot be negative")
+        elif limit <= 0 or limit > _page_max_limit:
+            raise ValueError(f"Limit must be between 1 and {_page_max_limit}")
+
+        return {
+            "offset": offset,
+            "limit": limit,
+            "total": self._length,
+        }
+
+    def page(
+        self,
+        offset: int = None,
+        limit: int = None) -> pd.DataFrame:
+        """
+        Compute one page of periods, see `pagination`. Only the page's periods are computed, however far in it starts
+        """
+        page = self.pagination(offset, limit)
+        return self[page["offset"]:page["offset"] + page["limit"]]
+
+    def to_df(self) -> pd.DataFrame:
+        """
+        Compute the whole schedule
+        """
+        return self[:]
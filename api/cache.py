@@ -0,0 +1,85 @@
+import functools
+import hashlib
+import json
+
+import aiof.config as config
+
+from aiof.cache import LRUCache
+
+from typing import List
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+
+"""
+Response cache for deterministic calculator endpoints
+"""
+# Configs
+_settings = config.get_settings()
+
+response_cache = LRUCache(
+    max_bytes   = int(_settings.ResponseCacheMaxBytes),
+    ttl         = float(_settings.ResponseCacheTtlSeconds),
+    sizeof      = lambda entry: len(entry[0]))
+
+
+def _canonical(value):
+    if isinstance(value, BaseModel):
+        return value.dict()
+    elif isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    elif isinstance(value, dict):
+        return { k: _canonical(v) for k, v in value.items() }
+    return value
+
+
+def cache_key(
+    route: str,
+    params: dict,
+    settings: List[str] = None) -> str:
+    """
+    Canonical hash of a route, its validated request parameters and the `Settings` values it depends on
+    """
+    settings_values = { name: getattr(config.get_settings(), name) for name in settings or [] }
+    payload = json.dumps(
+        [route, _canonical(params), settings_values],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def cached(settings: List[str] = None):
+    """
+    Opt a route into the response cache
+
+    Parameters
+    ----------
+    `settings` : List[str] or None.
+        names of the `Settings` values the route's result depends on, which are part of the cache key
+
+    Notes
+    ----------
+    The serialized response bytes are cached, so a repeat request skips both the calculation and the JSON
+    encoding. Only use it on routes whose result is a pure function of their parameters and `settings`
+    """
+    def decorator(handler):
+        route = f"{handler.__module__}.{handler.__qualname__}"
+
+        @functools.wraps(handler)
+        async def wrapper(*args, **kwargs):
+            key = cache_key(route, kwargs, settings)
+            entry = response_cache.get(key)
+            if entry is None:
+                result = await handler(*args, **kwargs)
+                if isinstance(result, Response):
+                    if not hasattr(result, "body"):
+                        return result
+                    entry = (result.body, result.media_type)
+                else:
+                    entry = (JSONResponse(content=jsonable_encoder(result)).body, "application/json")
+                response_cache.set(key, entry)
+            return Response(content=entry[0], media_type=entry[1])
+        return wrapper
+    return decorator
\ No newline at end of file
@@ -0,0 +1,111 @@
+import asyncio
+import functools
+
+import aiof.config as config
+import aiof.compute as compute
+
+from concurrent.futures import ThreadPoolExecutor
+from starlette.concurrency import run_in_threadpool
+from typing import Callable
+
+
+"""
+Dispatch layer that keeps synchronous calculations off the event loop.
+Cheap and I/O bound calculations run on Starlette's thread pool, heavy ones on a separate bounded pool,
+so cheap endpoints never queue behind heavy ones
+"""
+# Configs
+_settings = config.get_settings()
+_heavy_pool_size = int(_settings.DispatchHeavyPoolSize)
+
+_pools = [
+    "light",
+    "heavy",
+    "process"
+]
+_max_pending = {
+    "light": int(_settings.DispatchMaxPending),
+    "heavy": int(_settings.DispatchHeavyMaxPending),
+    "process": int(_settings.DispatchHeavyMaxPending)
+}
+_pending = { pool: 0 for pool in _pools }
+_heavy_pool: ThreadPoolExecutor = None
+
+
+class DispatchSaturatedError(Exception):
+    """
+    Raised when more than the pool's `Settings.DispatchMaxPending` or `Settings.DispatchHeavyMaxPending`
+    calculations are already running or queued
+    """
+    pass
+
+
+def pending(pool: str = None) -> int:
+    """
+    Number of dispatched calculations that are currently running or queued, in `pool` or in all of them
+    """
+    return _pending[pool] if pool is not None else sum(_pending.values())
+
+
+def get_heavy_pool() -> ThreadPoolExecutor:
+    """
+    Get the pool heavy calculations are dispatched to, creating it on first use. It is separate from
+    `aiof.compute`'s pools, that the calculations can shard their work across
+    """
+    global _heavy_pool
+    if _heavy_pool is None:
+        _heavy_pool = ThreadPoolExecutor(
+            max_workers=_heavy_pool_size,
+            thread_name_prefix="aiof-dispatch")
+    return _heavy_pool
+
+
+def shutdown():
+    """
+    Shut down the heavy pool, if it was created
+    """
+    global _heavy_pool
+    if _heavy_pool is not None:
+        _heavy_pool.shutdown()
+        _heavy_pool = None
+
+
+async def dispatch(
+    fn: Callable,
+    *args,
+    heavy: bool = False,
+    executor: str = "thread",
+    **kwargs):
+    """
+    Run a synchronous calculation off the event loop and await its result
+
+    Parameters
+    ----------
+    `fn` : Callable.
+        the calculation to run\n
+    `heavy` : bool.
+        whether the calculation is heavy, e.g. a batch or a simulation, and runs on the heavy pool. defaults to `False`,
+        for cheap and I/O bound calculations that run on Starlette's thread pool\n
+    `executor` : str.
+        `thread` or `process`, for heavy calculations. defaults to `thread`. `process` requires `fn`, its arguments
+        and its result to be picklable
+
+    Notes
+    ----------
+    Once a pool has its `Settings.DispatchMaxPending` (light) or `Settings.DispatchHeavyMaxPending` (heavy)
+    calculations in flight, new ones are rejected right away with `DispatchSaturatedError` instead of queueing behind them
+    """
+    pool = ("process" if executor == "process" else "heavy") if heavy else "light"
+    if _pending[pool] >= _max_pending[pool]:
+        raise DispatchSaturatedError(f"Server is busy with {_pending[pool]} {pool} calculations. Please retry later")
+
+    _pending[pool] += 1
+    try:
+        if pool == "process":
+            return await compute.run_in_process(fn, *args, **kwargs)
+        elif pool == "heavy":
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(get_heavy_pool(), functools.partial(fn, *args, **kwargs))
+        return await run_in_threadpool(fn, *args, **kwargs)
+    finally:
+        _pending[pool] -= 1
@@ -0,0 +1,77 @@
+from typing import List, Optional
+from fastapi import Header, Query
+
+
+"""
+Response formats that table-producing endpoints can be asked for
+"""
+RECORDS = "records"
+COLUMNS = "columns"
+ARROW = "arrow"
+PARQUET = "parquet"
+CSV = "csv"
+
+json_formats = [
+    RECORDS,
+    COLUMNS
+]
+binary_formats = [
+    ARROW,
+    PARQUET
+]
+export_formats = [CSV] + binary_formats
+table_formats = json_formats + export_formats
+
+media_types = {
+    CSV: "text/csv",
+    ARROW: "application/vnd.apache.arrow.stream",
+    PARQUET: "application/vnd.apache.parquet"
+}
+
+
+def requested_format(
+    format: Optional[str],
+    accept: Optional[str],
+    allowed: List[str]) -> str:
+    """
+    Response format requested with the `format` query parameter, e.g. `?format=columns`, with a `format` parameter
+    of the `Accept` header, e.g. `Accept: application/json; format=columns`, or with the `Accept` header's media type,
+    e.g. `Accept: application/vnd.apache.arrow.stream`. defaults to `records`
+
+    Raises
+    ----------
+    `ValueError` if the format isn't one of `allowed`
+    """
+    if format is None and accept is not None:
+        for media_range in accept.split(","):
+            media_type, *params = media_range.split(";")
+            for name, value in media_types.items():
+                if media_type.strip().lower() == value:
+                    format = name
+            for param in params:
+                key, _, value = param.partition("=")
+                if key.strip().lower() == "format":
+                    format = value.strip().strip('"')
+    format = format.lower() if format is not None else RECORDS
+
+    if format not in allowed:
+        raise ValueError("Invalid format. Please use one of the following {0}".format(", ".join(allowed)))
+    return format
+
+
+def response_format(
+    format: Optional[str] = Query(None),
+    accept: Optional[str] = Header(None)) -> str:
+    """
+    JSON response format, `records` or `columns`, see `requested_format`
+    """
+    return requested_format(format, accept, json_formats)
+
+
+def table_format(
+    format: Optional[str] = Query(None),
+    accept: Optional[str] = Header(None)) -> str:
+    """
+    Response format of endpoints that produce a table, which can also be exported as `csv`, `arrow` or `parquet`, see `requested_format`
+    """
+    return requested_format(format, accept, table_formats)
\ No newline at end of file
@@ -1,11 +1,18 @@
 import time
 import aiof.config as config
+import aiof.compute as compute
 import aiof.helpers as help
+import api.formats as formats
+import api.precompute as precompute
 
 from aiof.data.asset import ComparableAsset
+from aiof.cache import memoized_stats
+from api.cache import response_cache
+from api.dispatch import dispatch, DispatchSaturatedError, shutdown as dispatch_shutdown
+from api.responses import FastJSONResponse, table_response
 from api.routers import helpers, fi, car, analytics, market, property, retirement
 
-from fastapi import FastAPI, Request, HTTPException, Depends
+from fastapi import FastAPI, Request, HTTPException, Depends, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse, JSONResponse
 from logzero import logger
@@ -23,10 +30,26 @@ app.add_middleware(
 )
 
 
+@app.on_event("startup")
+async def materialize_precomputed():
+    precompute.materialize()
+
+@app.on_event("shutdown")
+async def shutdown_compute():
+    dispatch_shutdown()
+    compute.shutdown()
+
+
 @app.exception_handler(ValueError)
 async def unicorn_exception_handler(req: Request, ve: ValueError):
     return write_exception_response(status_code=400, message=ve)
 
+@app.exception_handler(DispatchSaturatedError)
+async def dispatch_saturated_exception_handler(req: Request, dse: DispatchSaturatedError):
+    response = write_exception_response(status_code=429, message=dse)
+    response.headers["Retry-After"] = str(config.get_settings().DispatchRetryAfterSeconds)
+    return response
+
 def write_exception_response(status_code: int, message: str):
     return JSONResponse(
         status_code=status_code,
@@ -58,17 +81,28 @@ async def health_check():
 
 
 @app.post("/api/asset/breakdown")
-async def asset_breakdown(asset: ComparableAsset):
-    return help.asset_breakdown(asset)
+async def asset_breakdown(asset: ComparableAsset, fmt: str = Depends(formats.table_format)):
+    resp = await dispatch(help.asset_breakdown, asset, as_json=False)
+    if fmt in formats.export_formats:
+        return table_response(help.asset_breakdown_as_table(resp), fmt)
+    return FastJSONResponse(resp, as_columns=fmt == formats.COLUMNS)
 
 @app.get("/api/asset/breakdown/csv")
-async def export_asset_fv_breakdown_as_table_to_csv():
-    df = help.asset_fv_breakdown_as_table(
-        asset_value=15957,
-        contribution=500,
-        years=15,
-        rate=(8/100)/12,
-        frequency=12,
+async def export_asset_fv_breakdown_as_table_to_csv(
+    asset_value: float = Query(15957, alias="assetValue"),
+    contribution: float = Query(500),
+    years: int = Query(15),
+    interest: float = Query(8),
+    frequency: int = Query(12)):
+    if years <= 0 or frequency <= 0:
+        raise ValueError("Years and frequency must be bigger than 0")
+    df = await dispatch(
+        help.asset_fv_breakdown_as_table,
+        asset_value=asset_value,
+        contribution=contribution,
+        years=years,
+        rate=(interest/100)/frequency,
+        frequency=frequency,
     )
     response = StreamingResponse(help.export_to_csv(df),
                                 media_type="text/csv")
@@ -83,6 +117,14 @@ async def frequencies_map():
     return config.get_settings().FrequenciesMap
 
 
+@app.get("/api/app/cache")
+async def cache_stats():
+    return response_cache.stats()
+@app.get("/api/app/cache/memoized")
+async def memoized_cache_stats():
+    return memoized_stats()
+
+
 @app.get("/api/app/settings")
 async def info(settings: config.Settings = Depends(config.get_settings)):
     return {
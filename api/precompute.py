@@ -0,0 +1,89 @@
+import hashlib
+import json
+
+import aiof.config as config
+import aiof.fi.core as fi
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from logzero import logger
+
+
+"""
+Startup-time materialization of input-free and low-cardinality endpoints as ready-to-send bytes
+"""
+# Settings the materialized tables depend on. A change to any of them invalidates every table
+_fingerprint_settings = [
+    "DefaultRoundingDigit",
+    "DefaultChildren",
+    "DefaultInterests",
+    "DefaultTenMillion",
+    "DefaultTenMillionInterests",
+    "PrecomputedTenMillionDreamMonthlyInvestments"
+]
+
+_tables = {}
+_fingerprint = None
+_materialized_settings = None
+
+
+def _table_args(settings: config.Settings) -> dict:
+    """
+    Every table's function and the list of arguments it is materialized for
+    """
+    return {
+        "cost_of_raising_children_families": (fi.cost_of_raising_children_faimilies, [()]),
+        "ten_million_dream": (fi.ten_million_dream, [
+            (float(m),) for m in settings.PrecomputedTenMillionDreamMonthlyInvestments]),
+    }
+
+
+def fingerprint(settings: config.Settings = None) -> str:
+    """
+    Hash of the `Settings` values the materialized tables depend on
+    """
+    settings = settings if settings is not None else config.get_settings()
+    values = [getattr(settings, name) for name in _fingerprint_settings]
+    return hashlib.sha256(json.dumps(values, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def materialize(settings: config.Settings = None):
+    """
+    Compute every table and store its serialized JSON response bytes
+    """
+    global _tables, _fingerprint, _materialized_settings
+    settings = settings if settings is not None else config.get_settings()
+    tables = {}
+    for name, (fn, args_list) in _table_args(settings).items():
+        for args in args_list:
+            tables[(name, args)] = JSONResponse(content=jsonable_encoder(fn(*args))).body
+    _tables = tables
+    _fingerprint = fingerprint(settings)
+    _materialized_settings = settings
+    logger.info("Materialized {0} precomputed responses".format(len(_tables)))
+
+
+def refresh(settings: config.Settings = None):
+    """
+    Re-materialize the tables if the `Settings` values they depend on changed. Call it when the settings are reloaded
+    """
+    global _materialized_settings
+    settings = settings if settings is not None else config.get_settings()
+    if fingerprint(settings) != _fingerprint:
+        materialize(settings)
+    _materialized_settings = settings
+
+
+def get(name: str, *args) -> bytes:
+    """
+    Get the materialized response bytes of table `name` for `args`, or `None` if they aren't materialized
+
+    Notes
+    ----------
+    The tables are materialized on first use. They are only fingerprinted again, see `refresh`, when
+    `aiof.config.get_settings` returns new `Settings`, not on every call
+    """
+    settings = config.get_settings()
+    if settings is not _materialized_settings:
+        refresh(settings)
+    return _tables.get((name, args))
@@ -0,0 +1,144 @@
+import datetime
+import json
+import math
+import numpy as np
+import pandas as pd
+
+import aiof.helpers as helpers
+import api.formats as formats
+
+from typing import Any
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
+
+
+"""
+Fast JSON serialization that goes straight from pandas.DataFrame and numpy arrays to bytes,
+and streaming of tables in binary formats
+"""
+
+
+def _iso_dates(values: np.ndarray) -> np.ndarray:
+    """
+    Format datetime64 values the same as `datetime.isoformat()`, without sub-seconds when there aren't any
+    """
+    values = values.astype("datetime64[us]")
+    has_fraction = (values.astype("int64") % 1000000 != 0).any()
+    return np.datetime_as_string(values, unit="us" if has_fraction else "s")
+
+
+def _json_default(obj: Any):
+    if isinstance(obj, np.generic):
+        return obj.item()
+    elif isinstance(obj, (datetime.datetime, datetime.date)):
+        return obj.isoformat()
+    return jsonable_encoder(obj)
+
+
+def _json_dumps(obj: Any) -> str:
+    return json.dumps(obj, separators=(",", ":"), default=_json_default)
+
+
+def _column(series: pd.Series) -> list:
+    """
+    Values of `series` as a list of Python objects. Floats keep their shortest round-trip `repr`, like the standard
+    `json` encoder, `NaN` and infinity become `None` and datetimes are formatted like `datetime.isoformat()`
+    """
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        values = series.dt.tz_localize(None).to_numpy() if series.dt.tz is not None else series.to_numpy()
+        return _iso_dates(values).tolist()
+    values = series.to_numpy()
+    if values.dtype.kind == "f":
+        finite = np.isfinite(values)
+        return values.tolist() if finite.all() else np.where(finite, values.astype(object), None).tolist()
+    elif values.dtype.kind == "O":
+        return [None if isinstance(v, float) and not math.isfinite(v) else v for v in values.tolist()]
+    return values.tolist()
+
+
+def _encode_series(series: pd.Series) -> str:
+    return _json_dumps(_column(series))
+
+
+def _encode_frame(df: pd.DataFrame, as_columns: bool) -> str:
+    names = [str(name) for name in df.columns]
+    columns = [_column(df[name]) for name in df.columns]
+    if not as_columns:
+        return _json_dumps([dict(zip(names, row)) for row in zip(*columns)])
+    return _json_dumps(dict(zip(names, columns)))
+
+
+def _encode(obj: Any, as_columns: bool) -> str:
+    if obj is None or isinstance(obj, (str, bool)):
+        return json.dumps(obj)
+    elif isinstance(obj, float):
+        return "null" if math.isnan(obj) or math.isinf(obj) else repr(obj)
+    elif isinstance(obj, int):
+        return str(obj)
+    elif isinstance(obj, dict):
+        return "{" + ",".join(
+            json.dumps(str(k)) + ":" + _encode(v, as_columns) for k, v in obj.items()) + "}"
+    elif isinstance(obj, (list, tuple)):
+        return "[" + ",".join(_encode(v, as_columns) for v in obj) + "]"
+    elif isinstance(obj, pd.DataFrame):
+        return _encode_frame(obj, as_columns)
+    elif isinstance(obj, pd.Series):
+        return _encode_series(obj)
+    elif isinstance(obj, np.ndarray):
+        return _encode_series(pd.Series(obj.ravel())) if obj.ndim <= 1 else _encode(list(obj), as_columns)
+    elif isinstance(obj, np.generic):
+        return _encode(obj.item(), as_columns)
+    elif isinstance(obj, (datetime.datetime, datetime.date)):
+        return json.dumps(obj.isoformat())
+    elif isinstance(obj, BaseModel):
+        return _encode(dict(obj), as_columns)
+    return json.dumps(jsonable_encoder(obj))
+
+
+def dumps(content: Any, as_columns: bool = False) -> bytes:
+    """
+    Serialize `content` to JSON bytes
+
+    Parameters
+    ----------
+    `content` : Any.
+        the content. may contain pandas.DataFrame, pandas.Series, numpy arrays and scalars, pydantic models and datetimes\n
+    `as_columns` : bool.
+        whether pandas.DataFrame are encoded as columns, `{ column: [values] }`, instead of records. defaults to `False`
+
+    Notes
+    ----------
+    pandas.DataFrame and arrays are converted column by column with `tolist()` and encoded by the standard `json` encoder,
+    without walking them with `jsonable_encoder`. Floats are the same as `JSONResponse`'s, and `NaN` and infinity become `null`
+    """
+    return _encode(content, as_columns).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response that serializes its content with `dumps`
+
+    Parameters
+    ----------
+    `as_columns` : bool.
+        whether pandas.DataFrame are encoded as columns, `{ column: [values] }`, instead of records. defaults to `False`
+    """
+    def __init__(self, content: Any, as_columns: bool = False, **kwargs):
+        self.as_columns = as_columns
+        super().__init__(content, **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content, self.as_columns)
+
+def table_response(df: pd.DataFrame, format: str) -> StreamingResponse:
+    """
+    Stream a pandas.DataFrame in an export format, `csv`, `arrow` or `parquet`
+    """
+    exports = {
+        formats.CSV: helpers.export_to_csv,
+        formats.ARROW: helpers.export_to_arrow,
+        formats.PARQUET: helpers.export_to_parquet
+    }
+    df = df if df is not None else pd.DataFrame()
+    return StreamingResponse(exports[format](df), media_type=formats.media_types[format])
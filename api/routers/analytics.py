@@ -1,9 +1,12 @@
 import aiof.analytics.core as a
+import api.formats as formats
 
 from aiof.data.analytics import AssetsLiabilitiesRequest
-from aiof.data.life_event import LifeEventRequest
+from aiof.data.life_event import LifeEventRequest, LifeEventTimelineRequest
+from api.dispatch import dispatch
+from api.responses import FastJSONResponse, table_response
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
 
 router = APIRouter()
@@ -11,7 +14,9 @@ router = APIRouter()
 
 @router.post("/analyze")
 async def analyze(req: AssetsLiabilitiesRequest):
-    return a.analyze(
+    return await dispatch(
+        a.analyze,
+        heavy       = True,
         assets      = req.assets,
         liabilities = req.liabilities)
 
@@ -21,7 +26,20 @@ async def get_life_event_types():
 
 
 @router.post("/life/event")
-async def get_life_event(req: LifeEventRequest):
-    return a.life_event(
-        req     = req,
-        as_json = True)
\ No newline at end of file
+async def get_life_event(req: LifeEventRequest, fmt: str = Depends(formats.table_format)):
+    resp = await dispatch(
+        a.life_event,
+        req         = req)
+    if fmt in formats.export_formats:
+        return table_response(resp.event, fmt)
+    return FastJSONResponse(resp, as_columns=fmt == formats.COLUMNS)
+
+@router.post("/life/event/timeline")
+async def get_life_event_timeline(req: LifeEventTimelineRequest, fmt: str = Depends(formats.table_format)):
+    resp = await dispatch(
+        a.life_event_timeline,
+        heavy       = True,
+        req         = req)
+    if fmt in formats.export_formats:
+        return table_response(resp["timeline"], fmt)
+    return FastJSONResponse(resp, as_columns=fmt == formats.COLUMNS)
@@ -1,24 +1,74 @@
 import aiof.car.core as car
+import aiof.car.depreciation as depreciation
+import api.formats as formats
 
 from aiof.data.car import CarLoanRequest, CarValueDepreciationRequest
+from api.cache import cached
+from api.dispatch import dispatch
+from api.responses import FastJSONResponse, table_response
 
-from fastapi import APIRouter
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query
 
 
 router = APIRouter()
 
+_cached_settings = [
+    "DefaultRoundingDigit",
+    "CarDepreciationProfiles",
+    "DefaultCarDepreciationProfile"
+]
+
 
 @router.post("/loan")
-async def car_loan(req: CarLoanRequest):
-    return car.loan_calc(
+@cached(settings=_cached_settings)
+async def car_loan(
+    req: CarLoanRequest,
+    offset: Optional[int] = Query(None),
+    limit: Optional[int] = Query(None),
+    fmt: str = Depends(formats.table_format)):
+    resp = await dispatch(
+        car.loan_calc,
         car_loan        = req.carLoan,
         interest        = req.interst,
         years           = req.years,
-        data_as_json    = True)
+        offset          = offset,
+        limit           = limit)
+    if fmt in formats.export_formats:
+        return table_response(resp.data, fmt)
+    return FastJSONResponse(resp, as_columns=fmt == formats.COLUMNS)
+
+@router.post("/loan/batch")
+@cached(settings=_cached_settings)
+async def car_loan_batch(req: List[CarLoanRequest], fmt: str = Depends(formats.response_format)):
+    resp = await dispatch(
+        car.loan_calc_batch,
+        heavy           = True,
+        reqs            = req)
+    return FastJSONResponse(resp, as_columns=fmt == formats.COLUMNS)
 
 @router.post("/depreciation")
-async def value_depreciation(req: CarValueDepreciationRequest):
-    return car.value_depreciation_calc(
+@cached(settings=_cached_settings)
+async def value_depreciation(req: CarValueDepreciationRequest, fmt: str = Depends(formats.table_format)):
+    resp = await dispatch(
+        car.value_depreciation_calc,
         initial_value   = req.value,
         years           = req.years,
-        as_json         = True)
\ No newline at end of file
+        profile         = req.profile,
+        seed            = req.seed)
+    if fmt in formats.export_formats:
+        return table_response(resp, fmt)
+    return FastJSONResponse(resp, as_columns=fmt == formats.COLUMNS)
+
+@router.post("/depreciation/batch")
+@cached(settings=_cached_settings)
+async def value_depreciation_batch(req: List[CarValueDepreciationRequest], fmt: str = Depends(formats.response_format)):
+    resp = await dispatch(
+        car.value_depreciation_calc_batch,
+        heavy           = True,
+        reqs            = req)
+    return FastJSONResponse(resp, as_columns=fmt == formats.COLUMNS)
+
+@router.get("/depreciation/profiles")
+async def value_depreciation_profiles():
+    return depreciation.depreciation_profiles()
\ No newline at end of file
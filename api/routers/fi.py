@@ -1,68 +1,114 @@
 import aiof.fi.core as fi
 import aiof.fi.health as fihealth
 import aiof.fi.re as fire
+import api.precompute as precompute
+import api.formats as formats
 
 from aiof.data.fi import *
+from api.cache import cached
+from api.dispatch import dispatch
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from fastapi.responses import Response
 
 
 router = APIRouter()
 
+_cached_settings = [
+    "DefaultRoundingDigit",
+    "DefaultInterests",
+    "DefaultFrequencies",
+    "DefaultFees",
+    "DefaultChildren",
+    "DefaultTenMillion",
+    "DefaultTenMillionInterests",
+    "TenMillionDreamMaxCells"
+]
+
 
 @router.post("/time")
-async def time_to_fi(req: FiTime):
-    return fi.time_to_fi(
+@cached(settings=_cached_settings)
+async def time_to_fi(req: FiTime, fmt: str = Depends(formats.response_format)):
+    return await dispatch(
+        fi.time_to_fi,
         starting_amount                 = req.startingAmount,
         monthly_investment              = req.monthlyInvestment,
         desired_years_expenses_for_fi   = req.desiredYearsExpensesForFi,
-        desired_annual_spending         = req.desiredAnnualSpending
+        desired_annual_spending         = req.desiredAnnualSpending,
+        as_columns                      = fmt == formats.COLUMNS
     )
 
 @router.post("/rule/of/72")
+@cached(settings=_cached_settings)
 async def rule_of_72(req: FiRuleOf72):
-    return fi.rule_of_72(
+    return await dispatch(
+        fi.rule_of_72,
         starting_amount = req.startingAmount,
         interest        = req.interest
     )
 
 @router.post("/added/time")
+@cached(settings=_cached_settings)
 async def added_time(req: FiAddedTime):
-    return fi.added_time_to_fi(
+    return await dispatch(
+        fi.added_time_to_fi,
         monthly_investment          = req.monthlyInvestment,
         total_additional_expense    = req.totalAdditionalExpense
     )
 
 @router.get("/ten/million/dream/{monthlyInvestment}")
 async def ten_million_dream(monthlyInvestment: float):
-    return fi.ten_million_dream(monthly_investment = monthlyInvestment)
+    body = precompute.get("ten_million_dream", monthlyInvestment)
+    if body is not None:
+        return Response(content=body, media_type="application/json")
+    return await dispatch(
+        fi.ten_million_dream,
+        monthly_investment = monthlyInvestment)
+
+@router.post("/ten/million/dream")
+@cached(settings=_cached_settings)
+async def ten_million_dream_grid(req: FiTenMillionDream):
+    return await dispatch(
+        fi.ten_million_dream_grid,
+        heavy               = True,
+        monthly_investment  = req.monthlyInvestment,
+        milestones          = req.milestones,
+        interests           = req.interests,
+        as_json             = True)
 
 @router.post("/compound/interest")
-async def compound_interest(req: FiCompoundInterest):
-    return fi.compound_interest(
+@cached(settings=_cached_settings)
+async def compound_interest(req: FiCompoundInterest, fmt: str = Depends(formats.response_format)):
+    return await dispatch(
+        fi.compound_interest,
         starting_amount     = req.startingAmount,
         monthly_investment  = req.monthlyInvestment,
         interest_rate       = req.interest,
         number_of_years     = req.numberOfYears,
         investment_fees     = req.investmentFees,
-        tax_drag            = req.taxDrag
+        tax_drag            = req.taxDrag,
+        as_columns          = fmt == formats.COLUMNS
     )
 
 @router.post("/investment/fees/effect")
-async def investment_fees_effect(req: FiInvestmentFeesEffect):
-    return fi.investment_fees_effect(
+@cached(settings=_cached_settings)
+async def investment_fees_effect(req: FiInvestmentFeesEffect, fmt: str = Depends(formats.response_format)):
+    return await dispatch(
+        fi.investment_fees_effect,
         age_at_career_start             = req.ageAtCareerStart,
         interest_return_while_working   = req.interestReturnWhileWorking,
         interest_return_while_retired   = req.interestReturnWhileRetired,
         tax_drag                        = req.taxDrag,
         annual_savings_1_decade         = req.annualSavingsFirstDecade,
         annual_savings_2_decade         = req.annualSavingsSecondDecade,
-        annual_withdrawal_3_decade      = req.annualWithdrawalThirdDecade
+        annual_withdrawal_3_decade      = req.annualWithdrawalThirdDecade,
+        as_columns                      = fmt == formats.COLUMNS
     )
 
 @router.post("/cost/of/raising/children")
 async def cost_of_raising_children(req: FiRaisingChildren):
-    return fi.cost_of_raising_children(
+    return await dispatch(
+        fi.cost_of_raising_children,
         annual_expenses_start       =req.annualExpensesStart,
         annual_expenses_increment   =req.annualExpensesIncrement,
         children                    =req.children,
@@ -70,11 +116,15 @@ async def cost_of_raising_children(req: FiRaisingChildren):
     )
 @router.get("/cost/of/raising/children/families")
 async def cost_of_raising_children_families():
-    return fi.cost_of_raising_children_faimilies()
+    return Response(
+        content     = precompute.get("cost_of_raising_children_families"),
+        media_type  = "application/json")
 
 @router.post("/savings/rate")
+@cached(settings=_cached_settings)
 async def savings_rate(req: SavingsRate):
-    return fi.savings_rate(
+    return await dispatch(
+        fi.savings_rate,
         salary                              = req.salary,
         match_and_profit_sharing            = req.matchAndProfitSharing,
         federal_income_tax                  = req.federalIncomeTax,
@@ -98,24 +148,30 @@ async def savings_rate(req: SavingsRate):
 
 
 @router.post("/health/bmi/imperial")
+@cached(settings=_cached_settings)
 async def bmi_imperial(req: BmiImperial):
-    return fihealth.bmi_imperial(
+    return await dispatch(
+        fihealth.bmi_imperial,
         weight  = req.weight,
         feet    = req.feet,
         inches  = req.inches
     )
 
 @router.post("/health/bmi/metric")
+@cached(settings=_cached_settings)
 async def bmi_metric(req: BmiMetric):
-    return fihealth.bmi_metric(
+    return await dispatch(
+        fihealth.bmi_metric,
         weight  = req.weight,
         height  = req.height
     )
 
 
 @router.post("/coast/savings")
+@cached(settings=_cached_settings)
 async def re_sample(req: CoastFireSavingsRequest):
-    return fire.coast_fire_savings(
+    return await dispatch(
+        fire.coast_fire_savings,
         coast_savings           = req.savings,
         initial_interest_rate   = req.initialInterestRate,
         current_balance         = req.currentBalance
@@ -1,9 +1,11 @@
 import aiof.helpers as helpers
 
 from aiof.data.asset import Asset
+from api.dispatch import dispatch
 
 from typing import List
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
 
 
 router = APIRouter()
@@ -11,4 +13,19 @@ router = APIRouter()
 
 @router.post("/assets/to/df")
 async def mortgage_calc(req: List[Asset]):
-    return helpers.assets_to_df(req)
\ No newline at end of file
+    return await dispatch(helpers.assets_to_df, req)
+
+@router.get("/loan/payments/csv")
+async def loan_payments_csv(
+    loan_amount: float = Query(30000, alias="loanAmount"),
+    number_of_years: int = Query(6, alias="numberOfYears"),
+    rate_of_interest: float = Query(4.5, alias="rateOfInterest"),
+    frequency: str = Query("monthly")):
+    chunks = await dispatch(
+        helpers.loan_payments_calc_as_chunks,
+        loan_amount,
+        number_of_years,
+        rate_of_interest,
+        frequency=frequency)
+    return StreamingResponse(helpers.export_to_csv(chunks),
+                            media_type="text/csv")
@@ -1,4 +1,5 @@
 import aiof.market.core as mt
+from api.dispatch import dispatch
 
 from fastapi import APIRouter
 
@@ -8,4 +9,4 @@ router = APIRouter()
 
 @router.get("/spy")
 async def get_spy():
-    return mt.get_spy()
\ No newline at end of file
+    return await dispatch(mt.get_spy)
\ No newline at end of file
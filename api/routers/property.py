@@ -1,16 +1,25 @@
 import aiof.property.core as property
+import api.formats as formats
 
-from aiof.data.property import MortgageCalculatorRequest
+from aiof.data.property import MortgageCalculatorRequest, MortgageCalculatorBatchRequest
+from api.dispatch import dispatch
+from api.responses import FastJSONResponse, table_response
 
-from fastapi import APIRouter
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
 
 
 router = APIRouter()
 
 
 @router.post("/mortgage")
-async def mortgage_calc(req: MortgageCalculatorRequest):
-    return property.mortgage_calc(
+async def mortgage_calc(
+    req: MortgageCalculatorRequest,
+    offset: Optional[int] = Query(None),
+    limit: Optional[int] = Query(None),
+    fmt: str = Depends(formats.table_format)):
+    resp = await dispatch(
+        property.mortgage_calc,
         property_value              = req.propertyValue,
         down_payment                = req.downPayment,
         interest_rate               = req.interestRate,
@@ -19,4 +28,22 @@ async def mortgage_calc(req: MortgageCalculatorRequest):
         pmi                         = req.pmi,
         property_insurance          = req.propertyInsurance,
         monthly_hoa                 = req.monthlyHoa,
-        as_json                     = True)
\ No newline at end of file
+        include_breakdown           = True,
+        offset                      = offset,
+        limit                       = limit)
+    if fmt in formats.export_formats:
+        return table_response(resp["data"], fmt)
+    return FastJSONResponse(resp, as_columns=fmt == formats.COLUMNS)
+
+@router.post("/mortgage/batch")
+async def mortgage_calc_batch(req: MortgageCalculatorBatchRequest, fmt: str = Depends(formats.table_format)):
+    resp = await dispatch(
+        property.mortgage_calc_batch,
+        heavy                       = True,
+        scenarios                   = req.scenarios,
+        grid                        = req.grid,
+        start_date                  = req.startDate,
+        include_schedules           = req.includeSchedules)
+    if fmt in formats.export_formats:
+        return table_response(resp["summary"], fmt)
+    return FastJSONResponse(resp, as_columns=fmt == formats.COLUMNS)
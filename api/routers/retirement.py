@@ -1,17 +1,66 @@
 import aiof.retirement.core as retirement
+import aiof.retirement.montecarlo as montecarlo
+import api.formats as formats
 
-from aiof.data.retirement import WithdrawalRequest
+from aiof.data.retirement import WithdrawalRequest, WithdrawalBatchRequest, WithdrawalMonteCarloRequest
+from api.cache import cached
+from api.dispatch import dispatch
+from api.responses import FastJSONResponse, table_response
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
 
 router = APIRouter()
 
+_cached_settings = [
+    "DefaultRoundingDigit",
+    "DefaultInterest",
+    "WithdrawalBatchMaxStrategies"
+]
+
 
 @router.post("/withdrawal")
-async def withdrawal_calc(req: WithdrawalRequest):
-    return retirement.withdrawal_calc(
+@cached(settings=_cached_settings)
+async def withdrawal_calc(req: WithdrawalRequest, fmt: str = Depends(formats.table_format)):
+    resp = await dispatch(
+        retirement.withdrawal_calc,
         retirement_number   = req.retirementNumber,
         take_out_percentage = req.takeOutPercentage,
-        number_of_years     = req.numberOfYears,
-        as_json             = True)
\ No newline at end of file
+        number_of_years     = req.numberOfYears)
+    if fmt in formats.export_formats:
+        return table_response(resp, fmt)
+    return FastJSONResponse(resp, as_columns=fmt == formats.COLUMNS)
+
+@router.post("/withdrawal/batch")
+@cached(settings=_cached_settings)
+async def withdrawal_calc_batch(req: WithdrawalBatchRequest, fmt: str = Depends(formats.table_format)):
+    resp = await dispatch(
+        retirement.withdrawal_calc_batch,
+        heavy                   = True,
+        retirement_numbers      = req.retirementNumbers,
+        take_out_percentages    = req.takeOutPercentages,
+        number_of_years         = req.numberOfYears,
+        include_schedules       = req.includeSchedules)
+    if fmt in formats.export_formats:
+        return table_response(resp["summary"], fmt)
+    return FastJSONResponse(resp, as_columns=fmt == formats.COLUMNS)
+
+@router.post("/withdrawal/montecarlo")
+async def withdrawal_monte_carlo(req: WithdrawalMonteCarloRequest, fmt: str = Depends(formats.table_format)):
+    resp = await dispatch(
+        montecarlo.withdrawal_monte_carlo,
+        heavy                   = True,
+        retirement_number       = req.retirementNumber,
+        take_out_percentage     = req.takeOutPercentage,
+        number_of_years         = req.numberOfYears,
+        paths                   = req.paths,
+        distribution            = req.distribution,
+        mean                    = req.mean,
+        volatility              = req.volatility,
+        historical_returns      = req.historicalReturns,
+        seed                    = req.seed,
+        chunk_size              = req.chunkSize,
+        success_target          = req.successTarget)
+    if fmt in formats.export_formats:
+        return table_response(resp["bands"], fmt)
+    return FastJSONResponse(resp, as_columns=fmt == formats.COLUMNS)
\ No newline at end of file
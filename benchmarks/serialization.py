@@ -0,0 +1,49 @@
+import datetime
+import timeit
+
+import aiof.property.core as property
+
+from api.responses import FastJSONResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+
+"""
+Serialization overhead of a 360 row (30 year) mortgage response
+
+Run with `python -m benchmarks.serialization`
+"""
+_number = 200
+
+
+def records_response(frames: dict) -> bytes:
+    content = {
+        "data": frames["data"].to_dict(orient="records"),
+        "breakdown": frames["breakdown"].to_dict(orient="records")
+    }
+    return JSONResponse(content=jsonable_encoder(content)).body
+
+
+def fast_response(frames: dict, as_columns: bool = False) -> bytes:
+    return FastJSONResponse(frames, as_columns=as_columns).body
+
+
+def main():
+    frames = property.mortgage_calc(
+        start_date          = datetime.datetime(2021, 1, 1),
+        include_breakdown   = True)
+    calc_ms = timeit.timeit(
+        lambda: property.mortgage_calc(start_date=datetime.datetime(2021, 1, 1), include_breakdown=True),
+        number=_number) / _number * 1000
+
+    print(f"mortgage_calc, {len(frames['data'])} rows: {calc_ms:.2f}ms")
+    for name, fn in [
+        ("to_dict + jsonable_encoder + JSONResponse", lambda: records_response(frames)),
+        ("FastJSONResponse, records", lambda: fast_response(frames)),
+        ("FastJSONResponse, columns", lambda: fast_response(frames, as_columns=True))]:
+        ms = timeit.timeit(fn, number=_number) / _number * 1000
+        print(f"{name}: {ms:.2f}ms, {len(fn())} bytes")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
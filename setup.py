@@ -18,5 +18,5 @@ if __name__ == "__main__":
         author_email = "aiof@email.com",
         url = "https://github.com/gkama/aiof-metadata",
         license = license,
-        packages = find_packages(exclude=("tests", "docs"))
+        packages = find_packages(exclude=("tests", "docs", "benchmarks"))
     )
\ No newline at end of file
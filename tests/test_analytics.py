@@ -1,8 +1,9 @@
 import unittest
+import numpy_financial as npf
 
 from aiof.data.asset import Asset
 from aiof.data.liability import Liability
-from aiof.analytics.core import analyze, assets_fv, debt_to_income_ratio_calc, debt_to_income_ratio_basic_calc, life_event_types, life_event_df_f
+from aiof.analytics.core import analyze, assets_fv, debt_to_income_ratio_calc, debt_to_income_ratio_basic_calc, life_event_types, life_event_df_f, life_event_projection, life_event_projection_df
 
 
 class AnalyticsTestCase(unittest.TestCase):
@@ -53,6 +54,38 @@ class AnalyticsTestCase(unittest.TestCase):
         assert len(resp.analytics.assetsFv) > 0
 
 
+    def test_analyze_type_totals(self):
+        assets = [
+            Asset(name="asset 1", typeName="Cash", value=500),
+            Asset(name="asset 2", typeName="stock", value=1000)
+        ]
+        liabilities = [
+            Liability(name="l1", typeName="Credit Card", value=100, years=None, monthlyPayment=None),
+            Liability(name="l2", typeName="mortgage", value=200000, years=30, monthlyPayment=0)
+        ]
+        resp = analyze(assets=assets, liabilities=liabilities)
+
+        assert resp.assetsMean == 750
+        assert resp.liabilitiesTotal == 200100
+        assert resp.analytics.cashToCcRatio == 20
+        assert resp.analytics.debtToIncomeRatio == round((200000 / 30) / 150000 * 100, 2)
+
+    def test_analyze_large_portfolio(self):
+        assets = [Asset(name=str(i), typeName=["cash", "stock", "car"][i % 3], value=i % 1000) for i in range(30000)]
+        liabilities = [Liability(name=str(i), typeName="student loan", value=1000, years=10, monthlyPayment=i % 2) for i in range(30000)]
+        resp = analyze(assets=assets, liabilities=liabilities)
+
+        assert resp.assetsTotal == sum(i % 1000 for i in range(30000))
+        assert resp.liabilitiesMean == 1000
+        assert resp.analytics.debtToIncomeRatio == debt_to_income_ratio_calc(income=150000, liabilities=liabilities)
+        assert len(resp.analytics.assetsFv) == 3 * 30000
+        assert resp.analytics.assetsFv[1].year == 5
+        assert resp.analytics.assetsFv[1].fv == round(npf.fv((7 / 100) / 12, 5 * 12, 0, -1), 2)
+
+    def test_analyze_empty(self):
+        with self.assertRaises(ValueError):
+            analyze(assets=[], liabilities=self.test_liabilities)
+
     def test_assets_fv(self):
         resp = assets_fv(assets=self.test_assets)   
 
@@ -128,4 +161,32 @@ class AnalyticsTestCase(unittest.TestCase):
         assert df.iloc[0][0] > 0
         assert df.iloc[0][1] > 0
         assert df.iloc[0][2] > 0
-        assert df.iloc[0][3] > 0
\ No newline at end of file
+        assert df.iloc[0][3] > 0
+
+    def test_life_event_projection_matches_compounding_yearly(self):
+        projection = life_event_projection(
+            asset_types=["cash", "investment"],
+            years=3,
+            start_amounts=[10000, 5000],
+            monthly_contributions=[1000, 500],
+            monthly_costs=[250, 0])
+        rate = (7 / 100) / 12
+        value = 5000
+        for year in range(3):
+            value = -npf.fv(rate=rate, nper=12, pmt=500, pv=value, when="end")
+
+        assert projection["value"].shape == (2, 3)
+        assert projection["contribution"][0, 0] == 12000
+        assert abs(projection["valueWithContributions"][1, 2] - value) < 1e-6
+
+    def test_life_event_projection_df(self):
+        df = life_event_projection_df(
+            asset_types=["cash", "other"],
+            years=5,
+            start_amounts=[10000, 100],
+            monthly_contributions=[1000, 10])
+
+        assert list(df.columns) == ["year", "cash", "cashContribution", "cashWithContributions", "other", "otherContribution", "otherWithContributions"]
+        assert df["year"].tolist() == [1, 2, 3, 4, 5]
+        assert df["otherWithContributions"].iloc[-1] == 100 + 10 * 12 * 5
+        assert df["cash"].equals(life_event_df_f("cash", 5, 10000, 1000)["cash"].reset_index(drop=True))
@@ -0,0 +1,155 @@
+import time
+import unittest
+import unittest.mock
+
+import aiof.fi.core as fi
+import api.cache as api_cache
+
+from aiof.analytics.core import life_event
+from aiof.cache import LRUCache, memoize, memoized_stats
+from aiof.data.asset import Asset
+from aiof.data.life_event import LifeEventRequest
+from api.main import app
+from fastapi.testclient import TestClient
+
+
+class CacheTestCase(unittest.TestCase):
+    """
+    Cache unit tests
+    """
+
+    def test_lru_cache_get_set(self):
+        cache = LRUCache()
+        cache.set("a", b"1")
+
+        assert cache.get("a") == b"1"
+        assert cache.get("b") is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["hitRate"] == 0.5
+
+    def test_lru_cache_evicts_least_recently_used(self):
+        cache = LRUCache(max_bytes=10)
+        cache.set("a", b"1234")
+        cache.set("b", b"1234")
+        cache.get("a")
+        cache.set("c", b"1234")
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.stats()["bytes"] == 8
+        assert cache.stats()["evictions"] == 1
+
+    def test_lru_cache_max_entries(self):
+        cache = LRUCache(max_entries=2)
+        for key in ["a", "b", "c"]:
+            cache.set(key, b"1")
+
+        assert len(cache) == 2
+        assert "a" not in cache
+
+    def test_lru_cache_skips_values_bigger_than_max_bytes(self):
+        cache = LRUCache(max_bytes=2)
+        cache.set("a", b"1234")
+
+        assert len(cache) == 0
+
+    def test_lru_cache_ttl(self):
+        cache = LRUCache(ttl=0.01)
+        cache.set("a", b"1")
+        time.sleep(0.02)
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_cache_key_is_canonical(self):
+        key = api_cache.cache_key("route", { "req": { "a": 1, "b": 2 } }, ["DefaultRoundingDigit"])
+        key_2 = api_cache.cache_key("route", { "req": { "b": 2, "a": 1 } }, ["DefaultRoundingDigit"])
+
+        assert key == key_2
+        assert key != api_cache.cache_key("route", { "req": { "a": 1, "b": 3 } }, ["DefaultRoundingDigit"])
+        assert key != api_cache.cache_key("route_2", { "req": { "a": 1, "b": 2 } }, ["DefaultRoundingDigit"])
+
+    def test_cached_route_skips_calculation(self):
+        client = TestClient(app)
+        api_cache.response_cache.clear()
+        body = { "startingAmount": 1000, "interest": 8 }
+
+        resp = client.post("/api/fi/rule/of/72", json=body)
+        with unittest.mock.patch("aiof.fi.core.rule_of_72", side_effect=AssertionError):
+            resp_2 = client.post("/api/fi/rule/of/72", json=body)
+
+        assert resp.status_code == 200
+        assert resp_2.content == resp.content
+        assert client.get("/api/app/cache").json()["hits"] == 1
+
+    def test_memoize_keys_by_bound_arguments(self):
+        calls = []
+        @memoize()
+        def add(a, b=1):
+            calls.append((a, b))
+            return [a + b]
+
+        assert add(1) == [2]
+        assert add(a=1, b=1) == [2]
+        assert add(1, 2) == [3]
+        assert calls == [(1, 1), (1, 2)]
+        assert add.stats()["hits"] == 1
+        assert add.stats()["misses"] == 2
+
+    def test_memoize_returns_copies(self):
+        @memoize()
+        def values(items):
+            return [{ "value": i } for i in items]
+
+        values([1, 2])[0]["value"] = 100
+
+        assert values([1, 2])[0]["value"] == 1
+        assert values.stats()["hits"] == 1
+
+    def test_memoize_skips_unhashable_arguments(self):
+        @memoize()
+        def identity(value):
+            return 1
+
+        identity(bytearray(b"1"))
+        identity(bytearray(b"1"))
+
+        assert len(identity.cache) == 0
+
+    def test_memoize_max_entries(self):
+        @memoize(max_entries=2)
+        def square(x):
+            return x * x
+
+        for x in [1, 2, 3]:
+            square(x)
+
+        assert len(square.cache) == 2
+        assert square.stats()["evictions"] == 1
+
+    def test_life_event_reuses_cost_of_raising_children(self):
+        req = LifeEventRequest(
+            assets = [Asset(name = "cash", typeName = "cash", value = 10000)],
+            type = "having a child")
+        life_event(req)
+        hits = fi.cost_of_raising_children.stats()["hits"]
+        life_event(req)
+
+        assert fi.cost_of_raising_children.stats()["hits"] == hits + 1
+        assert "aiof.fi.core.cost_of_raising_children" in memoized_stats()
+        assert "aiof.fi.core.cost_of_raising_children" in TestClient(app).get("/api/app/cache/memoized").json()
+
+    def test_cost_of_raising_children_route_is_only_memoized(self):
+        client = TestClient(app)
+        req = { "annualExpensesStart": 12980, "annualExpensesIncrement": 0.02, "children": [1, 2], "interests": [4, 5] }
+        resp = client.post("/api/fi/cost/of/raising/children", json = req)
+        hits = fi.cost_of_raising_children.stats()["hits"]
+        response_stats = api_cache.response_cache.stats()
+        resp_2 = client.post("/api/fi/cost/of/raising/children", json = req)
+
+        assert resp.status_code == 200
+        assert resp_2.json() == resp.json()
+        assert fi.cost_of_raising_children.stats()["hits"] == hits + 1
+        assert api_cache.response_cache.stats() == response_stats
@@ -1,8 +1,13 @@
 import unittest
 import math
 import json
+import unittest.mock
 
-from aiof.car.core import loan_calc, value_depreciation_calc
+import aiof.car.core as car
+
+from aiof.car.core import loan_calc, loan_calc_batch, value_depreciation_calc, value_depreciation_calc_batch
+from aiof.car.depreciation import depreciation_profiles, depreciation_profile_rates
+from aiof.data.car import CarLoanRequest, CarValueDepreciationRequest
 
 
 class CarTestCase(unittest.TestCase):
@@ -22,6 +27,29 @@ class CarTestCase(unittest.TestCase):
                 interest=4,
                 years=6))
 
+    def test_car_loan_calc_page(self):
+        resp = loan_calc(car_loan=35000, interest=4, years=6)
+        page = loan_calc(car_loan=35000, interest=4, years=6, offset=2, limit=3)
+
+        assert page.page == { "offset": 2, "limit": 3, "total": 6 }
+        assert page.monthlyPayment == resp.monthlyPayment
+        assert page.data.reset_index(drop=True).equals(resp.data.iloc[2:5].reset_index(drop=True))
+        assert page.breakdown["totalPayments"].tolist() == page.data["payments"].tolist()
+
+    def test_car_loan_calc_batch(self):
+        resps = loan_calc_batch([
+            CarLoanRequest(carLoan=35000, interst=4, years=6),
+            CarLoanRequest(carLoan=20000, interst=6, years=3),
+            CarLoanRequest()
+        ])
+
+        assert len(resps) == 3
+        assert len(resps[0].data) == 6
+        assert len(resps[1].data) == 3
+        assert resps[0].data.equals(loan_calc(car_loan=35000, interest=4, years=6).data)
+        for resp in resps:
+            self.asset_loan_calc(resp)
+
     def asset_loan_calc(self, resp):
         assert resp.carLoan > 0
         assert resp.interest > 0
@@ -58,6 +86,67 @@ class CarTestCase(unittest.TestCase):
                 initial_value=25000,
                 years=7))
 
+    def test_value_depreciation_calc_batch(self):
+        dfs = value_depreciation_calc_batch([
+            CarValueDepreciationRequest(value=25000, years=4),
+            CarValueDepreciationRequest(value=40000, years=10),
+            CarValueDepreciationRequest()
+        ])
+
+        assert [len(df) for df in dfs] == [4, 10, 5]
+        for df in dfs:
+            self.assert_value_depreciation_calc(df)
+
+    def test_batches_too_many_requests(self):
+        with unittest.mock.patch.object(car, "_batch_max_requests", 2):
+            with self.assertRaises(ValueError):
+                loan_calc_batch([CarLoanRequest()] * 3)
+            with self.assertRaises(ValueError):
+                value_depreciation_calc_batch([CarValueDepreciationRequest()] * 3)
+
+            assert len(loan_calc_batch([CarLoanRequest()] * 2)) == 2
+
+    def test_batches_invalid_years(self):
+        for years in [0, -2, 101]:
+            with self.assertRaisesRegex(ValueError, "between 1 and 100"):
+                loan_calc_batch([CarLoanRequest(), CarLoanRequest(years=years)])
+            with self.assertRaisesRegex(ValueError, "between 1 and 100"):
+                value_depreciation_calc_batch([CarValueDepreciationRequest(), CarValueDepreciationRequest(years=years)])
+            with self.assertRaisesRegex(ValueError, "between 1 and 100"):
+                loan_calc(years=years, offset=0, limit=12)
+
+    def test_value_depreciation_calc_is_deterministic(self):
+        assert value_depreciation_calc(initial_value=25000, years=8).equals(
+            value_depreciation_calc(initial_value=25000, years=8))
+        assert value_depreciation_calc(initial_value=25000, years=8, seed=42).equals(
+            value_depreciation_calc(initial_value=25000, years=8, seed=42))
+
+    def test_value_depreciation_calc_profiles(self):
+        low_df = value_depreciation_calc(initial_value=25000, years=5, profile="low")
+        high_df = value_depreciation_calc(initial_value=25000, years=5, profile="high")
+
+        self.assert_value_depreciation_calc(low_df)
+        self.assert_value_depreciation_calc(high_df)
+        assert low_df.iloc[-1]["value"] > high_df.iloc[-1]["value"]
+
+    def test_value_depreciation_calc_invalid_profile_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            value_depreciation_calc(initial_value=25000, years=5, profile="definitelydoesntexist")
+
+    def test_depreciation_profile_rates_seed(self):
+        first_year, two_to_six_years, remaining_years = depreciation_profile_rates(seed=7)
+
+        assert 20 <= first_year < 30
+        assert 15 <= two_to_six_years < 18
+        assert first_year + two_to_six_years + remaining_years == 60
+
+    def test_depreciation_profiles(self):
+        profiles = depreciation_profiles()
+
+        assert "average" in profiles
+        for name in profiles:
+            assert profiles[name]["firstYear"] > profiles[name]["twoToSixYears"]
+
     def assert_value_depreciation_calc(self, df):
         assert df is not None
         assert df.size > 0
@@ -0,0 +1,59 @@
+import unittest
+import unittest.mock
+import numpy as np
+
+import aiof.compute as compute
+
+from aiof.compute import *
+from aiof.helpers import amortization_calc
+from aiof.retirement.montecarlo import withdrawal_monte_carlo
+
+
+class ComputeTestCase(unittest.TestCase):
+    """
+    Compute unit tests
+    """
+
+    def test_shards(self):
+        assert shards(10, 4) == [slice(0, 4), slice(4, 8), slice(8, 10)]
+        assert shards(8, 4) == [slice(0, 4), slice(4, 8)]
+        assert shards(0, 4) == [slice(0, 0)]
+
+    def test_get_executor_invalid(self):
+        with self.assertRaises(ValueError):
+            get_executor("gpu")
+
+    def test_get_executor_serial(self):
+        assert get_executor("serial") is None
+
+    def test_map_chunks_matches_serial(self):
+        args = [(np.full(3, 100000.0 * i), 0.04 / 12, 360) for i in range(1, 5)]
+        serial = map_chunks(amortization_calc, args, executor="serial")
+
+        for executor in ["thread", "process"]:
+            parallel = map_chunks(amortization_calc, args, executor=executor)
+            assert len(parallel) == len(serial)
+            for s, p in zip(serial, parallel):
+                assert np.array_equal(s["payment"], p["payment"])
+                assert np.array_equal(s["endingBalance"], p["endingBalance"])
+
+    def test_map_chunks_from_thread_pool_runs_inline(self):
+        args = [(np.full(3, 100000.0 * i), 0.04 / 12, 360) for i in range(1, 5)]
+        with unittest.mock.patch.multiple(compute, _thread_pool_size=2, _thread_pool=None):
+            pool = get_thread_pool()
+            try:
+                futures = [pool.submit(map_chunks, amortization_calc, args, "thread") for _ in range(2)]
+                results = [f.result(timeout=30) for f in futures]
+            finally:
+                pool.shutdown(wait=False)
+
+        assert all(len(r) == 4 for r in results)
+        assert not in_thread_pool()
+
+    def test_withdrawal_monte_carlo_executors_match(self):
+        serial = withdrawal_monte_carlo(paths=4000, seed=7, chunk_size=1000, executor="serial")
+        process = withdrawal_monte_carlo(paths=4000, seed=7, chunk_size=1000, executor="process")
+
+        assert serial["successRate"] == process["successRate"]
+        assert serial["safeWithdrawalRate"] == process["safeWithdrawalRate"]
+        assert serial["bands"].equals(process["bands"])
\ No newline at end of file
@@ -0,0 +1,79 @@
+import asyncio
+import threading
+import unittest
+import unittest.mock
+
+import aiof.compute as compute
+import api.cache as api_cache
+import api.dispatch as d
+
+from aiof.data.property import MortgageCalculatorRequest
+from aiof.property.core import mortgage_calc_batch
+from aiof.retirement.core import withdrawal_calc_batch
+from api.main import app
+from fastapi.testclient import TestClient
+
+
+class DispatchTestCase(unittest.TestCase):
+    """
+    Dispatch unit tests
+    """
+
+    def test_dispatch(self):
+        assert asyncio.run(d.dispatch(pow, 2, 10)) == 1024
+        assert d.pending() == 0
+
+    def test_dispatch_value_error(self):
+        with self.assertRaises(ValueError):
+            asyncio.run(d.dispatch(int, "not a number"))
+        assert d.pending() == 0
+
+    def test_dispatch_saturated(self):
+        with unittest.mock.patch.dict(d._max_pending, { "light": 0 }):
+            with self.assertRaises(d.DispatchSaturatedError):
+                asyncio.run(d.dispatch(pow, 2, 10))
+
+    def test_dispatch_saturated_response(self):
+        client = TestClient(app)
+        with unittest.mock.patch.dict(d._max_pending, { "light": 0 }):
+            resp = client.post("/api/fi/rule/of/72", json={})
+            assert resp.status_code == 429
+            assert "Retry-After" in resp.headers
+            assert client.get("/health").status_code == 200
+
+        resp = client.post("/api/fi/rule/of/72", json={})
+        assert resp.status_code == 200
+
+    def test_dispatch_concurrent_batches_do_not_deadlock(self):
+        async def batches():
+            return await asyncio.wait_for(asyncio.gather(
+                d.dispatch(withdrawal_calc_batch, heavy=True, retirement_numbers=[1000000, 2000000, 3000000], take_out_percentages=[3, 4]),
+                d.dispatch(mortgage_calc_batch, heavy=True, scenarios=[MortgageCalculatorRequest(loanAmount=100000 * i) for i in range(1, 6)])), timeout=30)
+
+        with unittest.mock.patch.multiple(compute, _thread_pool_size=2, _chunk_size=2, _thread_pool=None), \
+            unittest.mock.patch.multiple(d, _heavy_pool_size=2, _heavy_pool=None):
+            try:
+                withdrawal, mortgage = asyncio.run(batches())
+            finally:
+                compute.get_thread_pool().shutdown(wait=False)
+                d.get_heavy_pool().shutdown(wait=False)
+
+        assert len(withdrawal["summary"]) == 6
+        assert len(mortgage["summary"]) == 5
+
+    def test_dispatch_pools(self):
+        thread_name = lambda: threading.current_thread().name
+
+        assert not asyncio.run(d.dispatch(thread_name)).startswith(("aiof-dispatch", "aiof-compute"))
+        assert asyncio.run(d.dispatch(thread_name, heavy=True)).startswith("aiof-dispatch")
+
+    def test_dispatch_heavy_saturated_keeps_light_running(self):
+        client = TestClient(app)
+        with unittest.mock.patch.dict(d._max_pending, { "heavy": 0 }):
+            with self.assertRaises(d.DispatchSaturatedError):
+                asyncio.run(d.dispatch(pow, 2, 10, heavy=True))
+            assert client.post("/api/retirement/withdrawal/batch", json={}).status_code == 429
+            assert asyncio.run(d.dispatch(pow, 2, 10)) == 1024
+            assert client.post("/api/fi/rule/of/72", json={}).status_code == 200
+        assert d.pending() == 0
+        api_cache.response_cache.clear()
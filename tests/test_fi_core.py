@@ -108,6 +108,45 @@ class FiTestCase(unittest.TestCase):
                 assert year["interest"] >= 0
                 assert year["years"] > 0
 
+    def test_fi_ten_million_dream_years_matches_nper(self):
+        years = ten_million_dream_years(self._monthly_investment, [1000000, 5000000], [0, 4, 8])
+
+        assert years.shape == (2, 3)
+        for i, million in enumerate([1000000, 5000000]):
+            for j, interest in enumerate([0, 4, 8]):
+                expected = npf.nper((interest / 100) / 12, -self._monthly_investment, 0, million, when='begin') / 12
+                assert abs(years[i, j] - expected) < 1e-9
+
+    def test_fi_ten_million_dream_grid(self):
+        milestones = list(range(100000, 100000 * 1001, 100000))
+        interests = [i / 10 for i in range(200)]
+        resp = ten_million_dream_grid(self._monthly_investment, milestones, interests, as_json=True)
+
+        assert set(resp.keys()) == { "million", "interest", "years" }
+        assert len(resp["years"]) == len(milestones) * len(interests)
+        assert resp["million"][:2] == [100000, 100000]
+        assert resp["interest"][:2] == [0, 0.1]
+
+    def test_fi_ten_million_dream_grid_defaults_match(self):
+        df = ten_million_dream_grid(self._monthly_investment)
+        resp = ten_million_dream(self._monthly_investment)
+
+        assert df["years"].tolist() == [y["years"] for million in resp for y in million["years"]]
+
+    def test_fi_ten_million_dream_grid_too_big(self):
+        with self.assertRaises(ValueError):
+            ten_million_dream_grid(self._monthly_investment, list(range(1, 2001)), list(range(1000)))
+
+    def test_fi_ten_million_dream_grid_negative_interests(self):
+        with self.assertRaisesRegex(ValueError, "Interests"):
+            ten_million_dream_grid(self._monthly_investment, interests=[-5, 0])
+        with self.assertRaisesRegex(ValueError, "Interests"):
+            ten_million_dream_grid(self._monthly_investment, interests=[101])
+
+    def test_fi_ten_million_dream_grid_negative_milestones(self):
+        with self.assertRaisesRegex(ValueError, "Milestones"):
+            ten_million_dream_grid(self._monthly_investment, milestones=[-1000000, 1000000])
+
 
 
     def test_fi_compounded_interest_defaults(self):
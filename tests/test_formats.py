@@ -0,0 +1,154 @@
+import io
+import unittest
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+import api.formats as formats
+
+from api.main import app
+from fastapi.testclient import TestClient
+
+
+class FormatsTestCase(unittest.TestCase):
+    """
+    Response formats unit tests
+    """
+
+    _client = TestClient(app)
+    _mortgage = { "startDate": "2021-01-01T00:00:00" }
+
+    def test_response_format(self):
+        assert formats.response_format(None, None) == formats.RECORDS
+        assert formats.response_format("columns", None) == formats.COLUMNS
+        assert formats.response_format(None, "application/json; format=columns") == formats.COLUMNS
+        assert formats.response_format(None, "text/html, application/json;q=0.9;format=\"columns\"") == formats.COLUMNS
+        assert formats.response_format("records", "application/json; format=columns") == formats.RECORDS
+
+    def test_response_format_invalid(self):
+        with self.assertRaises(ValueError):
+            formats.response_format("xml", None)
+
+    def test_mortgage_columns(self):
+        records = self._client.post("/api/property/mortgage", json=self._mortgage).json()
+        columns = self._client.post("/api/property/mortgage?format=columns", json=self._mortgage).json()
+
+        assert list(columns["data"].keys()) == list(records["data"][0].keys())
+        assert len(columns["data"]["payment"]) == len(records["data"])
+        assert columns["data"]["endingBalance"] == [r["endingBalance"] for r in records["data"]]
+        assert columns["data"]["paymentDate"][0] == records["data"][0]["paymentDate"]
+        assert columns["breakdown"]["totalPayment"] == [r["totalPayment"] for r in records["breakdown"]]
+
+    def test_accept_header_columns(self):
+        resp = self._client.post(
+            "/api/fi/compound/interest",
+            json={},
+            headers={ "Accept": "application/json; format=columns" })
+
+        assert resp.status_code == 200
+        assert isinstance(resp.json()["compoundedEnd"], list)
+
+    def test_invalid_format(self):
+        resp = self._client.post("/api/car/loan?format=xml", json={})
+
+        assert resp.status_code == 400
+
+    def test_response_format_binary(self):
+        assert formats.table_format("arrow", None) == formats.ARROW
+        assert formats.table_format(None, "application/vnd.apache.parquet") == formats.PARQUET
+        with self.assertRaises(ValueError):
+            formats.response_format("arrow", None)
+
+    def test_mortgage_arrow(self):
+        records = self._client.post("/api/property/mortgage", json=self._mortgage).json()
+        resp = self._client.post("/api/property/mortgage?format=arrow", json=self._mortgage)
+        df = pa.ipc.open_stream(resp.content).read_all().to_pandas()
+
+        assert resp.headers["content-type"] == formats.media_types[formats.ARROW]
+        assert len(df) == len(records["data"])
+        assert df["endingBalance"].tolist() == [r["endingBalance"] for r in records["data"]]
+
+    def test_withdrawal_parquet(self):
+        body = { "retirementNumber": 1000000, "takeOutPercentage": 4, "numberOfYears": 30 }
+        resp = self._client.post(
+            "/api/retirement/withdrawal",
+            json=body,
+            headers={ "Accept": formats.media_types[formats.PARQUET] })
+        df = pq.read_table(io.BytesIO(resp.content)).to_pandas()
+
+        assert resp.headers["content-type"] == formats.media_types[formats.PARQUET]
+        assert len(df) == 30
+
+    def test_asset_breakdown_arrow(self):
+        resp = self._client.post("/api/asset/breakdown?format=arrow", json={ "name": "cash", "typeName": "cash", "value": 1000 })
+        df = pa.ipc.open_stream(resp.content).read_all().to_pandas()
+
+        assert df["breakdown"].nunique() == 4
+
+    def test_mortgage_csv(self):
+        records = self._client.post("/api/property/mortgage", json=self._mortgage).json()
+        resp = self._client.post("/api/property/mortgage", json=self._mortgage, headers={ "Accept": "text/csv" })
+        lines = resp.text.splitlines()
+
+        assert resp.headers["content-type"].startswith(formats.media_types[formats.CSV])
+        assert lines[0] == ",".join(records["data"][0].keys())
+        assert len(lines) == len(records["data"]) + 1
+
+    def test_loan_payments_csv(self):
+        resp = self._client.get("/api/helpers/loan/payments/csv?loanAmount=200000&numberOfYears=30&rateOfInterest=3.2&frequency=daily")
+        lines = resp.text.splitlines()
+
+        assert lines[0].startswith("day,")
+        assert len(lines) == 30 * 365 + 1
+
+    def test_loan_payments_csv_invalid(self):
+        assert self._client.get("/api/helpers/loan/payments/csv?rateOfInterest=500").status_code == 400
+        assert self._client.get("/api/helpers/loan/payments/csv?numberOfYears=10000000&frequency=daily").status_code == 400
+
+    def test_asset_breakdown_csv(self):
+        resp = self._client.get("/api/asset/breakdown/csv?assetValue=1000&contribution=100&years=3")
+
+        assert resp.text.splitlines()[0] == "year,contribution,rate,value"
+        assert len(resp.text.splitlines()) == 4
+
+    def test_mortgage_page(self):
+        records = self._client.post("/api/property/mortgage", json=self._mortgage).json()
+        resp = self._client.post("/api/property/mortgage?offset=12&limit=12&format=columns", json=self._mortgage).json()
+
+        assert resp["page"] == { "offset": 12, "limit": 12, "total": 360 }
+        assert resp["data"]["endingBalance"] == [r["endingBalance"] for r in records["data"][12:24]]
+        assert resp["breakdown"]["year"] == [2022]
+
+    def test_car_loan_page(self):
+        resp = self._client.post("/api/car/loan?offset=4", json={}).json()
+
+        assert resp["page"] == { "offset": 4, "limit": 12, "total": 5 }
+        assert len(resp["data"]) == 1
+
+    def test_life_event_timeline_columns(self):
+        body = {
+            "assets": [{ "name": "cash", "typeName": "cash", "value": 10000 }],
+            "startDate": "2021-01-01T00:00:00",
+            "events": [{ "type": "buying a car", "plannedDate": "2022-01-01T00:00:00" }]
+        }
+        resp = self._client.post("/api/analytics/life/event/timeline?format=columns", json=body).json()
+
+        assert resp["months"] == 12 * 6
+        assert resp["events"][0]["startMonth"] == 12
+        assert resp["timeline"]["date"][12] == "2022-01-01T00:00:00"
+
+    def test_life_event_past_planned_date(self):
+        body = {
+            "assets": [{ "name": "cash", "typeName": "cash", "value": 10000 }],
+            "type": "buying a car",
+            "plannedDate": "2020-01-01T00:00:00"
+        }
+        resp = self._client.post("/api/analytics/life/event", json=body)
+
+        assert resp.status_code == 200
+        assert resp.json() == self._client.post("/api/analytics/life/event", json=dict(body, plannedDate=None)).json()
+
+    def test_ten_million_dream_grid_invalid(self):
+        resp = self._client.post("/api/fi/ten/million/dream", json={ "monthlyInvestment": 1000, "interests": [-5, 0] })
+
+        assert resp.status_code == 400
+        assert "Interests" in resp.json()["message"]
@@ -1,3 +1,4 @@
+import io
 import unittest
 import json
 import pandas as pd
@@ -76,6 +77,90 @@ class HelpersTestCase(unittest.TestCase):
     def test_loan_payments_calc_as_table_monthly_as_df(self):
         payments_df = loan_payments_calc_as_table(30000, 6, 4.5)
 
+    def test_loan_payments_calc_as_table_daily(self):
+        payments_df = loan_payments_calc_as_table(200000, 30, 3.2, "daily")
+
+        assert len(payments_df) == 10950
+        assert payments_df["day"].iloc[-1] == 10950
+        assert payments_df["initialBalance"].iloc[1] == payments_df["endingBalance"].iloc[0]
+        assert payments_df["endingBalance"].iloc[-1] == 0
+
+
+    def test_amortization_calc(self):
+        schedule = amortization_calc(30000, 0.045 / 12, 72)
+
+        assert len(schedule["payment"]) == 72
+        assert schedule["startingBalance"][0] == 30000
+        assert round(schedule["payment"][0], 2) == 476.22
+        assert round(schedule["endingBalance"][-1], 2) == 0
+        assert round(schedule["principal"].sum(), 2) == 30000
+    def test_amortization_calc_zero_rate(self):
+        schedule = amortization_calc(12000, 0, 12)
+
+        assert schedule["payment"][0] == 1000
+        assert schedule["interest"].sum() == 0
+        assert schedule["endingBalance"][-1] == 0
+    def test_amortization_calc_multiple_loans(self):
+        schedule = amortization_calc([30000, 10000], [0.045 / 12, 0.07 / 12], [72, 36])
+
+        assert schedule["payment"].shape == (2, 72)
+        assert schedule["payment"][1, 36:].sum() == 0
+        assert round(schedule["endingBalance"][1, 35], 2) == 0
+
+
+    def test_schedule_breakdown_monthly_loan(self):
+        loan_df = loan_payments_calc_as_table(30000, 6, 4.5)
+        breakdown_df = schedule_breakdown(
+            loan_df,
+            by                  = (loan_df["month"] - 1) // 12 + 1,
+            starting_balance    = "initialBalance",
+            totals              = { "payment": "totalPayment", "interest": "totalInterest" })
+
+        assert len(breakdown_df) == 6
+        assert breakdown_df["year"].tolist() == [1, 2, 3, 4, 5, 6]
+        assert breakdown_df.loc[0, "initialBalance"] == 30000
+        assert breakdown_df.loc[5, "endingBalance"] == 0
+        assert round(breakdown_df["totalInterest"].sum(), 2) == round(loan_df["interest"].sum(), 2)
+    def test_schedule_breakdown_100_years(self):
+        loan_df = loan_payments_calc_as_table(500000, 100, 5, "yearly")
+        breakdown_df = schedule_breakdown(loan_df, by="year", starting_balance="initialBalance")
+
+        assert len(breakdown_df) == 100
+        assert breakdown_df["endingBalance"].tolist() == loan_df["endingBalance"].tolist()
+
+
+    def test_loan_payments_calc_summary(self):
+        summary = loan_payments_calc_summary([30000, 200000], [6, 15], [4.5, 7.5], "monthly")
+
+        assert summary["payment"].tolist() == [476.22, 1854.02]
+        assert summary["totalPayments"][0] == round(loan_payments_calc(30000, 6, 4.5) * 72, 2)
+        assert summary["totalInterest"][0] == round(summary["totalPayments"][0] - 30000, 2)
+    def test_loan_payments_calc_summary_matches_table(self):
+        summary = loan_payments_calc_summary([10000], [6], [7], ["yearly"])
+        loan_df = loan_payments_calc_as_table(10000, 6, 7, "yearly")
+
+        assert abs(summary["totalInterest"][0] - loan_df["interest"].sum()) < 0.05
+    def test_loan_payments_calc_summary_raises_exception(self):
+        with self.assertRaises(Exception): loan_payments_calc_summary([10000], [6], [200], ["yearly"])
+
+    def test_loan_payments_calc_custom_multiple_stats(self):
+        stats_df = loan_payments_calc_custom_multiple_stats(30000, 6, 4.5,
+            new_loan_amounts        = [25000, 30000],
+            new_number_of_years     = [5, 3],
+            new_rate_of_interests   = [4, 3.5],
+            new_frequencies         = ["monthly", "yearly"])
+
+        assert len(stats_df) == 3
+        assert stats_df["description"].tolist() == ["original loan payments", "updated loan payments", "updated loan payments"]
+        assert (stats_df["totalInterest"] > 0).all()
+    def test_loan_payments_calc_custom_multiple_stats_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            loan_payments_calc_custom_multiple_stats(30000, 6, 4.5,
+                new_loan_amounts        = [25000],
+                new_number_of_years     = [5, 3],
+                new_rate_of_interests   = [4, 3.5],
+                new_frequencies         = ["monthly", "yearly"])
+
 
     def test_simple_interest_calc(self):
         assert simple_interest_calc(1000, 15, 5) == 7.5
@@ -127,3 +212,79 @@ class HelpersTestCase(unittest.TestCase):
         assert df is not None
         assert df["month"].iloc[0] > 0
         assert df["year"].iloc[0] > 0
+
+
+    def test_df_to_columns(self):
+        df = pd.DataFrame({
+            "date": pd.date_range("2021-01-01", periods=3, freq="MS"),
+            "value": [1.5, 2.5, 3.5],
+            "count": [1, 2, 3],
+        })
+        columns = df_to_columns(df)
+
+        assert list(columns.keys()) == ["date", "value", "count"]
+        assert columns["value"] == [1.5, 2.5, 3.5]
+        assert type(columns["count"][0]) is int
+        assert columns["date"][0] == datetime(2021, 1, 1)
+        assert records_from_columns(columns) == df.to_dict(orient="records")
+
+    def test_df_to_json(self):
+        df = pd.DataFrame({ "a": [1, 2], "b": [3.0, 4.0] })
+
+        assert df_to_json(df) == [{ "a": 1, "b": 3.0 }, { "a": 2, "b": 4.0 }]
+        assert df_to_json(df, as_columns=True) == { "a": [1, 2], "b": [3.0, 4.0] }
+
+    def test_export_to_arrow(self):
+        import pyarrow as pa
+
+        df = loan_payments_calc_as_table(30000, 6, 4.5)
+        chunks = list(export_to_arrow(df, chunk_rows=20))
+        exported = pa.ipc.open_stream(b"".join(chunks)).read_all().to_pandas()
+
+        assert len(chunks) > 1
+        assert exported.equals(df)
+
+    def test_export_to_parquet(self):
+        import pyarrow.parquet as pq
+
+        df = loan_payments_calc_as_table(30000, 6, 4.5)
+        parquet_file = pq.ParquetFile(io.BytesIO(b"".join(export_to_parquet(df, chunk_rows=20))))
+
+        assert parquet_file.num_row_groups == 4
+        assert parquet_file.read().to_pandas().equals(df)
+
+    def test_loan_payments_calc_as_chunks(self):
+        df = loan_payments_calc_as_table(200000, 30, 3.2, "daily")
+        chunks = list(loan_payments_calc_as_chunks(200000, 30, 3.2, "daily", chunk_rows=1000))
+
+        assert len(chunks) == 11
+        assert all(len(c) <= 1000 for c in chunks)
+        assert pd.concat(chunks, ignore_index=True).equals(df)
+
+    def test_loan_payments_calc_as_chunks_invalid_rate_and_years(self):
+        with self.assertRaises(ValueError):
+            loan_payments_calc_as_chunks(30000, 6, 500)
+        with self.assertRaises(ValueError):
+            loan_payments_calc_as_chunks(30000, 6, -1)
+        with self.assertRaises(ValueError):
+            loan_payments_calc_as_chunks(30000, 10000000, 4.5, "daily")
+        with self.assertRaises(ValueError):
+            loan_payments_calc_as_chunks(30000, 0, 4.5)
+
+    def test_loan_payments_calc_as_chunks_invalid_frequency(self):
+        with self.assertRaises(ValueError):
+            loan_payments_calc_as_chunks(30000, 6, 4.5, "test")
+
+    def test_export_to_csv_chunks(self):
+        df = loan_payments_calc_as_table(30000, 6, 4.5)
+        chunks = list(export_to_csv(df, chunk_rows=20))
+
+        assert len(chunks) == 4
+        assert chunks[0].startswith("month,")
+        assert not chunks[1].startswith("month,")
+        assert pd.read_csv(io.StringIO("".join(chunks))).equals(df)
+
+    def test_export_to_csv_generator(self):
+        csv = "".join(export_to_csv(loan_payments_calc_as_chunks(30000, 6, 4.5, chunk_rows=7)))
+
+        assert csv == loan_payments_calc_as_table(30000, 6, 4.5).to_csv(index=False)
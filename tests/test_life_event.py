@@ -1,8 +1,14 @@
+import datetime
 import unittest
+import unittest.mock
 
+import aiof.analytics.life_events as life_events
+import aiof.car.core as car
+
+from aiof.analytics.core import life_event, life_event_timeline
 from aiof.data.asset import Asset
 from aiof.data.liability import Liability
-from aiof.data.life_event import LifeEventRequest
+from aiof.data.life_event import LifeEvent, LifeEventRequest, LifeEventTimelineRequest
 
 
 class LifeEventTestCase(unittest.TestCase):
@@ -66,4 +72,132 @@ class LifeEventTestCase(unittest.TestCase):
                 liabilities = self._liabilities,
                 type = None,
                 amount = 15000.00,
-                plannedDate = None)
\ No newline at end of file
+                plannedDate = None)
+
+    def test_life_event_handlers_are_registered(self):
+        for t in ["having a child", "buying a house", "buying a car", "selling a car"]:
+            assert life_events.get_handler(t) is not None
+        with self.assertRaises(ValueError):
+            life_events.get_handler("definitelydoesntexist")
+
+    def test_life_event_having_a_child(self):
+        df = life_event(LifeEventRequest(assets = self._assets, type = "having a child")).event
+
+        assert len(df) == 18
+        assert list(df.columns) == ["year", "cash", "cashContribution", "cashWithContributions",
+            "investment", "investmentContribution", "investmentWithContributions",
+            "stock", "stockContribution", "stockWithContributions"]
+        assert df["cash"].iloc[-1] < 43000
+
+    def test_life_event_buying_a_house(self):
+        df = life_event(LifeEventRequest(
+            assets = self._assets,
+            type = "buying a house",
+            houseValue = 200000,
+            houseDownPayment = 40000,
+            houseYears = 15)).event
+
+        assert len(df) == 15
+        assert df["cash"].iloc[0] < 43000 - 40000
+
+    def test_life_event_buying_a_house_invalid_down_payment(self):
+        with self.assertRaises(ValueError):
+            life_event(LifeEventRequest(assets = self._assets, type = "buying a house", houseValue = 1000, houseDownPayment = 2000))
+        with self.assertRaises(ValueError):
+            life_event(LifeEventRequest(assets = self._assets, type = "buying a house", houseDownPayment = -60000))
+        with self.assertRaises(ValueError):
+            life_event(LifeEventRequest(assets = self._assets, type = "buying a house", houseValue = -300000, houseDownPayment = -400000))
+        with self.assertRaises(ValueError):
+            life_event(LifeEventRequest(assets = self._assets, type = "buying a house", houseInterest = 500))
+
+    def test_life_event_car_liability_types(self):
+        assert life_events._car_liability_types == ["auto loan", "auto lease"]
+
+    def test_life_event_selling_a_car(self):
+        assets = self._assets + [Asset(name="car", typeName="car", value=15000)]
+        liabilities = [Liability(name="car loan", typeName="auto loan", value=10000, years=3, monthlyPayment=300)]
+        df = life_event(LifeEventRequest(assets = assets, liabilities = liabilities, type = "selling a car")).event
+
+        assert len(df) == 3
+        assert df["cash"].iloc[0] > 43000 + 15000 + 12 * 300
+
+    def test_life_event_combined_events(self):
+        child = life_event(LifeEventRequest(assets = self._assets, type = "having a child")).event
+        combined = life_event(LifeEventRequest(
+            assets = self._assets,
+            type = "having a child",
+            events = [
+                LifeEvent(type = "buying a car", carYears = 5),
+                LifeEvent(type = "buying a house", houseYears = 30)
+            ])).event
+
+        assert len(combined) == 30
+        assert (combined["cash"].iloc[:18] < child["cash"]).all()
+        assert combined["stock"].iloc[:18].equals(child["stock"])
+
+    def test_life_event_ignores_planned_date(self):
+        now = life_event(LifeEventRequest(assets = self._assets, type = "buying a car")).event
+
+        for planned_date in [datetime.datetime(2020, 1, 1), datetime.datetime.utcnow() + datetime.timedelta(days=548)]:
+            planned = life_event(LifeEventRequest(assets = self._assets, type = "buying a car", plannedDate = planned_date)).event
+            assert planned.equals(now)
+
+    def test_life_event_timeline(self):
+        resp = life_event_timeline(LifeEventTimelineRequest(
+            assets = self._assets,
+            startDate = datetime.datetime(2021, 3, 15),
+            events = [
+                LifeEvent(type = "having a child", plannedDate = datetime.datetime(2022, 1, 1)),
+                LifeEvent(type = "buying a house", plannedDate = datetime.datetime(2023, 3, 1), houseDownPayment = 50000, houseYears = 15)
+            ]))
+        df = resp["timeline"]
+
+        assert resp["months"] == 10 + 18 * 12
+        assert [e["startMonth"] for e in resp["events"]] == [10, 24]
+        assert df["date"].iloc[0] == datetime.datetime(2021, 3, 1)
+        assert (df["cashCashFlow"].iloc[:10] == 0).all()
+        assert df["cashCashFlow"].iloc[10] < 0
+        assert df["cashCashFlow"].iloc[24] < -50000
+        assert (df["stockCashFlow"] == 0).all()
+
+    def test_life_event_timeline_years(self):
+        resp = life_event_timeline(LifeEventTimelineRequest(
+            assets = self._assets,
+            events = [LifeEvent(type = "buying a car")],
+            years = 40))
+
+        assert len(resp["timeline"]) == 480
+
+    def test_life_event_timeline_invalid(self):
+        with self.assertRaises(ValueError):
+            life_event_timeline(LifeEventTimelineRequest(assets = self._assets, events = []))
+        with self.assertRaises(ValueError):
+            life_event_timeline(LifeEventTimelineRequest(
+                assets = self._assets,
+                startDate = datetime.datetime(2021, 3, 15),
+                events = [LifeEvent(type = "buying a car", plannedDate = datetime.datetime(2020, 1, 1))]))
+
+    def test_life_event_years_are_capped(self):
+        with self.assertRaisesRegex(ValueError, "between 1 and 100"):
+            life_event(LifeEventRequest(assets = self._assets, type = "buying a car", carYears = 1000000))
+        with self.assertRaisesRegex(ValueError, "between 1 and 100"):
+            life_event(LifeEventRequest(assets = self._assets, type = "buying a car", carYears = -3))
+        with self.assertRaisesRegex(ValueError, "between 1 and 100"):
+            life_event(LifeEventRequest(assets = self._assets, type = "buying a house", houseYears = 0))
+        with self.assertRaises(ValueError):
+            life_event(LifeEventRequest(
+                assets = self._assets,
+                liabilities = [Liability(name="car loan", typeName="auto loan", value=10000, years=-2, monthlyPayment=300)],
+                type = "selling a car"))
+
+    def test_life_event_timeline_checks_years_before_handlers(self):
+        with unittest.mock.patch.object(car, "loan_calc", side_effect=AssertionError):
+            with self.assertRaisesRegex(ValueError, "between 1 and 100"):
+                life_event_timeline(LifeEventTimelineRequest(
+                    assets = self._assets,
+                    events = [LifeEvent(type = "buying a car", carYears = 1000000)]))
+            with self.assertRaises(ValueError):
+                life_event_timeline(LifeEventTimelineRequest(
+                    assets = self._assets,
+                    startDate = datetime.datetime(2021, 1, 1),
+                    events = [LifeEvent(type = "buying a car", plannedDate = datetime.datetime(2500, 1, 1))]))
@@ -0,0 +1,74 @@
+import json
+import unittest
+import unittest.mock
+
+import aiof.config as config
+import aiof.fi.core as fi
+import api.precompute as precompute
+
+from api.main import app
+from fastapi.testclient import TestClient
+
+
+class PrecomputeTestCase(unittest.TestCase):
+    """
+    Precompute unit tests
+    """
+
+    def test_families_matches_calculation(self):
+        body = precompute.get("cost_of_raising_children_families")
+
+        assert json.loads(body) == json.loads(json.dumps(fi.cost_of_raising_children_faimilies()))
+
+    def test_ten_million_dream_matches_calculation(self):
+        body = precompute.get("ten_million_dream", 1000.0)
+
+        assert json.loads(body) == json.loads(json.dumps(fi.ten_million_dream(1000)))
+
+    def test_ten_million_dream_not_precomputed(self):
+        assert precompute.get("ten_million_dream", 1234.5) is None
+
+    def test_invalidated_when_settings_change(self):
+        settings = config.get_settings()
+        body = precompute.get("cost_of_raising_children_families")
+
+        settings.DefaultChildren.append(5)
+        try:
+            precompute.refresh()
+            body_2 = precompute.get("cost_of_raising_children_families")
+            assert body_2 != body
+            assert len(json.loads(body_2)[0]["children"]) == len(settings.DefaultChildren)
+        finally:
+            settings.DefaultChildren.pop()
+            precompute.refresh()
+
+        assert precompute.get("cost_of_raising_children_families") == body
+
+    def test_get_does_not_fingerprint_every_call(self):
+        precompute.get("cost_of_raising_children_families")
+        with unittest.mock.patch.object(precompute, "fingerprint", side_effect=AssertionError):
+            assert precompute.get("ten_million_dream", 1000.0) is not None
+
+    def test_refreshed_when_settings_are_reloaded(self):
+        precompute.get("cost_of_raising_children_families")
+        reloaded = config.Settings()
+        with unittest.mock.patch.object(config, "get_settings", return_value=reloaded), \
+            unittest.mock.patch.object(precompute, "materialize", side_effect=AssertionError):
+            assert precompute.get("ten_million_dream", 1000.0) is not None
+            assert precompute._materialized_settings is reloaded
+        precompute.get("cost_of_raising_children_families")
+
+    def test_precomputed_routes(self):
+        client = TestClient(app)
+
+        resp = client.get("/api/fi/cost/of/raising/children/families")
+        assert resp.status_code == 200
+        assert resp.content == precompute.get("cost_of_raising_children_families")
+
+        resp = client.get("/api/fi/ten/million/dream/1000")
+        assert resp.status_code == 200
+        assert resp.content == precompute.get("ten_million_dream", 1000.0)
+
+        resp = client.get("/api/fi/ten/million/dream/1234.5")
+        assert resp.status_code == 200
+        assert resp.json() == json.loads(json.dumps(fi.ten_million_dream(1234.5)))
\ No newline at end of file
@@ -1,8 +1,12 @@
 import unittest
 import json
 import math
+import unittest.mock
+
+import aiof.compute as compute
 
 from aiof.property.core import *
+from aiof.data.property import MortgageCalculatorRequest, MortgageCalculatorGrid
 
 
 class HouseTestCase(unittest.TestCase):
@@ -74,7 +78,91 @@ class HouseTestCase(unittest.TestCase):
     def test_mortgage_calc_invalid_monthly_hoa_raises_value_error(self):
         with self.assertRaises(ValueError): 
             mortgage_calc(monthly_hoa = -1)
+
+
+    def test_mortgage_calc_batch_defaults(self):
+        resp = mortgage_calc_batch()
+
+        assert len(resp["summary"]) == 1
+        assert "schedules" not in resp
+        assert resp["summary"].loc[0, "loanAmount"] == 240000
+
+    def test_mortgage_calc_batch_grid(self):
+        resp = mortgage_calc_batch(
+            grid = MortgageCalculatorGrid(
+                downPayments    = [30000, 60000],
+                interestRates   = [2.75, 3.8, 4.25],
+                loanTermYears   = [15, 30]))
+
+        assert len(resp["summary"]) == 12
+        assert (resp["summary"]["monthlyPayment"] > 0).all()
+        assert (resp["summary"]["totalInterestPaid"] > 0).all()
+
+    def test_mortgage_calc_batch_matches_mortgage_calc(self):
+        start_date = datetime.datetime(2020, 11, 15)
+        resp = mortgage_calc_batch(
+            scenarios = [
+                MortgageCalculatorRequest(
+                    propertyValue   = 150000,
+                    downPayment     = 15000,
+                    interestRate    = 2.75,
+                    loanTermYears   = 15)
+            ],
+            start_date          = start_date,
+            include_schedules   = True)
+        df = mortgage_calc(
+            property_value  = 150000,
+            down_payment    = 15000,
+            interest_rate   = 2.75,
+            loan_term_years = 15,
+            start_date      = start_date)
+
+        assert resp["schedules"][0].equals(df)
+        assert resp["summary"].loc[0, "payoffDate"] == df.loc[len(df), "paymentDate"]
+        assert resp["summary"].loc[0, "totalPayment"] == round(df["payment"].sum(), 2)
+
+    def test_mortgage_calc_batch_summary_without_schedules(self):
+        scenarios = [MortgageCalculatorRequest(propertyValue=300000, downPayment=60000, loanTermYears=100) for _ in range(50)]
+        with unittest.mock.patch.object(compute, "map_chunks", side_effect=AssertionError):
+            resp = mortgage_calc_batch(scenarios=scenarios)
+        summary = resp["summary"]
+
+        assert "schedules" not in resp
+        assert summary.loc[0, "totalPrincipalPaid"] == 240000
+        assert summary.loc[0, "totalPayment"] == round(summary.loc[0, "monthlyPayment"] * 1200, 2)
+        assert summary.loc[0, "totalInterestPaid"] == round(summary.loc[0, "totalPayment"] - 240000, 2)
+
+    def test_mortgage_calc_batch_invalid_scenario_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            mortgage_calc_batch(
+                grid = MortgageCalculatorGrid(interestRates = [3, 101]))
+        with self.assertRaisesRegex(ValueError, "between 1 and 100"):
+            mortgage_calc_batch(
+                grid = MortgageCalculatorGrid(loanTermYears = [30, 0]))
         
+    def test_mortgage_calc_page(self):
+        start_date = datetime.datetime(2021, 1, 1)
+        df = mortgage_calc(start_date = start_date)
+        resp = mortgage_calc(start_date = start_date, offset = 120, limit = 12)
+
+        assert resp["page"] == { "offset": 120, "limit": 12, "total": 360 }
+        assert resp["data"].equals(df.iloc[120:132])
+        assert resp["breakdown"]["year"].tolist() == [2031]
+        assert resp["breakdown"].loc[0, "totalPayment"] == round(df.iloc[120:132]["payment"].sum(), 2)
+
+    def test_mortgage_calc_page_past_the_end(self):
+        resp = mortgage_calc(offset = 360, as_json = True)
+
+        assert resp["data"] == []
+        assert resp["breakdown"] == []
+        assert resp["page"]["total"] == 360
+
+    def test_mortgage_calc_page_invalid_limit_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            mortgage_calc(limit = 0)
+        with self.assertRaises(ValueError):
+            mortgage_calc(offset = -1)
+
     def mortgage_calc_assert(self, df):
         assert df is not None
         assert df.size > 0
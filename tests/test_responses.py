@@ -0,0 +1,87 @@
+import datetime
+import json
+import unittest
+import numpy as np
+import pandas as pd
+
+from aiof.data.asset import Asset
+from aiof.property.core import mortgage_calc
+from aiof.retirement.core import withdrawal_calc
+from api.main import app
+from api.responses import dumps, FastJSONResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+
+class ResponsesTestCase(unittest.TestCase):
+    """
+    Responses unit tests
+    """
+
+    _df = pd.DataFrame({
+        "date": pd.date_range("2021-01-01", periods=3, freq="MS"),
+        "value": [1.25, np.nan, 3.5],
+        "count": [1, 2, 3],
+        "maybe": pd.Series([None, 2, None], dtype=object),
+    })
+
+    def test_dumps_scalars(self):
+        assert dumps(None) == b"null"
+        assert dumps(float("nan")) == b"null"
+        assert dumps(np.float64(1.5)) == b"1.5"
+        assert dumps(np.int64(2)) == b"2"
+        assert dumps(np.bool_(True)) == b"true"
+        assert dumps(datetime.datetime(2021, 1, 1, 10, 30)) == b'"2021-01-01T10:30:00"'
+
+    def test_dumps_df_records(self):
+        resp = json.loads(dumps(self._df))
+
+        assert resp[0] == { "date": "2021-01-01T00:00:00", "value": 1.25, "count": 1, "maybe": None }
+        assert resp[1]["value"] is None
+        assert resp[1]["maybe"] == 2
+
+    def test_dumps_df_columns(self):
+        resp = json.loads(dumps(self._df, as_columns=True))
+
+        assert resp["date"] == ["2021-01-01T00:00:00", "2021-02-01T00:00:00", "2021-03-01T00:00:00"]
+        assert resp["value"] == [1.25, None, 3.5]
+        assert resp["count"] == [1, 2, 3]
+
+    def test_dumps_dates_with_microseconds(self):
+        df = pd.DataFrame({ "date": [pd.Timestamp("2021-01-01 10:30:15.123456")] })
+
+        assert json.loads(dumps(df))[0]["date"] == datetime.datetime(2021, 1, 1, 10, 30, 15, 123456).isoformat()
+
+    def test_dumps_nested(self):
+        resp = json.loads(dumps({
+            "asset": Asset(name="cash", typeName="cash", value=100),
+            "frames": [self._df.head(1)],
+            "array": np.array([1.0, np.inf]),
+        }))
+
+        assert resp["asset"]["value"] == 100
+        assert resp["frames"][0][0]["count"] == 1
+        assert resp["array"] == [1.0, None]
+
+    def test_fast_json_response(self):
+        resp = FastJSONResponse({ "data": self._df }, as_columns=True)
+
+        assert resp.media_type == "application/json"
+        assert json.loads(resp.body)["data"]["count"] == [1, 2, 3]
+
+    def test_dumps_floats_are_shortest_round_trip(self):
+        df = pd.DataFrame({ "value": [2720373.83, 0.1 + 0.2] })
+
+        assert dumps(df) == b'[{"value":2720373.83},{"value":0.30000000000000004}]'
+        assert dumps(df, as_columns=True) == b'{"value":[2720373.83,0.30000000000000004]}'
+
+    def test_dumps_matches_json_response(self):
+        for df in [withdrawal_calc(), mortgage_calc(start_date=datetime.datetime(2021, 1, 15))]:
+            assert dumps(df) == JSONResponse(jsonable_encoder(df.to_dict(orient="records"))).body
+
+    def test_schedule_endpoint_matches_json_response(self):
+        resp = TestClient(app).post("/api/retirement/withdrawal", json={ "retirementNumber": 2720373.83, "takeOutPercentage": 3.5, "numberOfYears": 40 })
+        df = withdrawal_calc(retirement_number=2720373.83, take_out_percentage=3.5, number_of_years=40)
+
+        assert resp.content == JSONResponse(jsonable_encoder(df.to_dict(orient="records"))).body
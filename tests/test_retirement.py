@@ -91,6 +91,45 @@ class RetirementTestCase(unittest.TestCase):
                 take_out_percentage = 3.5,
                 number_of_years     = -30)
 
+    def test_withdrawal_calc_matches_closed_form(self):
+        df = withdrawal_calc(
+            retirement_number   = 1000000,
+            take_out_percentage = 4,
+            number_of_years     = 2)
+
+        assert df.loc[0, "endingRetirementNumber"] == 1027200
+        assert df.loc[1, "startingRetirementNumber"] == 1027200
+        assert df.loc[1, "endingRetirementNumber"] == round((1027200 - 40000) * 1.07, 2)
+
+    def test_withdrawal_calc_batch(self):
+        resp = withdrawal_calc_batch(
+            retirement_numbers      = [1000000, 2000000],
+            take_out_percentages    = [3, 4, 9.5],
+            number_of_years         = 30,
+            include_schedules       = True)
+
+        assert len(resp["summary"]) == 6
+        assert len(resp["schedules"]) == 6
+        assert resp["summary"].loc[0, "depletedYear"] is None
+        assert resp["summary"].loc[2, "depletedYear"] > 0
+        assert resp["schedules"][0].equals(withdrawal_calc(
+            retirement_number   = 1000000,
+            take_out_percentage = 3,
+            number_of_years     = 30))
+
+    def test_withdrawal_calc_batch_defaults(self):
+        resp = withdrawal_calc_batch()
+
+        assert len(resp["summary"]) == 1
+        assert resp["summary"].loc[0, "withdrawal"] == 30000
+
+    def test_withdrawal_calc_batch_invalid_take_out_percentage(self):
+        with self.assertRaises(ValueError):
+            withdrawal_calc_batch(
+                retirement_numbers      = [1000000],
+                take_out_percentages    = [3, 101],
+                number_of_years         = 30)
+
     def assert_withdrawal_calc(self, df):
         assert df is not None
         assert df.size > 0
@@ -0,0 +1,89 @@
+import unittest
+
+from aiof.retirement.core import withdrawal_calc
+from aiof.retirement.montecarlo import *
+
+
+class RetirementMonteCarloTestCase(unittest.TestCase):
+    """
+    Retirement Monte Carlo unit tests
+    """
+
+    def test_withdrawal_monte_carlo_defaults(self):
+        self.assert_withdrawal_monte_carlo(withdrawal_monte_carlo(paths=1000, seed=1))
+
+    def test_withdrawal_monte_carlo_distributions(self):
+        for distribution in ["normal", "lognormal", "historical"]:
+            self.assert_withdrawal_monte_carlo(withdrawal_monte_carlo(
+                retirement_number   = 1500000,
+                take_out_percentage = 4,
+                number_of_years     = 30,
+                paths               = 2000,
+                distribution        = distribution,
+                seed                = 1))
+
+    def test_withdrawal_monte_carlo_seed_is_deterministic(self):
+        resp = withdrawal_monte_carlo(paths=3000, seed=42, chunk_size=1000)
+        resp_2 = withdrawal_monte_carlo(paths=3000, seed=42, chunk_size=1000)
+
+        assert resp["successRate"] == resp_2["successRate"]
+        assert resp["safeWithdrawalRate"] == resp_2["safeWithdrawalRate"]
+        assert resp["bands"].equals(resp_2["bands"])
+
+    def test_withdrawal_monte_carlo_zero_volatility(self):
+        resp = withdrawal_monte_carlo(
+            retirement_number   = 1000000,
+            take_out_percentage = 4,
+            number_of_years     = 30,
+            paths               = 100,
+            volatility          = 0,
+            distribution        = "normal")
+        df = withdrawal_calc(
+            retirement_number   = 1000000,
+            take_out_percentage = 4,
+            number_of_years     = 30)
+
+        assert resp["successRate"] == 100
+        assert resp["safeWithdrawalRate"] == 7.53
+        assert resp["bands"]["p50"].tolist() == df["endingRetirementNumber"].tolist()
+
+    def test_withdrawal_monte_carlo_chunks(self):
+        for distribution in ["normal", "lognormal", "historical"]:
+            resp = withdrawal_monte_carlo(paths=10000, seed=7, chunk_size=10000, distribution=distribution)
+
+            for chunk_size in [2500, 3333, 700]:
+                resp_chunked = withdrawal_monte_carlo(paths=10000, seed=7, chunk_size=chunk_size, distribution=distribution)
+
+                assert resp_chunked["paths"] == 10000
+                assert resp_chunked["successRate"] == resp["successRate"]
+                assert resp_chunked["safeWithdrawalRate"] == resp["safeWithdrawalRate"]
+                assert resp_chunked["bands"].equals(resp["bands"])
+
+    def test_withdrawal_monte_carlo_invalid_paths(self):
+        with self.assertRaises(ValueError):
+            withdrawal_monte_carlo(paths=0)
+
+    def test_withdrawal_monte_carlo_invalid_distribution(self):
+        with self.assertRaises(ValueError):
+            withdrawal_monte_carlo(paths=100, distribution="definitelydoesntexist")
+
+    def test_withdrawal_monte_carlo_invalid_success_target(self):
+        with self.assertRaises(ValueError):
+            withdrawal_monte_carlo(paths=100, success_target=101)
+        with self.assertRaises(ValueError):
+            withdrawal_monte_carlo(paths=100, success_target=0.5)
+
+    def test_withdrawal_monte_carlo_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            withdrawal_monte_carlo(paths=100, chunk_size=0)
+        with self.assertRaises(ValueError):
+            withdrawal_monte_carlo(paths=1000000, chunk_size=1000000)
+
+    def assert_withdrawal_monte_carlo(self, resp):
+        assert resp is not None
+        assert 0 <= resp["successRate"] <= 100
+        assert resp["safeWithdrawalRate"] > 0
+        assert len(resp["bands"]) == resp["numberOfYears"]
+
+        for i in range(0, len(resp["bands"])):
+            assert resp["bands"].loc[i, "p5"] <= resp["bands"].loc[i, "p50"] <= resp["bands"].loc[i, "p95"]
\ No newline at end of file
@@ -0,0 +1,107 @@
+import datetime
+import unittest
+import numpy as np
+import pandas as pd
+
+import aiof.helpers as helpers
+import aiof.car.core as car
+import aiof.analytics.core as analytics
+
+from aiof.schedule import Schedule
+from aiof.property.core import mortgage_calc, mortgage_schedule
+
+
+class ScheduleTestCase(unittest.TestCase):
+    """
+    Lazy schedule unit tests
+    """
+
+    _start_date = datetime.datetime(2021, 1, 15)
+
+    def _counting_schedule(self, length, chunk_rows=None):
+        computed = []
+        def table(periods):
+            computed.extend(periods.tolist())
+            return pd.DataFrame({ "period": periods, "value": periods * 10 })
+        return Schedule(table, length, chunk_rows=chunk_rows), computed
+
+    def test_schedule_slice_only_computes_the_slice(self):
+        schedule, computed = self._counting_schedule(1200)
+        df = schedule[119:180]
+
+        assert len(df) == 61
+        assert df["period"].iloc[0] == 120
+        assert computed == list(range(120, 181))
+
+    def test_schedule_index(self):
+        schedule, computed = self._counting_schedule(10)
+
+        assert schedule[0]["period"] == 1
+        assert schedule[-1]["period"] == 10
+        assert computed == [1, 10]
+        with self.assertRaises(IndexError):
+            schedule[10]
+
+    def test_schedule_find_exits_early(self):
+        schedule, computed = self._counting_schedule(1200, chunk_rows=12)
+        row = schedule.find(lambda df: df["value"] > 200)
+
+        assert row["period"] == 21
+        assert computed == list(range(1, 25))
+
+    def test_schedule_find_none(self):
+        schedule, _ = self._counting_schedule(30, chunk_rows=12)
+
+        assert schedule.find(lambda df: df["value"] < 0) is None
+
+    def test_schedule_iter(self):
+        schedule, _ = self._counting_schedule(25, chunk_rows=10)
+        rows = iter(schedule)
+
+        assert next(rows) == { "period": 1, "value": 10 }
+        assert len(list(rows)) == 24
+
+    def test_schedule_chunks(self):
+        schedule, _ = self._counting_schedule(25)
+        chunks = list(schedule.chunks(start=5, chunk_rows=10))
+
+        assert [len(c) for c in chunks] == [10, 10]
+        assert chunks[0]["period"].iloc[0] == 6
+
+    def test_schedule_invalid(self):
+        with self.assertRaises(ValueError):
+            Schedule(lambda periods: None, -1)
+        with self.assertRaises(ValueError):
+            Schedule(lambda periods: None, 10, chunk_rows=0)
+
+    def test_loan_payments_schedule(self):
+        df = helpers.loan_payments_calc_as_table(500000, 100, 5)
+        schedule = helpers.loan_payments_schedule(500000, 100, 5)
+
+        assert len(schedule) == 1200
+        assert schedule[600:612].reset_index(drop=True).equals(df.iloc[600:612].reset_index(drop=True))
+
+    def test_mortgage_schedule(self):
+        df = mortgage_calc(start_date=self._start_date)
+        schedule = mortgage_schedule(start_date=self._start_date)
+
+        assert schedule.to_df().equals(df)
+        assert schedule[119:180].equals(df.iloc[119:180])
+        assert schedule.find(lambda df: df["endingBalance"] < 100000).equals(df[df["endingBalance"] < 100000].iloc[0])
+
+    def test_car_loan_schedule(self):
+        df = car.loan_calc(50000, 4.5, 7).data
+
+        assert car.loan_schedule(50000, 4.5, 7).to_df().equals(df)
+
+    def test_asset_fv_schedule(self):
+        df = helpers.asset_fv_breakdown_as_table(15957, 500, 15, (8 / 100) / 12, 12)
+        schedule = helpers.asset_fv_schedule(15957, 500, 15, (8 / 100) / 12, 12)
+
+        assert schedule[10:].reset_index(drop=True).equals(df.iloc[10:].reset_index(drop=True))
+
+    def test_life_event_schedule(self):
+        df = analytics.life_event_df_f("cash", 18, 10000, 1000, 400)
+        schedule = analytics.life_event_schedule("cash", 18, 10000, 1000, 400)
+
+        assert np.allclose(schedule.to_df().values, df.values.astype(float))